@@ -1,5 +1,9 @@
+import multiprocessing
+
 from src.pygapsgui import main
 
 if __name__ == '__main__':
 
+    # process pools in a frozen application
+    multiprocessing.freeze_support()
     main()
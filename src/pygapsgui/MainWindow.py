@@ -5,16 +5,26 @@ from qtpy import QtCore as QC
 from qtpy import QtGui as QG
 from qtpy import QtWidgets as QW
 
-from pygapsgui.controllers.IsoController import IsoController
 from pygapsgui.MainWindowUI import MainWindowUI
-from pygapsgui.models.IsoListModel import IsoListModel
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 from pygapsgui.widgets.UtilityDialogs import open_files_dialog
 from pygapsgui.widgets.UtilityDialogs import save_file_dialog
 
 
 class MainWindow(QW.QMainWindow):
-    """Main Window for isotherm explorer and plotting."""
+    """
+    Main Window for isotherm explorer and plotting.
+
+    The window is usable once `setup_panels` is called, which is left until
+    after it is first painted (`first_painted`), as it needs pyGAPS and matplotlib.
+    """
+
+    first_painted = QC.Signal()
+
+    iso_model = None
+    iso_controller = None
+    painted = False
+
     def __init__(self, parent=None):
 
         # Initial init
@@ -24,15 +34,9 @@ class MainWindow(QW.QMainWindow):
         self.ui = MainWindowUI()
         self.ui.setup_UI(self)
 
-        # Create isotherm list mvc
-        self.iso_model = IsoListModel(parent=self)
-        self.iso_controller = IsoController(self.ui, self.iso_model)
-
-        # Create and connect menu
+        # Create and connect menu, disabled until the panels are ready
         self.connect_menu()
-
-        # Allow drops
-        self.setAcceptDrops(True)
+        self.ui.menubar.setEnabled(False)
 
         # last directory
         self.last_dir = None
@@ -42,9 +46,38 @@ class MainWindow(QW.QMainWindow):
         self.recent_file_actions = []
         self.load_recent_files()
 
+        # Display state
+        self.ui.statusbar.showMessage('Loading...')
+
+    def setup_panels(self):
+        """Create the isotherm details and graph panels, and the isotherm list mvc."""
+        from pygapsgui.controllers.IsoController import IsoController
+        from pygapsgui.models.IsoListModel import IsoListModel
+
+        self.ui.setup_panels()
+
+        # Create isotherm list mvc
+        self.iso_model = IsoListModel(parent=self)
+        self.iso_controller = IsoController(self.ui, self.iso_model)
+
+        self.ui.action_decimate.setChecked(self.ui.iso_graph.decimate)
+        self.ui.action_decimate.toggled.connect(self.plot_decimation)
+        self.ui.menubar.setEnabled(True)
+
+        # Allow drops
+        self.setAcceptDrops(True)
+
         # Display state
         self.ui.statusbar.showMessage('Ready', 5000)
 
+    def paintEvent(self, event):
+        """Paint the window, signalling once it is first on screen."""
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            # emitted after this paint is flushed to the screen
+            QC.QTimer.singleShot(0, self.first_painted.emit)
+
     ########################################################
     # Drag & Drop functionality
     ########################################################
@@ -71,6 +104,8 @@ class MainWindow(QW.QMainWindow):
         self.ui.action_open.triggered.connect(self.open_iso)
         self.ui.action_import.triggered.connect(self.import_iso)
         self.ui.action_save.triggered.connect(self.save_iso)
+        self.ui.action_open_session.triggered.connect(self.open_session)
+        self.ui.action_save_session.triggered.connect(self.save_session)
         self.ui.action_quit.triggered.connect(self.close)
         self.ui.action_examples.triggered.connect(self.examples)
         self.ui.action_about.triggered.connect(self.about)
@@ -85,6 +120,7 @@ class MainWindow(QW.QMainWindow):
         self.ui.action_psd_meso.triggered.connect(self.psd_meso)
         self.ui.action_psd_kernel.triggered.connect(self.psd_kernel)
         self.ui.action_isosteric.triggered.connect(self.isosteric)
+        self.ui.action_batch.triggered.connect(self.batch_characterise)
 
         self.ui.action_model_by.triggered.connect(self.model_by)
         self.ui.action_model_guess.triggered.connect(self.model_guess)
@@ -170,10 +206,17 @@ class MainWindow(QW.QMainWindow):
             if not filepaths:
                 return
 
-        for fp in filepaths:
-            self.last_dir = fp.parent
-            self.iso_controller.load(fp, fp.stem, fp.suffix)
-        self.iso_controller.select_last_iso()
+        filepaths = list(filepaths)
+        self.last_dir = filepaths[-1].parent
+
+        # session files restore a whole workspace
+        for filepath in filepaths:
+            if filepath.suffix == ".pgsession":
+                self.iso_controller.load_session(filepath)
+        filepaths = [filepath for filepath in filepaths if filepath.suffix != ".pgsession"]
+        if not filepaths:
+            return
+        self.iso_controller.load(filepaths)
 
         # Update in recent files
         self.update_recent_files(filepaths)
@@ -196,10 +239,9 @@ class MainWindow(QW.QMainWindow):
             if not filepaths:
                 return
 
-        for fp in filepaths:
-            self.last_dir = fp.parent
-            self.iso_controller.load_import(fp, fp.stem, ftype)
-        self.iso_controller.select_last_iso()
+        filepaths = list(filepaths)
+        self.last_dir = filepaths[-1].parent
+        self.iso_controller.load_import(filepaths, ftype)
 
     def save_iso(self, filepath=None):
         """Save isotherm to file."""
@@ -228,6 +270,48 @@ class MainWindow(QW.QMainWindow):
         self.last_dir = filepath.parent
         self.iso_controller.save(filepath, filepath.suffix)
 
+    def open_session(self, filepath=None):
+        """Open a session file, adding its isotherms and restoring the workspace."""
+        if not filepath:
+            filepaths = open_files_dialog(
+                self,
+                "Open a session",
+                str(self.last_dir) if self.last_dir else '.',
+                filter='pyGAPS-gui session (*.pgsession)'
+            )
+            if not filepaths:
+                return
+            filepath = filepaths[0]
+
+        self.last_dir = filepath.parent
+        self.iso_controller.load_session(filepath)
+
+    def save_session(self, filepath=None):
+        """Save all isotherms and the workspace to a session file."""
+        if not self.iso_model.rowCount():
+            error_dialog("No isotherms to save.")
+            return
+
+        if not filepath:
+            filepath = save_file_dialog(
+                self,
+                "Save session",
+                str(self.last_dir) if self.last_dir else '.',
+                filter='pyGAPS-gui session (*.pgsession)'
+            )
+            if not filepath:
+                return
+        if filepath.suffix != ".pgsession":
+            filepath = filepath.with_name(filepath.name + ".pgsession")
+
+        self.last_dir = filepath.parent
+        try:
+            self.iso_controller.save_session(filepath)
+        except Exception as err:  # pylint: disable=broad-except
+            error_dialog(f"Could not save session: {err}")
+            return
+        self.ui.statusbar.showMessage(f"Session saved to {filepath.name}", 2000)
+
     ########################################################
     # Characterisation / modelling / etc
     ########################################################
@@ -385,6 +469,22 @@ class MainWindow(QW.QMainWindow):
         if model.success:
             dialog.exec()
 
+    def batch_characterise(self):
+        """Start batch characterisation dialog for all checked isotherms."""
+        items = self.iso_model.get_checked_items()
+        if not items:
+            error_dialog("Select one or more isotherms")
+            return
+
+        from pygapsgui.models.BatchModel import BatchModel
+        from pygapsgui.views.BatchDialog import BatchDialog
+        dialog = BatchDialog(parent=self)
+        model = BatchModel(items, dialog)
+        ret = dialog.exec()
+        if ret == QW.QDialog.Accepted:
+            for item, results in model.result_items():
+                self.iso_controller.metadata_save_bulk(results, item=item)
+
     def model_by(self):
         """Start modellling by a specific model dialog."""
         isotherm = self.iso_controller.iso_current
@@ -476,6 +576,7 @@ class MainWindow(QW.QMainWindow):
         """Explore/modify pyGAPS adsorbates."""
         from pygapsgui.views.AdsorbateView import AdsorbateListDialog
         dialog = AdsorbateListDialog(parent=self)
+        dialog.adsorbate_changed.connect(self.iso_controller.handle_adsorbate_changed)
         dialog.exec()
 
     def material_explorer(self):
@@ -491,6 +592,12 @@ class MainWindow(QW.QMainWindow):
         from pygapsgui.utilities.color_theme import set_theme
         set_theme()
 
+    def plot_decimation(self, decimate):
+        """Set whether dense isotherms are plotted at a reduced level of detail."""
+        settings = QC.QSettings()
+        settings.setValue("plotDecimation", decimate)
+        self.ui.iso_graph.set_decimate(decimate)
+
     ########################################################
     # About / examples
     ########################################################
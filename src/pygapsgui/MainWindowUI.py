@@ -4,17 +4,19 @@ from qtpy import QtGui as QG
 from qtpy import QtWidgets as QW
 
 import pygapsgui.widgets.resources_rc
-from pygapsgui.views.IsoGraphView import IsoListGraphView
 from pygapsgui.views.IsoListView import IsoListView
-from pygapsgui.widgets.IsoPropWidget import IsoPropWidget
-from pygapsgui.widgets.IsoUnitWidget import IsoUnitWidget
-from pygapsgui.widgets.MetadataEditWidget import MetadataEditWidget
 
 
 class MainWindowUI():
-    """Main window user interface for pygaps."""
+    """
+    Main window user interface for pygaps.
+
+    Only the window shell and the isotherm explorer are created by `setup_UI`.
+    The contents of the isotherm details and graph sections need pyGAPS and
+    matplotlib, so they are created by `setup_panels` once the window is shown.
+    """
     def setup_UI(self, main_window):
-        """Create the window and all its components."""
+        """Create the window and its lightweight components."""
 
         # First setup
         main_window.setObjectName("MainWindow")
@@ -30,9 +32,9 @@ class MainWindowUI():
         # Left Group
         self.setup_iso_explorer()
         # Middle Group
-        self.setup_iso_details()
+        self.setup_iso_details_group()
         # Right Group
-        self.setup_iso_graph()
+        self.setup_iso_graph_group()
 
         # Now set central widget
         main_window.setCentralWidget(self.central_widget)
@@ -71,10 +73,31 @@ class MainWindowUI():
         self.explorer_layout = QW.QGridLayout(self.explorer_group)
         self.explorer_layout.setObjectName("explorer_layout")
 
-        # at the top, the isotherm list widget
+        # at the top, a filter for the isotherm list
+        self.iso_filter = QW.QLineEdit()
+        self.iso_filter.setObjectName("iso_filter")
+        self.iso_filter.setClearButtonEnabled(True)
+        self.explorer_layout.addWidget(self.iso_filter, 0, 0, 1, 2)
+
+        # and the isotherm list order
+        self.iso_sort_label = QW.QLabel()
+        self.iso_sort_label.setObjectName("iso_sort_label")
+        self.explorer_layout.addWidget(self.iso_sort_label, 1, 0, 1, 1)
+        self.iso_sort_layout = QW.QHBoxLayout()
+        self.iso_sort = QW.QComboBox()
+        self.iso_sort.setObjectName("iso_sort")
+        self.iso_sort_layout.addWidget(self.iso_sort, 1)
+        self.iso_sort_order = QW.QToolButton()
+        self.iso_sort_order.setObjectName("iso_sort_order")
+        self.iso_sort_order.setCheckable(True)
+        self.iso_sort_order.setArrowType(QC.Qt.UpArrow)
+        self.iso_sort_layout.addWidget(self.iso_sort_order)
+        self.explorer_layout.addLayout(self.iso_sort_layout, 1, 1, 1, 1)
+
+        # then, the isotherm list widget
         self.iso_explorer = IsoListView()
         self.iso_explorer.setObjectName("iso_explorer")
-        self.explorer_layout.addWidget(self.iso_explorer, 0, 0, 1, 2)
+        self.explorer_layout.addWidget(self.iso_explorer, 2, 0, 1, 2)
 
         # at the bottom, some handy selection buttons
         self.explorer_buttons = QW.QHBoxLayout()
@@ -90,10 +113,10 @@ class MainWindowUI():
         self.exp_remove_button = QW.QPushButton()
         self.exp_remove_button.setObjectName("exp_remove_button")
         self.explorer_buttons.addWidget(self.exp_remove_button)
-        self.explorer_layout.addLayout(self.explorer_buttons, 1, 0, 1, 2)
+        self.explorer_layout.addLayout(self.explorer_buttons, 3, 0, 1, 2)
 
-    def setup_iso_details(self):
-        """Setup all the components in the middle isotherm details section."""
+    def setup_iso_details_group(self):
+        """Setup the empty middle isotherm details section."""
 
         # create a groupbox for details of one isotherm
         self.properties_group = QW.QGroupBox()
@@ -107,6 +130,18 @@ class MainWindowUI():
         self.properties_layout = QW.QGridLayout(self.properties_group)
         self.properties_layout.setObjectName("properties_layout")
 
+    def setup_panels(self):
+        """Create the components of the isotherm details and graph sections."""
+        self.setup_iso_details()
+        self.setup_iso_graph()
+        self.translate_panels()
+
+    def setup_iso_details(self):
+        """Setup all the components in the middle isotherm details section."""
+        from pygapsgui.widgets.IsoPropWidget import IsoPropWidget
+        from pygapsgui.widgets.IsoUnitWidget import IsoUnitWidget
+        from pygapsgui.widgets.MetadataEditWidget import MetadataEditWidget
+
         # at the top, base properties
         self.prop_base_widget = IsoPropWidget()
         self.properties_layout.addWidget(self.prop_base_widget, 0, 0, 1, 1)
@@ -141,8 +176,8 @@ class MainWindowUI():
         self.details_button_layout.addWidget(self.data_button)
         self.properties_layout.addLayout(self.details_button_layout, 3, 0, 1, 3)
 
-    def setup_iso_graph(self):
-        """Setup all the components in the right isotherm graph section."""
+    def setup_iso_graph_group(self):
+        """Setup the empty right isotherm graph section."""
 
         # create a groupbox for the isotherm plot
         self.graph_group = QW.QGroupBox(self.central_widget)
@@ -156,6 +191,10 @@ class MainWindowUI():
         self.graph_layout = QW.QVBoxLayout(self.graph_group)
         self.graph_layout.setObjectName("graph_layout")
 
+    def setup_iso_graph(self):
+        """Setup all the components in the right isotherm graph section."""
+        from pygapsgui.views.IsoGraphView import IsoListGraphView
+
         # create the iso plot widget
         self.iso_graph = IsoListGraphView()
         self.iso_graph.setObjectName("iso_graph")
@@ -237,6 +276,13 @@ class MainWindowUI():
         self.action_save.setObjectName("action_save")
         self.action_save.setShortcut("Ctrl+S")
 
+        # sessions
+        self.action_open_session = QW.QAction(main_window)
+        self.action_open_session.setObjectName("action_open_session")
+        self.action_save_session = QW.QAction(main_window)
+        self.action_save_session.setObjectName("action_save_session")
+        self.action_save_session.setShortcut("Ctrl+Shift+S")
+
         # quit
         self.action_quit = QW.QAction(main_window)
         icon = QG.QIcon()
@@ -266,6 +312,8 @@ class MainWindowUI():
         self.action_psd_kernel.setObjectName("action_psd_kernel")
         self.action_isosteric = QW.QAction(main_window)
         self.action_isosteric.setObjectName("action_isosteric")
+        self.action_batch = QW.QAction(main_window)
+        self.action_batch.setObjectName("action_batch")
 
         # modelling
         self.action_model_by = QW.QAction(main_window)
@@ -292,6 +340,9 @@ class MainWindowUI():
         self.action_theme_dark.setObjectName("action_theme_dark")
         self.action_theme_auto = QW.QAction(main_window)
         self.action_theme_auto.setObjectName("action_theme_auto")
+        self.action_decimate = QW.QAction(main_window)
+        self.action_decimate.setObjectName("action_decimate")
+        self.action_decimate.setCheckable(True)
 
         # about and example
         self.action_examples = QW.QAction(main_window)
@@ -310,6 +361,11 @@ class MainWindowUI():
             self.action_save,
         ])
         self.menu_file.addSeparator()
+        self.menu_file.addActions([
+            self.action_open_session,
+            self.action_save_session,
+        ])
+        self.menu_file.addSeparator()
         self.menu_file.addAction(self.action_quit)
         #
         self.menu_charact.addActions([
@@ -331,6 +387,8 @@ class MainWindowUI():
         ])
         self.menu_charact.addSeparator()
         self.menu_charact.addActions([self.action_isosteric])
+        self.menu_charact.addSeparator()
+        self.menu_charact.addActions([self.action_batch])
         #
         self.menu_model.addActions((
             self.action_model_by,
@@ -346,6 +404,7 @@ class MainWindowUI():
             self.action_adsorbates,
             self.action_materials,
             self.menu_theme.menuAction(),
+            self.action_decimate,
         ])
         self.menu_theme.addActions([
             self.action_theme_auto,
@@ -367,13 +426,14 @@ class MainWindowUI():
         main_window.setWindowTitle(QW.QApplication.translate("MainWindow", "pyGAPS-gui", None, -1))
         #
         self.explorer_group.setTitle(QW.QApplication.translate("MainWindow", "Isotherm Explorer", None, -1))
+        self.iso_filter.setPlaceholderText(QW.QApplication.translate("MainWindow", "Filter by name, material, adsorbate, temperature or metadata", None, -1))
+        self.iso_sort_label.setText(QW.QApplication.translate("MainWindow", "Sort by", None, -1))
+        self.iso_sort_order.setToolTip(QW.QApplication.translate("MainWindow", "Descending order", None, -1))
         self.exp_select_button.setText(QW.QApplication.translate("MainWindow", "Select All", None, -1))
         self.exp_deselect_button.setText(QW.QApplication.translate("MainWindow", "Deselect All", None, -1))
         self.exp_remove_button.setText(QW.QApplication.translate("MainWindow", "Delete", None, -1))
         #
         self.properties_group.setTitle(QW.QApplication.translate("MainWindow", "Isotherm Properties", None, -1))
-        self.prop_extra_group.setTitle(QW.QApplication.translate("MainWindow", "Metadata", None, -1))
-        self.data_button.setText(QW.QApplication.translate("MainWindow", "Isotherm Points", None, -1))
         #
         self.graph_group.setTitle(QW.QApplication.translate("MainWindow", "Isotherm Display", None, -1))
         #
@@ -389,6 +449,8 @@ class MainWindowUI():
         self.action_open.setText(QW.QApplication.translate("MainWindow", "Open", None, -1))
         self.action_import.setText(QW.QApplication.translate("MainWindow", "Import", None, -1))
         self.action_save.setText(QW.QApplication.translate("MainWindow", "Save", None, -1))
+        self.action_open_session.setText(QW.QApplication.translate("MainWindow", "Open session", None, -1))
+        self.action_save_session.setText(QW.QApplication.translate("MainWindow", "Save session", None, -1))
         self.action_quit.setText(QW.QApplication.translate("MainWindow", "Quit", None, -1))
         self.action_examples.setText(QW.QApplication.translate("MainWindow", "Load example data", None, -1))
         self.action_about.setText(QW.QApplication.translate("MainWindow", "About", None, -1))
@@ -402,6 +464,7 @@ class MainWindowUI():
         self.action_psd_meso.setText(QW.QApplication.translate("MainWindow", "Mesoporous PSD", None, -1))
         self.action_psd_kernel.setText(QW.QApplication.translate("MainWindow", "Kernel Fit PSD", None, -1))
         self.action_isosteric.setText(QW.QApplication.translate("MainWindow", "Isosteric enthalpy", None, -1))
+        self.action_batch.setText(QW.QApplication.translate("MainWindow", "Batch characterization", None, -1))
         self.action_model_by.setText(QW.QApplication.translate("MainWindow", "Fit a model", None, -1))
         self.action_model_guess.setText(QW.QApplication.translate("MainWindow", "Guess best model", None, -1))
         self.menu_iast.setTitle(QW.QApplication.translate("MainWindow", "IAST", None, -1))
@@ -413,4 +476,13 @@ class MainWindowUI():
         self.action_theme_auto.setText(QW.QApplication.translate("MainWindow", "Auto", None, -1))
         self.action_theme_dark.setText(QW.QApplication.translate("MainWindow", "Dark", None, -1))
         self.action_theme_light.setText(QW.QApplication.translate("MainWindow", "Light", None, -1))
+        self.action_decimate.setText(QW.QApplication.translate("MainWindow", "Simplify dense plots", None, -1))
+        # yapf: enable
+
+    def translate_panels(self):
+        """Set UI text of the isotherm details and graph sections."""
+        # yapf: disable
+        # pylint: disable=line-too-long
+        self.prop_extra_group.setTitle(QW.QApplication.translate("MainWindow", "Metadata", None, -1))
+        self.data_button.setText(QW.QApplication.translate("MainWindow", "Isotherm Points", None, -1))
         # yapf: enable
@@ -1,15 +1,8 @@
 import pathlib
 import sys
 
-import qtpy
-from qtpy import QtCore as QC
-from qtpy import QtGui as QG
-from qtpy import QtWidgets as QW
-
-# Scaling for high dpi screens DEPRECATED in QT6
-if qtpy.API in (qtpy.PYQT5_API + qtpy.PYSIDE2_API):
-    QW.QApplication.setAttribute(QC.Qt.AA_EnableHighDpiScaling, True)
-    QW.QApplication.setAttribute(QC.Qt.AA_UseHighDpiPixmaps, True)
+# NOTE: Qt is only imported when starting the GUI, so that the package
+# (and the headless `analyse` command) can be used without it.
 
 
 def exception_hook(exctype, exc, trace):
@@ -29,7 +22,10 @@ def exception_hook(exctype, exc, trace):
 def process_cl_args():
     """Process known arguments."""
     import argparse
-    parser = argparse.ArgumentParser(description='Directly open isotherms.')
+    parser = argparse.ArgumentParser(
+        description="Directly open isotherms. "
+        "Run 'pygapsgui analyse --help' for headless analysis."
+    )
     parser.add_argument(
         '--file',
         '-f',
@@ -45,7 +41,7 @@ def process_cl_args():
     parser.add_argument(
         '--test',
         action="store_true",
-        help="Attempt startup then exit.",
+        help="Attempt startup, print the startup timing profile, then exit.",
     )
     parser.add_argument(
         '--version',
@@ -60,6 +56,15 @@ def process_cl_args():
 def main():
     """Main app entrypoint."""
 
+    # Worker processes are spawned, which needs support in frozen builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    # Headless analysis, without Qt
+    if sys.argv[1:2] == ["analyse"]:
+        from pygapsgui.cli import analyse
+        sys.exit(analyse(sys.argv[2:]))
+
     # Set custom exception hook
     sys._excepthook = sys.excepthook
     sys.excepthook = exception_hook
@@ -78,53 +83,99 @@ def main():
         print(version)
         sys.exit()
 
+    from pygapsgui.utilities.startup_profile import startup_profile
+
+    with startup_profile.phase("import Qt"):
+        import qtpy
+        from qtpy import QtCore as QC
+        from qtpy import QtGui as QG
+        from qtpy import QtWidgets as QW
+
+    # Scaling for high dpi screens DEPRECATED in QT6
+    if qtpy.API in (qtpy.PYQT5_API + qtpy.PYSIDE2_API):
+        QW.QApplication.setAttribute(QC.Qt.AA_EnableHighDpiScaling, True)
+        QW.QApplication.setAttribute(QC.Qt.AA_UseHighDpiPixmaps, True)
+
     # Create application
-    app = QW.QApplication(qt_args)
-    app.setOrganizationName("pyGAPS")
-    app.setApplicationName("pyGAPS-gui")
+    with startup_profile.phase("create application"):
+        app = QW.QApplication(qt_args)
+        app.setOrganizationName("pyGAPS")
+        app.setApplicationName("pyGAPS-gui")
 
     # Splashscreen
-    from pygapsgui.SplashScreen import SplashScreen
-    splash = SplashScreen()
-    splash.show()
-    app.processEvents()
+    with startup_profile.phase("splash screen"):
+        from pygapsgui.SplashScreen import SplashScreen
+        splash = SplashScreen()
+        splash.show()
+        app.processEvents()
 
     # Resources
     splash.showMessage("Loading resources...", 40)
-    from pygapsgui.utilities.color_theme import set_theme
-    set_theme()
-    from pygapsgui.utilities.resources import get_resource
-    icon = QG.QIcon()
-    icon.addFile(get_resource('main_icon.png'), QC.QSize(48, 48))
-    icon.addFile(get_resource('main_icon.png'), QC.QSize(100, 100))
-    app.setWindowIcon(icon)
-
-    # Init pygaps
-    splash.showMessage("Initiating backend...", 60)
-    from pygapsgui.__init_pygaps__ import init_pygaps
-    init_pygaps()
-
-    # Create main window
+    with startup_profile.phase("resources and theme"):
+        from pygapsgui.utilities.color_theme import set_theme
+        set_theme()
+        from pygapsgui.utilities.resources import get_resource
+        icon = QG.QIcon()
+        icon.addFile(get_resource('main_icon.png'), QC.QSize(48, 48))
+        icon.addFile(get_resource('main_icon.png'), QC.QSize(100, 100))
+        app.setWindowIcon(icon)
+
+    # Create main window, pyGAPS and the panels using it are loaded once shown
     splash.showMessage("Starting...", 80)
-    from .MainWindow import MainWindow
-    mainwnd = MainWindow(None)
+    with startup_profile.phase("import main window"):
+        from .MainWindow import MainWindow
+    with startup_profile.phase("create main window"):
+        mainwnd = MainWindow(None)
 
-    # Load files from cli if needed
+    # Files from cli
+    filepaths = None
     if parsed_args.file:
-        filepaths = map(pathlib.Path, parsed_args.file)
-        mainwnd.open_iso(filepaths)
-
+        filepaths = list(map(pathlib.Path, parsed_args.file))
     elif parsed_args.folder:
         folder = pathlib.Path(parsed_args.folder)
         filepaths = [x for x in folder.iterdir() if not x.is_dir()]
-        mainwnd.open_iso(filepaths)
+
+    from pygapsgui.utilities.worker import Worker
+
+    def panels_ready():
+        """Create the panels once pyGAPS is imported, and start everything else."""
+        with startup_profile.phase("create panels"):
+            mainwnd.setup_panels()
+        # Load files from cli if needed
+        if filepaths:
+            mainwnd.open_iso(filepaths)
+        # Import calculation modules in the background
+        from pygapsgui.utilities.startup_profile import preload_modules
+        QC.QThreadPool.globalInstance().start(Worker(preload_modules))
+
+        if parsed_args.test:
+            QC.QThreadPool.globalInstance().waitForDone()
+            startup_profile.mark("background work done")
+            print(startup_profile.report())
+            app.quit()
+
+    def pygaps_failed(error, trace):
+        """Report pyGAPS failing to load."""
+        from pygapsgui.widgets.UtilityDialogs import error_detail_dialog
+        error_detail_dialog(f"Could not load pyGAPS: {error}", trace)
+        app.quit()
+
+    # Init pygaps in the background, the panels are then created in the GUI thread
+    from pygapsgui.__init_pygaps__ import init_pygaps
+    pygaps_loader = Worker(init_pygaps)
+    pygaps_loader.signals.result.connect(lambda _: panels_ready())
+    pygaps_loader.signals.error.connect(pygaps_failed)
+
+    def after_first_paint():
+        """Start everything not needed to show the window."""
+        startup_profile.mark("first paint")
+        QC.QThreadPool.globalInstance().start(pygaps_loader)
+
+    mainwnd.first_painted.connect(after_first_paint)
 
     # Show and finish
     mainwnd.show()
     splash.finish(mainwnd)
 
-    if parsed_args.test:
-        sys.exit()
-
     # Execute
     sys.exit(app.exec_())
@@ -10,8 +10,17 @@ def init_matplotlib():
         'lines.markersize': 6,
         'legend.fontsize': 7,
     })
+    # Theme set before matplotlib was loaded
+    from pygapsgui.utilities.color_theme import mpl_theme_apply
+    mpl_theme_apply()
 
 
 def init_pygaps():
-    import pygaps
-    init_matplotlib()
+    from pygapsgui.utilities.startup_profile import startup_profile
+    with startup_profile.phase("import pyGAPS"):
+        import pygaps
+    with startup_profile.phase("pyGAPS graph styles"):
+        init_matplotlib()
+    # Memoise adsorbate thermodynamic properties
+    from pygapsgui.utilities.thermo_cache import thermo_cache
+    thermo_cache.install()
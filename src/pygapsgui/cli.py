@@ -0,0 +1,206 @@
+"""
+Headless command line analysis, which does not import Qt.
+
+Example::
+
+    pygapsgui analyse isotherms/*.aif -m bet-area psd-mesoporous -o results.csv
+
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _slug(name: str) -> str:
+    """Command line name of a method."""
+    return name.lower().replace(" ", "-")
+
+
+def _method_names() -> dict:
+    """Map command line names to method names."""
+    from pygapsgui.utilities.batch import METHODS
+    from pygapsgui.utilities.batch import MULTI_METHODS
+    return {_slug(name): name for name in list(METHODS) + list(MULTI_METHODS)}
+
+
+def analyse_parser() -> argparse.ArgumentParser:
+    """Arguments of the `analyse` command."""
+    parser = argparse.ArgumentParser(
+        prog="pygapsgui analyse",
+        description="Characterise isotherms without starting the GUI. "
+        "Calculations use the same defaults as the GUI dialogs, with automatic limits.",
+    )
+    parser.add_argument(
+        'paths',
+        nargs='+',
+        help="Isotherm files, or folders of isotherm files.",
+    )
+    parser.add_argument(
+        '--method',
+        '-m',
+        nargs='+',
+        required=True,
+        help=f"Methods to run, out of: {', '.join(_method_names())}.",
+    )
+    parser.add_argument(
+        '--set',
+        '-s',
+        nargs='+',
+        default=[],
+        metavar="NAME=VALUE",
+        help="Method settings, e.g. 'branch=des psd_model=BJH'.",
+    )
+    parser.add_argument(
+        '--output',
+        '-o',
+        action='store',
+        help="Output file, .csv or .json. Prints CSV if not given.",
+    )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=None,
+        help="Number of processes, by default the number of CPUs.",
+    )
+    return parser
+
+
+def analyse_file(path, methods, settings):
+    """
+    Parse one isotherm file and run each single-isotherm method on it.
+
+    The isotherm itself is only sent back, in stored form, if a
+    multi-isotherm method needs it, otherwise None is returned instead.
+    """
+    from pygapsgui.utilities.batch import METHODS
+    from pygapsgui.utilities.batch import MULTI_METHODS
+    from pygapsgui.utilities.batch import run_method
+    from pygapsgui.utilities.iso_cache import isotherm_to_stored
+    from pygapsgui.utilities.parsing import parse_isotherm
+
+    isotherm = parse_isotherm(path)
+    results, errors = {}, {}
+    for method in methods:
+        if method not in METHODS:
+            continue
+        try:
+            results.update(run_method(method, isotherm, _method_settings(method, settings)))
+        except Exception as err:  # pylint: disable=broad-except
+            errors[method] = str(err)
+    stored = None
+    if any(method in MULTI_METHODS for method in methods):
+        stored = isotherm_to_stored(isotherm)
+    return stored, results, errors
+
+
+def _method_settings(method, settings) -> dict:
+    """Settings applicable to a method."""
+    from pygapsgui.utilities.batch import METHODS
+    from pygapsgui.utilities.batch import MULTI_METHODS
+    _, choices = {**METHODS, **MULTI_METHODS}[method]
+    return {name: value for name, value in settings.items() if name in choices}
+
+
+def _expand_paths(paths) -> list:
+    """Replace folders by the files they contain."""
+    expanded = []
+    for path in map(pathlib.Path, paths):
+        if path.is_dir():
+            expanded.extend(sorted(p for p in path.iterdir() if not p.is_dir()))
+        else:
+            expanded.append(path)
+    return expanded
+
+
+def analyse(argv=None) -> int:
+    """Entrypoint of the `analyse` command, returns an exit code."""
+    parser = analyse_parser()
+    args = parser.parse_args(argv)
+
+    names = _method_names()
+    unknown = [method for method in args.method if method not in names]
+    if unknown:
+        parser.error(f"unknown method(s): {', '.join(unknown)}")
+    methods = [names[method] for method in args.method]
+
+    settings = {}
+    for setting in args.set:
+        name, sep, value = setting.partition("=")
+        if not sep:
+            parser.error(f"settings must be NAME=VALUE, got '{setting}'")
+        settings[name] = value
+
+    paths = _expand_paths(args.paths)
+
+    from pygapsgui.utilities.batch import MULTI_METHODS
+    from pygapsgui.utilities.batch import flatten_results
+    from pygapsgui.utilities.iso_cache import isotherm_from_stored
+
+    rows, isotherms, status = [], [], 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(analyse_file, path, methods, settings) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                stored, results, errors = future.result()
+            except Exception as err:  # pylint: disable=broad-except
+                print(f"{path.name}: could not be read: {err}", file=sys.stderr)
+                status = 1
+                continue
+            for method, error in errors.items():
+                print(f"{path.name}: {method} failed: {error}", file=sys.stderr)
+                status = 1
+            rows.append({"Isotherm": path.stem, "File": str(path), **results})
+            if stored is not None:
+                isotherms.append(stored)
+
+    multi = {}
+    for method in methods:
+        if method not in MULTI_METHODS:
+            continue
+        function, _ = MULTI_METHODS[method]
+        try:
+            multi[method] = flatten_results(
+                function([isotherm_from_stored(iso) for iso in isotherms],
+                         **_method_settings(method, settings))
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            print(f"{method} failed: {err}", file=sys.stderr)
+            status = 1
+
+    write_results(rows, multi, args.output)
+    return status
+
+
+def write_results(rows: list, multi: dict, output=None):
+    """
+    Write results as CSV or JSON.
+
+    For CSV, per-isotherm results are a table with one row per isotherm,
+    and each multi-isotherm method is written to a separate file, named
+    after the output with the method as suffix.
+    """
+    import pandas
+
+    if output and pathlib.Path(output).suffix == ".json":
+        with open(output, 'w', encoding='utf-8') as file:
+            json.dump({"isotherms": rows, **multi}, file, indent=2)
+        return
+
+    table = pandas.DataFrame(rows)
+    if output:
+        table.to_csv(output, index=None)
+    else:
+        table.to_csv(sys.stdout, index=None)
+
+    for method, results in multi.items():
+        table = pandas.DataFrame(results)
+        if output:
+            output = pathlib.Path(output)
+            table.to_csv(output.with_name(f"{output.stem}_{_slug(method)}.csv"), index=None)
+        else:
+            print(f"\n{method}")
+            table.to_csv(sys.stdout, index=None)
@@ -0,0 +1,63 @@
+from qtpy import QtCore as QC
+
+from pygapsgui.utilities.batch import isotherm_to_batch
+from pygapsgui.utilities.batch import run_method
+from pygapsgui.utilities.worker import ProcessRunner
+
+
+class BatchRunner(QC.QObject):
+    """
+    Run a characterisation method over many isotherms in separate processes.
+
+    Calculations are CPU-bound, so separate processes are used rather than
+    threads, through a `ProcessRunner` so that they are terminated when
+    cancelled or taking longer than `timeout` seconds. Isotherms are sent
+    in their picklable form, and results come back as flat dictionaries,
+    streamed as each one finishes.
+    """
+
+    result = QC.Signal(int, object)  # index, result dict
+    failed = QC.Signal(int, str)  # index, error
+    progress = QC.Signal(int, int)  # done, total
+    finished = QC.Signal()
+
+    def __init__(self, timeout=None, parent=None):
+        super().__init__(parent=parent)
+        self.runner = ProcessRunner(timeout=timeout, parent=self)
+        self.runner.result.connect(self.result.emit)
+        self.runner.failed.connect(self.failed.emit)
+        self.runner.progress.connect(self.handle_progress)
+        self.runner.finished.connect(self.finished.emit)
+        self.skipped = 0
+
+    def run(self, method, isotherms, settings=None, max_workers=None):
+        """Start running `method` with `settings` on each isotherm."""
+        self.cancel()
+        tasks = {}
+        skipped = {}
+        for index, isotherm in enumerate(isotherms):
+            try:
+                stored = isotherm_to_batch(isotherm)
+            except Exception as err:  # pylint: disable=broad-except
+                skipped[index] = str(err)
+                continue
+            tasks[index] = (run_method, (method, stored, settings))
+
+        # isotherms which cannot be sent are reported as failed straight away
+        self.skipped = len(skipped)
+        for index, error in skipped.items():
+            self.failed.emit(index, error)
+        if skipped:
+            self.progress.emit(len(skipped), len(isotherms))
+
+        if max_workers:
+            self.runner.max_workers = max_workers
+        self.runner.run(tasks)
+
+    def handle_progress(self, done, total):
+        """Report progress, counting the isotherms which could not be sent."""
+        self.progress.emit(done + self.skipped, total + self.skipped)
+
+    def cancel(self):
+        """Terminate all running calculations and drop pending ones."""
+        self.runner.cancel()
@@ -1,3 +1,5 @@
+from functools import partial
+
 from qtpy import QtCore as QC
 from qtpy import QtWidgets as QW
 
@@ -6,8 +8,18 @@ from pygaps.units.converter_mode import _LOADING_MODE
 from pygaps.units.converter_mode import _MATERIAL_MODE
 from pygaps.units.converter_mode import _PRESSURE_MODE
 from pygaps.units.converter_unit import _TEMPERATURE_UNITS
-from pygaps.utilities import exceptions as pge
+from pygapsgui.controllers.IsoLoader import IsoLoader
+from pygapsgui.controllers.IsoLoader import parse_isotherm
+from pygapsgui.models.CatalogueModel import adsorbate_model
+from pygapsgui.models.CatalogueModel import material_model
+from pygapsgui.models.IsoListProxyModel import IsoListProxyModel
 from pygapsgui.models.IsoModel import IsoModel
+from pygapsgui.models.IsoModel import SORT_KEYS
+from pygapsgui.models.IsoModel import LazyIsoModel
+from pygapsgui.utilities.calc_cache import calc_cache
+from pygapsgui.utilities.iso_cache import iso_cache
+from pygapsgui.utilities.thermo_cache import thermo_cache
+from pygapsgui.utilities.worker import Worker
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -16,7 +28,8 @@ class IsoController():
     Interface between Isotherms loaded in memory and main window Isotherm views.
 
     The Isotherm List Model is the collection of isotherms that have been loaded
-    in memory, which are stored in a custom QT QStandardItemModel.
+    in memory, which are stored in a custom QT QStandardItemModel. The list
+    of isotherms is displayed sorted and filtered through a proxy model.
 
     The main window has various views into this collection, such as:
 
@@ -38,15 +51,25 @@ class IsoController():
 
         # Store ref to model and define other models
         self.iso_list_model = iso_list_model
-        self.metadata_table_model = None
+        self.iso_proxy_model = IsoListProxyModel(iso_list_model, parent=main_window.central_widget)
+
+        # Background loaders currently running
+        self.loaders = []
+        # Adsorbates/temperatures loaded, whose properties are not yet calculated
+        self.thermo_targets = []
 
         # Connect model/view
-        self.list_view.setModel(self.iso_list_model)
+        self.list_view.setModel(self.iso_proxy_model)
         self.graph_view.setModel(self.iso_list_model)
 
+        # populate sorting options
+        self.mw_widget.iso_sort.addItem("loading order", None)
+        for key in SORT_KEYS:
+            self.mw_widget.iso_sort.addItem(key, key)
+
         # populate adsorbates and materials
-        self.mw_widget.material_input.insertItems(0, [mat.name for mat in pygaps.MATERIAL_LIST])
-        self.mw_widget.adsorbate_input.insertItems(0, [ads.name for ads in pygaps.ADSORBATE_LIST])
+        material_model().attach(self.mw_widget.material_input)
+        adsorbate_model().attach(self.mw_widget.adsorbate_input)
 
         # populate units view
         self.unit_widget.init_boxes(
@@ -65,10 +88,12 @@ class IsoController():
         # Connect signals for iso explorer
         selection_model = self.list_view.selectionModel()
         selection_model.currentChanged.connect(self.selection_changed)
-        selection_model.currentChanged.connect(self.iso_list_model.handle_item_select)
-        self.mw_widget.exp_select_button.clicked.connect(self.iso_list_model.check_all)
-        self.mw_widget.exp_deselect_button.clicked.connect(self.iso_list_model.uncheck_all)
+        self.mw_widget.exp_select_button.clicked.connect(self.check_all)
+        self.mw_widget.exp_deselect_button.clicked.connect(self.uncheck_all)
         self.mw_widget.exp_remove_button.clicked.connect(self.delete_current_iso)
+        self.mw_widget.iso_filter.textChanged.connect(self.iso_proxy_model.set_filter_text)
+        self.mw_widget.iso_sort.currentIndexChanged.connect(self.sort_isotherms)
+        self.mw_widget.iso_sort_order.toggled.connect(self.sort_isotherms)
 
         # Connect signals for iso details
         self.mw_widget.material_input.lineEdit().editingFinished.connect(self.modify_iso_baseprops)
@@ -91,14 +116,48 @@ class IsoController():
 
     def selection_changed(self, current, previous):
         """Do when selected isotherm has changed."""
-        if not current.isValid():
-            self.iso_current = None
+        current = self.iso_proxy_model.mapToSource(current)
+        previous = self.iso_proxy_model.mapToSource(previous)
+        # update the selected item first, so that it is correct even if display fails
+        self.iso_list_model.handle_item_select(current, previous)
+        self.iso_current = None
+        if current.isValid():
+            # isotherms which cannot be loaded are None
+            self.iso_current = self.iso_list_model.itemFromIndex(current).data()
+        if self.iso_current is None:
             self.clear_iso_display()
-            return
+        else:
+            # Otherwise save and display the isotherm
+            self.iso_display_properties()
+
+    def current_item(self):
+        """Return the isotherm item selected in the explorer, if any."""
+        return self.iso_proxy_model.item(self.list_view.currentIndex())
+
+    def sort_isotherms(self):
+        """Sort the isotherm explorer by the chosen key and order."""
+        descending = self.mw_widget.iso_sort_order.isChecked()
+        self.mw_widget.iso_sort_order.setArrowType(
+            QC.Qt.DownArrow if descending else QC.Qt.UpArrow
+        )
+        self.iso_proxy_model.set_sort_key(
+            self.mw_widget.iso_sort.currentData(),
+            QC.Qt.DescendingOrder if descending else QC.Qt.AscendingOrder,
+        )
 
-        # Otherwise save and display the isotherm
-        self.iso_current = self.iso_list_model.itemFromIndex(current).data()
-        self.iso_display_properties()
+    def check_all(self):
+        """Tick all isotherms shown in the explorer."""
+        if self.iso_proxy_model.filter_text:
+            self.iso_list_model.check_all(self.iso_proxy_model.visible_items())
+        else:
+            self.iso_list_model.check_all()
+
+    def uncheck_all(self):
+        """Un-tick all isotherms shown in the explorer."""
+        if self.iso_proxy_model.filter_text:
+            self.iso_list_model.uncheck_all(self.iso_proxy_model.visible_items())
+        else:
+            self.iso_list_model.uncheck_all()
 
     def iso_display_properties(self):
         """Populate widgets with the selected isotherm data."""
@@ -125,7 +184,7 @@ class IsoController():
     def iso_display_update(self):
         """Update all the isotherm display."""
         self.iso_display_properties()
-        self.graph_view.update()
+        self.graph_view.redraw()
 
     def clear_iso_display(self):
         """Reset all the display."""
@@ -139,7 +198,6 @@ class IsoController():
 
         # Other metadata
         self.mw_widget.prop_extra_edit_widget.clear()
-        self.metadata_table_model.deleteLater()
 
         # Graph
         self.graph_view.update()
@@ -148,6 +206,7 @@ class IsoController():
         """Convert current isotherm pressure."""
         if not self.iso_current:
             return
+        self.mark_modified()
         try:
             self.iso_current.convert_pressure(mode_to=mode_to, unit_to=unit_to)
         except Exception as err:
@@ -163,6 +222,7 @@ class IsoController():
         """Convert current isotherm loading."""
         if not self.iso_current:
             return
+        self.mark_modified()
         try:
             self.iso_current.convert_loading(basis_to=basis_to, unit_to=unit_to)
         except Exception as err:
@@ -188,6 +248,7 @@ class IsoController():
         """Convert current isotherm material basis/unit."""
         if not self.iso_current:
             return
+        self.mark_modified()
         try:
             self.iso_current.convert_material(basis_to=basis_to, unit_to=unit_to)
         except Exception as err:
@@ -204,6 +265,7 @@ class IsoController():
         """Convert current isotherm temperature."""
         if not self.iso_current:
             return
+        self.mark_modified()
         self.iso_current.convert_temperature(unit_to=unit_to)
         self.iso_display_update()  # not efficient but guarantees a full refresh
 
@@ -235,10 +297,11 @@ class IsoController():
             modified = True
 
         if modified:
+            self.mark_modified()
             # We need to recalculate units
             self.unit_widget.init_units(self.iso_current)
             # And refresh graph
-            self.graph_view.update()
+            self.graph_view.redraw()
 
     def material_detail(self):
         """Bring up widget with current isotherm material details."""
@@ -254,13 +317,13 @@ class IsoController():
 
     def handle_material_changed(self, material):
         """Ensure refreshes when material changes."""
+        calc_cache.clear()  # material properties are not part of the isotherm hash
         self.iso_display_update()
         self.refresh_material_edit(material)
 
     def refresh_material_edit(self, material=None):
-        """Reload material list from database."""
-        self.mw_widget.material_input.clear()
-        self.mw_widget.material_input.insertItems(0, [mat.name for mat in pygaps.MATERIAL_LIST])
+        """Update material list from database."""
+        material_model().sync()
         if material:
             self.mw_widget.material_input.setCurrentText(material)
 
@@ -278,14 +341,28 @@ class IsoController():
 
     def handle_adsorbate_changed(self, adsorbate):
         """Ensure refreshes when adsorbate changes."""
+        calc_cache.clear()  # adsorbate properties are not part of the isotherm hash
+        thermo_cache.clear()
         self.iso_display_update()
 
     def handle_metadata_changed(self):
         """Save a metadata point."""
+        self.mark_modified()
         self.mw_widget.statusbar.showMessage("Metadata changed successfully.", 2000)
 
-    def metadata_save_bulk(self, results: dict):
-        """Save multiple metadatas from a dictionary."""
+    def metadata_save_bulk(self, results: dict, item=None):
+        """Save multiple metadatas from a dictionary, to the current or another isotherm item."""
+        if item is not None and item is not self.current_item():
+            if isinstance(item, LazyIsoModel):
+                item.pinned = True
+            isotherm = item.data()
+            if isotherm is None:
+                return
+            self.iso_list_model.mark_changed(item)
+            calc_cache.invalidate(isotherm)
+            isotherm.properties.update(results)
+            return
+        self.mark_modified()
         self.mw_widget.prop_extra_edit_widget.metadata_save_bulk(results)
         self.mw_widget.statusbar.showMessage("Saved results as metadata.")
 
@@ -301,59 +378,85 @@ class IsoController():
             from pygapsgui.views.IsoEditModelDialog import IsoEditModelDialog
             dialog = IsoEditModelDialog(self.iso_current, parent=self.mw_widget.central_widget)
 
-        dialog.exec()
-        self.iso_display_update()
+        # only an edited isotherm no longer matches its file
+        if dialog.exec() == QW.QDialog.Accepted:
+            self.mark_modified()
+            self.iso_display_update()
 
     ########################################################
     # Add and remove functionality
     ########################################################
 
-    def load(self, path, name, ext):
-        """Use pygaps parsing to load an isotherm and add it to the model."""
-
-        isotherm = None
+    def load(self, paths, parser=parse_isotherm, cache_key=""):
+        """
+        Parse isotherms in a background thread pool and add them to the model.
+
+        Isotherms are added as soon as they are parsed, while a progress
+        dialog allows the user to cancel any files not yet loaded.
+        Files which have not changed since they were last parsed are read
+        from the isotherm cache instead, `cache_key` distinguishing between
+        different parsing options for the same file.
+
+        Only a header of each isotherm is kept in the list: the full
+        isotherm is read back from the cache when it is first used.
+        """
+        paths = list(paths)
+        if not paths:
+            return
 
-        import pygaps.parsing as pgp
-        if ext == '.csv':
-            isotherm = pgp.isotherm_from_csv(path)
-        elif ext == '.json':
-            isotherm = pgp.isotherm_from_json(path)
-        elif ext == '.xls':
-            isotherm = pgp.isotherm_from_xl(path)
-        elif ext == '.aif':
-            isotherm = pgp.isotherm_from_aif(path)
-        else:
-            raise Exception(f"Unknown isotherm type '{ext}'.")
+        loader = IsoLoader()
+        failures = []
 
-        if not isotherm:
-            return
+        progress = QW.QProgressDialog(
+            "Loading isotherms...",
+            "Cancel",
+            0,
+            len(paths),
+            self.mw_widget.central_widget,
+        )
+        progress.setWindowModality(QC.Qt.NonModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(loader.cancel)
 
-        self.add_isotherm(name, isotherm)
+        iso_loader = partial(iso_cache.load, parser=parser, extra=cache_key)
+        loader.loaded.connect(partial(self.add_lazy_isotherm, loader=iso_loader))
+        loader.failed.connect(lambda name, error: failures.append(f"{name}: {error}"))
+        loader.progress.connect(lambda done, total: progress.setValue(done))
+        loader.finished.connect(partial(self.handle_load_finished, loader, progress, failures))
 
-    def load_import(self, path, name, settings):
-        """Use pygaps parsing to import an isotherm and add it to the model."""
-        isotherm = None
+        self.loaders.append(loader)
+        loader.load(paths, partial(iso_cache.load_header, parser=parser, extra=cache_key))
 
+    def load_import(self, paths, settings):
+        """Use pygaps parsing to import isotherms in the background and add them to the model."""
         import pygaps.parsing as pgp
-        try:
-            isotherm = pgp.isotherm_from_commercial(path=path, **settings)
-        except pge.ParsingError as exc:
-            error_dialog(str(exc))
-        except BaseException as exc:
-            error_dialog(str(exc))
-
-        if not isotherm:
-            return
+        self.load(
+            paths,
+            parser=partial(pgp.isotherm_from_commercial, **settings),
+            cache_key=repr(sorted(settings.items())),
+        )
 
-        self.add_isotherm(name, isotherm)
+    def handle_load_finished(self, loader, progress, failures):
+        """Clean up after a background load and report any errors."""
+        progress.reset()
+        progress.deleteLater()
+        self.loaders.remove(loader)
+        loader.deleteLater()
+        if loader.n_loaded:
+            self.select_last_iso()
+        self.warm_thermo_cache()
+        if failures:
+            error_dialog("Could not load some isotherms:<br>" + "<br>".join(failures))
 
     def add_isotherm(self, name, isotherm):
         """Wrap an isotherm in an IsoModel and add to the IsothermListModel."""
 
-        # Add adsorbates to the list
-        if isotherm.material not in pygaps.MATERIAL_LIST:
+        # Add materials to the list
+        materials = material_model()
+        if not materials.contains(isotherm.material.name):
             pygaps.MATERIAL_LIST.append(isotherm.material)
-            self.refresh_material_edit(isotherm.material.name)
+            materials.add(isotherm.material.name)
+            self.mw_widget.material_input.setCurrentText(isotherm.material.name)
 
         # Create the model to store the isotherm
         iso_model = IsoModel(name)
@@ -362,6 +465,54 @@ class IsoController():
         # Add to the list model
         self.iso_list_model.appendRow(iso_model)
 
+    def add_lazy_isotherm(self, path, header, loader):
+        """Wrap an isotherm header in a LazyIsoModel and add to the IsothermListModel."""
+
+        # Add materials to the list
+        if self.register_material(header["material"]):
+            self.mw_widget.material_input.setCurrentText(header["material"])
+
+        self.thermo_targets.append(
+            (header["adsorbate"], header["temperature"], header["temperature_unit"])
+        )
+
+        # Create the model which will load the isotherm when needed
+        iso_model = LazyIsoModel(path.stem, path, header, loader)
+        # Add to the list model
+        self.iso_list_model.appendRow(iso_model)
+
+    def register_material(self, name) -> bool:
+        """Add a material to the pyGAPS list if it is not there, returning whether it was added."""
+        materials = material_model()
+        if materials.contains(name):
+            return False
+        pygaps.MATERIAL_LIST.append(pygaps.Material(name))
+        materials.add(name)
+        return True
+
+    def warm_thermo_cache(self):
+        """Calculate adsorbate properties for the isotherms just loaded, in the background."""
+        if not self.thermo_targets:
+            return
+        worker = Worker(thermo_cache.warm, self.thermo_targets)
+        self.thermo_targets = []
+        QC.QThreadPool.globalInstance().start(worker)
+
+    def mark_modified(self):
+        """
+        Record that the current isotherm is (about to be) modified.
+
+        It is kept in memory, as it no longer matches its file,
+        and any memoised calculations on it are invalidated.
+        """
+        item = self.current_item()
+        if isinstance(item, LazyIsoModel):
+            item.pinned = True
+        if item:
+            self.iso_list_model.mark_changed(item)
+        if self.iso_current:
+            calc_cache.invalidate(self.iso_current)
+
     def save(self, path, ext):
         """Save isotherm to disk."""
         isotherm = self.iso_current
@@ -378,15 +529,116 @@ class IsoController():
         else:
             raise Exception("Unknown file save format.")
 
+    ########################################################
+    # Sessions
+    ########################################################
+
+    def save_session(self, path):
+        """Save all isotherms and the workspace state to a session file."""
+        from pygapsgui.utilities.iso_cache import isotherm_header
+        from pygapsgui.utilities.session import SessionChunk
+        from pygapsgui.utilities.session import encode_isotherm
+        from pygapsgui.utilities.session import write_session
+
+        selected = self.iso_list_model.item_selected
+        items = []
+        entries = []
+        for row in range(self.iso_list_model.rowCount()):
+            item = self.iso_list_model.item(row)
+            if isinstance(item, LazyIsoModel) and not item.pinned:
+                header = item.header
+                if isinstance(item.loader, SessionChunk) and not item.broken:
+                    # copied from the session it was opened from, without decoding
+                    chunk = item.loader.read(item.path)
+                else:
+                    isotherm = item.data()
+                    if isotherm is None:  # could not be loaded, already reported
+                        continue
+                    chunk = encode_isotherm(isotherm)
+            else:
+                isotherm = item.data()
+                header = isotherm_header(isotherm)
+                chunk = encode_isotherm(isotherm)
+            items.append(item)
+            # the selected item is always checked, store the user choice
+            check_state = item.userCheckState if item is selected else item.checkState()
+            entries.append({
+                "name": item.text(),
+                "header": header,
+                "checked": check_state == QC.Qt.Checked,
+                "chunk": chunk,
+            })
+
+        state = {
+            "graph": self.graph_view.graph_settings(),
+            "sort": self.mw_widget.iso_sort.currentData(),
+            "descending": self.mw_widget.iso_sort_order.isChecked(),
+            "filter": self.mw_widget.iso_filter.text(),
+            "selected": next((row for row, item in enumerate(items) if item is selected), None),
+        }
+        chunks = write_session(path, state, entries)
+
+        # isotherms from a session are now read from the new file
+        for item, chunk in zip(items, chunks):
+            if isinstance(item, LazyIsoModel) and isinstance(item.loader, SessionChunk):
+                item.relink(path, chunk)
+
+    def load_session(self, path):
+        """Add the isotherms of a session file to the explorer and restore its workspace state."""
+        from pygapsgui.utilities.session import read_session
+        try:
+            state, entries = read_session(path)
+        except Exception as err:  # pylint: disable=broad-except
+            error_dialog(f"Could not open session {path.name}: {err}")
+            return
+
+        # isotherms are only read from the session when needed
+        items = []
+        for entry in entries:
+            header = entry["header"]
+            self.register_material(header["material"])
+            self.thermo_targets.append(
+                (header["adsorbate"], header["temperature"], header["temperature_unit"])
+            )
+            items.append(LazyIsoModel(entry["name"], path, header, entry["chunk"]))
+        self.iso_list_model.invisibleRootItem().appendRows(items)
+
+        # explorer order and filter
+        sort_index = self.mw_widget.iso_sort.findData(state.get("sort"))
+        self.mw_widget.iso_sort.setCurrentIndex(max(sort_index, 0))
+        self.mw_widget.iso_sort_order.setChecked(state.get("descending", False))
+        self.mw_widget.iso_filter.setText(state.get("filter", ""))
+        self.sort_isotherms()
+
+        # graph, then checked and selected isotherms
+        self.graph_view.set_graph_settings(state.get("graph", {}))
+        checked = [item for item, entry in zip(items, entries) if entry["checked"]]
+        if checked:
+            self.iso_list_model.check_all(checked)
+        else:
+            self.graph_view.redraw()
+        selected = state.get("selected")
+        if selected is not None and selected < len(items):
+            index = self.iso_proxy_model.mapFromSource(items[selected].index())
+            if index.isValid():
+                self.list_view.setCurrentIndex(index)
+
+        self.warm_thermo_cache()
+
     ########################################################
     # Selecting, deleting, isotherms from list
     ########################################################
 
     def select_last_iso(self):
-        """Select last isotherm"""
+        """Select last isotherm, after sorting in those just added."""
+        self.iso_proxy_model.resort()
         last_iso = self.iso_list_model.index(self.iso_list_model.rowCount() - 1, 0)
-        self.list_view.setCurrentIndex(last_iso)
+        last_iso = self.iso_proxy_model.mapFromSource(last_iso)
+        if last_iso.isValid():
+            self.list_view.setCurrentIndex(last_iso)
 
     def delete_current_iso(self):
         """Remove current isotherm from model."""
-        self.iso_list_model.removeRow(self.list_view.currentIndex().row())
+        index = self.list_view.currentIndex()
+        if index.isValid():
+            self.iso_proxy_model.removeRow(index.row())
@@ -0,0 +1,72 @@
+from functools import partial
+
+from qtpy import QtCore as QC
+
+from pygapsgui.utilities.parsing import parse_isotherm
+from pygapsgui.utilities.worker import Worker
+
+
+class IsoLoader(QC.QObject):
+    """
+    Parse isotherm files in a thread pool, streaming results as they finish.
+
+    Each file is handed to a separate Worker, so that the GUI thread is only
+    used to receive the finished results (isotherms or isotherm headers).
+    The order in which they arrive is therefore not guaranteed to be the
+    order of the paths.
+    """
+
+    loaded = QC.Signal(object, object)  # path, parser result
+    failed = QC.Signal(str, str)  # name, error
+    progress = QC.Signal(int, int)  # done, total
+    finished = QC.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.pool = QC.QThreadPool.globalInstance()
+        self.workers = []
+        self.total = 0
+        self.done = 0
+        self.n_loaded = 0
+        self.cancelled = False
+
+    def load(self, paths, parser=parse_isotherm):
+        """Start parsing all paths with a callable `parser(path)`."""
+        paths = list(paths)
+        self.total += len(paths)
+        if not self.total:
+            self.finished.emit()
+            return
+
+        for path in paths:
+            worker = Worker(parser, path)
+            worker.signals.result.connect(partial(self.handle_result, path))
+            worker.signals.error.connect(partial(self.handle_error, path.name))
+            worker.signals.finished.connect(self.handle_finished)
+            self.workers.append(worker)
+            self.pool.start(worker)
+
+    def handle_result(self, path, result):
+        """Pass a parsing result on, if one was returned."""
+        if result and not self.cancelled:
+            self.n_loaded += 1
+            self.loaded.emit(path, result)
+
+    def handle_error(self, name, error, trace):
+        """Pass a parsing error on."""
+        if not self.cancelled:
+            self.failed.emit(name, error)
+
+    def handle_finished(self):
+        """Count finished workers and report progress."""
+        self.done += 1
+        self.progress.emit(self.done, self.total)
+        if self.done == self.total:
+            self.workers.clear()
+            self.finished.emit()
+
+    def cancel(self):
+        """Stop delivering isotherms and skip any files not yet parsed."""
+        self.cancelled = True
+        for worker in self.workers:
+            worker.cancel()
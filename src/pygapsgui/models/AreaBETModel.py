@@ -9,7 +9,10 @@ from pygaps.graphing.calc_graphs import bet_plot
 from pygaps.graphing.calc_graphs import roq_plot
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import bet_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -81,6 +84,11 @@ class AreaBETModel():
         self.view.iso_graph.y2_data = None
         self.view.iso_graph.set_isotherms([self.isotherm])  # always last
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.calc_auto_button.clicked.connect(self.calc_auto)
@@ -109,22 +117,22 @@ class AreaBETModel():
         )
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.plot_clear()
-            self.output_log()
+        self.scheduler.request(self.pressure, self.loading, self.limits)
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.pressure, self.loading, self.limits)
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -132,33 +140,41 @@ class AreaBETModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, pressure, loading, limits):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
-            # TODO Should put all these into a dictionary
             try:
-                (
-                    self.bet_area,
-                    self.c_const,
-                    self.n_monolayer,
-                    self.p_monolayer,
-                    self.slope,
-                    self.intercept,
-                    self.min_point,
-                    self.max_point,
-                    self.corr_coef,
-                ) = area_BET_raw(
-                    self.pressure,
-                    self.loading,
+                results = calc_cache.call(
+                    area_BET_raw,
+                    pressure,
+                    loading,
                     self.cross_section,
-                    p_limits=self.limits,
+                    p_limits=limits,
                 )
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        # TODO Should put all these into a dictionary
+        (
+            self.bet_area,
+            self.c_const,
+            self.n_monolayer,
+            self.p_monolayer,
+            self.slope,
+            self.intercept,
+            self.min_point,
+            self.max_point,
+            self.corr_coef,
+        ) = results
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -238,16 +254,17 @@ class AreaBETModel():
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            f"BET area [m2/{self.isotherm.material_unit}]": self.bet_area,
-            "BET R^2": self.corr_coef,
-            "BET C constant": self.c_const,
-            f"BET monolayer uptake [mmol/{self.isotherm.material_unit}]": self.n_monolayer * 1000,
-            "BET monolayer pressure [p/p0]": self.p_monolayer,
-            "BET slope": self.slope,
-            "BET intercept": self.intercept,
-            "BET pressure limits": self.limits
-        }
+        return bet_results(
+            self.isotherm.material_unit,
+            self.bet_area,
+            self.c_const,
+            self.n_monolayer,
+            self.p_monolayer,
+            self.slope,
+            self.intercept,
+            self.corr_coef,
+            self.limits,
+        )
 
     def export_results(self):
         """Save results as a file."""
@@ -5,7 +5,10 @@ from pygaps.characterisation.area_lang import simple_lang
 from pygaps.graphing.calc_graphs import langmuir_plot
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import langmuir_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -28,7 +31,6 @@ class AreaLangModel():
     lang_area = None
     k_const = None
     n_monolayer = None
-    p_monolayer = 1  # assumed by the langmuir model
     slope = None
     intercept = None
     corr_coef = None
@@ -76,6 +78,11 @@ class AreaLangModel():
         self.view.iso_graph.loading_unit = "mmol"
         self.view.iso_graph.set_isotherms([self.isotherm])
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.calc_auto_button.clicked.connect(self.calc_auto)
@@ -104,22 +111,22 @@ class AreaLangModel():
         )
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.pressure, self.loading, self.limits)
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.pressure, self.loading, self.limits)
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -127,31 +134,39 @@ class AreaLangModel():
             self.plot_clear()
             self.output_log()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, pressure, loading, limits):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
             try:
-                (
-                    self.lang_area,
-                    self.k_const,
-                    self.n_monolayer,
-                    self.slope,
-                    self.intercept,
-                    self.min_point,
-                    self.max_point,
-                    self.corr_coef,
-                ) = area_langmuir_raw(
-                    self.pressure,
-                    self.loading,
+                results = calc_cache.call(
+                    area_langmuir_raw,
+                    pressure,
+                    loading,
                     self.cross_section,
-                    p_limits=self.limits,
+                    p_limits=limits,
                 )
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        (
+            self.lang_area,
+            self.k_const,
+            self.n_monolayer,
+            self.slope,
+            self.intercept,
+            self.min_point,
+            self.max_point,
+            self.corr_coef,
+        ) = results
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -213,17 +228,16 @@ class AreaLangModel():
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            f"Langmuir area [m2/{self.isotherm.material_unit}]": self.lang_area,
-            "Langmuir R^2": self.corr_coef,
-            "Langmuir K constant": self.k_const,
-            f"Langmuir monolayer uptake [mmol/{self.isotherm.material_unit}]":
-            self.n_monolayer * 1000,
-            "Langmuir monolayer pressure [p/p0]": self.p_monolayer,
-            "Langmuir slope": self.slope,
-            "Langmuir intercept": self.intercept,
-            "Langmuir pressure limits": self.limits
-        }
+        return langmuir_results(
+            self.isotherm.material_unit,
+            self.lang_area,
+            self.k_const,
+            self.n_monolayer,
+            self.slope,
+            self.intercept,
+            self.corr_coef,
+            self.limits,
+        )
 
     def export_results(self):
         """Save results as a file."""
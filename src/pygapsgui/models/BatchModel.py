@@ -0,0 +1,151 @@
+"""Batch characterisation QT model."""
+
+from qtpy import QtWidgets as QW
+
+from pygapsgui.controllers.BatchRunner import BatchRunner
+from pygapsgui.utilities.batch import METHODS
+from pygapsgui.widgets.UtilityDialogs import error_dialog
+
+
+class BatchModel():
+    """Batch characterisation of several isotherms: QT MVC Model."""
+
+    # Refs
+    items = None
+    view = None
+
+    # Settings
+    method = None
+
+    # Results
+    results = None
+    columns = None
+    output = ""
+    success = True
+
+    def __init__(self, items, view):
+        """First init"""
+        # Save refs
+        self.items = items
+        self.names = [item.text() for item in items]
+        self.view = view
+        self.results = {}
+        self.columns = []
+
+        # view setup
+        self.view.setWindowTitle(self.view.windowTitle() + f" ({len(items)} isotherms)")
+        self.view.method_dropdown.addItems(METHODS)
+        self.select_method(self.view.method_dropdown.currentText())
+        self.view.res_table.setRowCount(len(self.names))
+        self.view.res_table.setVerticalHeaderLabels(self.names)
+        self.view.progress.setRange(0, len(self.names))
+        self.view.progress.setValue(0)
+
+        # process pool runner
+        self.runner = BatchRunner(parent=self.view)
+        self.runner.result.connect(self.handle_result)
+        self.runner.failed.connect(self.handle_failed)
+        self.runner.progress.connect(self.handle_progress)
+        self.runner.finished.connect(self.handle_finished)
+        self.view.finished.connect(self.runner.cancel)
+
+        # connect signals
+        self.view.method_dropdown.currentTextChanged.connect(self.select_method)
+        self.view.run_button.clicked.connect(self.run)
+        self.view.export_btn.clicked.connect(self.export_results)
+        self.view.button_box.accepted.connect(self.view.accept)
+        self.view.button_box.rejected.connect(self.view.reject)
+
+    def select_method(self, method):
+        """Handle method selection."""
+        self.method = method
+        self.view.set_settings(METHODS[method][1])
+
+    def run(self):
+        """Start calculating on all isotherms."""
+        self.results = {}
+        self.columns = []
+        self.view.res_table.clearContents()
+        self.view.res_table.setColumnCount(0)
+        self.view.progress.setValue(0)
+        self.view.run_button.setEnabled(False)
+        self.output = ""
+        self.output_log()
+
+        isotherms = []
+        for index, item in enumerate(self.items):
+            try:
+                isotherm = item.data()
+            except Exception as err:  # pylint: disable=broad-except
+                error_dialog(f"Could not load isotherm '{self.names[index]}': {err}")
+                isotherm = None
+            if isotherm is None:  # lazy items report their own loading errors
+                self.view.run_button.setEnabled(True)
+                return
+            isotherms.append(isotherm)
+        self.runner.run(self.method, isotherms, self.view.get_settings())
+
+    def handle_result(self, index, result):
+        """Add a result to the table."""
+        self.results[index] = result
+        for name, value in result.items():
+            if name not in self.columns:
+                self.columns.append(name)
+                self.view.res_table.setColumnCount(len(self.columns))
+                self.view.res_table.setHorizontalHeaderLabels(self.columns)
+            self.view.res_table.setItem(
+                index, self.columns.index(name), QW.QTableWidgetItem(_format_value(value))
+            )
+
+    def handle_failed(self, index, error):
+        """Add a failure to the log."""
+        self.output += f'<font color="red">{self.names[index]}: calculation failed! <br> {error}</font><br>'
+        self.output_log()
+
+    def handle_progress(self, done, total):
+        """Update progress."""
+        self.view.progress.setValue(done)
+
+    def handle_finished(self):
+        """Allow a new run when all calculations are done."""
+        self.view.run_button.setEnabled(True)
+        self.view.res_table.resizeColumnsToContents()
+
+    def output_log(self):
+        """Output text or dialog error/warning/info."""
+        self.view.output.setText(self.output)
+
+    def result_items(self):
+        """Return a list of (isotherm item, result dictionary) pairs."""
+        return [(self.items[index], result) for index, result in sorted(self.results.items())]
+
+    def result_dict(self):
+        """Return a dictionary of result columns, including the isotherm names."""
+        indices = sorted(self.results)
+        table = {"Isotherm": [self.names[index] for index in indices]}
+        for column in self.columns:
+            table[column] = [self.results[index].get(column) for index in indices]
+        return table
+
+    def export_results(self):
+        """Save results as a file."""
+        if not self.results:
+            error_dialog("No results to export.")
+            return
+        from pygapsgui.utilities.result_export import serialize
+
+        results = self.result_dict()
+        serialize(results, how="V", parent=self.view)
+
+
+def _format_value(value) -> str:
+    """Short text for a table cell."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:g}"
+    if isinstance(value, list):
+        if len(value) > 4:
+            return f"[{len(value)} values]"
+        return ", ".join(_format_value(val) for val in value)
+    return str(value)
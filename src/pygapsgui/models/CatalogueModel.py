@@ -0,0 +1,95 @@
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+
+class CatalogueModel(QC.QAbstractListModel):
+    """
+    List model of the names in a pyGAPS catalogue (MATERIAL_LIST or ADSORBATE_LIST).
+
+    A single model per catalogue is shared by all combo boxes, which then
+    never need to be filled or rebuilt. The names are kept along with an
+    index of their rows, so that checking for a name and adding one does
+    not go through the whole catalogue. Rows are only inserted or removed
+    for names which change, so views keep their current text.
+    """
+    def __init__(self, catalogue, parent=None):
+        super().__init__(parent)
+        self.catalogue = catalogue
+        self._names = []
+        self._rows = {}  # name: row
+        self.sync()
+
+    def rowCount(self, parent=QC.QModelIndex()):
+        """Get number of names."""
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=QC.Qt.DisplayRole):
+        """Name display function."""
+        if not index.isValid():
+            return None
+        if role in [QC.Qt.DisplayRole, QC.Qt.EditRole]:
+            return self._names[index.row()]
+        return None
+
+    def contains(self, name: str) -> bool:
+        """Whether the name is in the catalogue."""
+        return name in self._rows
+
+    def add(self, name: str):
+        """Append a name just added to the catalogue."""
+        if name in self._rows:
+            return
+        row = len(self._names)
+        self.beginInsertRows(QC.QModelIndex(), row, row)
+        self._names.append(name)
+        self._rows[name] = row
+        self.endInsertRows()
+
+    def sync(self):
+        """Update the names after the catalogue was changed elsewhere."""
+        names = list(dict.fromkeys(item.name for item in self.catalogue))
+        if names == self._names:
+            return
+
+        # remove names no longer in the catalogue, last first
+        present = set(names)
+        for row in reversed(range(len(self._names))):
+            if self._names[row] not in present:
+                self.beginRemoveRows(QC.QModelIndex(), row, row)
+                del self._names[row]
+                self.endRemoveRows()
+        self._rows = {name: row for row, name in enumerate(self._names)}
+
+        for name in names:
+            self.add(name)
+
+    def attach(self, combo):
+        """Show the catalogue in an editable combo box, with a completer."""
+        combo.setModel(self)
+        combo.view().setUniformItemSizes(True)
+        completer = QW.QCompleter(self, combo)
+        completer.setCaseSensitivity(QC.Qt.CaseInsensitive)
+        completer.setFilterMode(QC.Qt.MatchContains)
+        completer.setCompletionMode(QW.QCompleter.PopupCompletion)
+        combo.setCompleter(completer)
+
+
+_MODELS = {}
+
+
+def material_model() -> CatalogueModel:
+    """The shared model of pygaps.MATERIAL_LIST."""
+    if "material" not in _MODELS:
+        import pygaps
+        _MODELS["material"] = CatalogueModel(pygaps.MATERIAL_LIST)
+    return _MODELS["material"]
+
+
+def adsorbate_model() -> CatalogueModel:
+    """The shared model of pygaps.ADSORBATE_LIST."""
+    if "adsorbate" not in _MODELS:
+        import pygaps
+        _MODELS["adsorbate"] = CatalogueModel(pygaps.ADSORBATE_LIST)
+    return _MODELS["adsorbate"]
@@ -6,7 +6,10 @@ from pygaps.characterisation.dr_da_plots import log_v_adj
 from pygaps.graphing.calc_graphs import dra_plot
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import dadr_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -24,7 +27,6 @@ class DADRModel():
     # Results
     microp_volume = None
     potential = None
-    exp = None
     slope = None
     intercept = None
     corr_coef = None
@@ -72,6 +74,11 @@ class DADRModel():
         self.view.iso_graph.pressure_mode = "relative"
         self.view.iso_graph.set_isotherms([self.isotherm])
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.calc_auto_button.clicked.connect(self.calc_auto)
         self.view.x_select.slider.rangeChanged.connect(self.calc_with_limits)
@@ -104,22 +111,22 @@ class DADRModel():
         )
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.pressure, self.loading, self.limits, self.exponent)
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.pressure, self.loading, self.limits, self.exponent)
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (self.pressure[self.min_point], self.pressure[self.max_point])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -127,36 +134,44 @@ class DADRModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, pressure, loading, limits, exponent):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
             try:
-                (
-                    self.microp_volume,
-                    self.potential,
-                    exp,
-                    self.slope,
-                    self.intercept,
-                    self.min_point,
-                    self.max_point,
-                    self.corr_coef,
-                ) = da_plot_raw(
-                    self.pressure,
-                    self.loading,
+                results = calc_cache.call(
+                    da_plot_raw,
+                    pressure,
+                    loading,
                     self.isotherm.temperature,
                     self.molar_mass,
                     self.liquid_density,
-                    self.exponent,
-                    p_limits=self.limits,
+                    exponent,
+                    p_limits=limits,
                 )
-                if self.ptype == "DA":
-                    self.exponent = exp
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        (
+            self.microp_volume,
+            self.potential,
+            exp,
+            self.slope,
+            self.intercept,
+            self.min_point,
+            self.max_point,
+            self.corr_coef,
+        ) = results
+        if self.ptype == "DA":
+            self.exponent = exp
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -225,19 +240,17 @@ class DADRModel():
 
     def result_dict(self):
         """Return a dictionary of results."""
-        results = {
-            f"{self.ptype} mircropore Volume [cm3/{self.isotherm.material_unit}]":
-            self.microp_volume * 1000,
-            f"{self.ptype} effective potential [kJ/mol]": self.potential,
-            f"{self.ptype} R^2": self.corr_coef,
-            f"{self.ptype} slope": self.slope,
-            f"{self.ptype} intercept": self.intercept,
-            f"{self.ptype} pressure limits": self.limits
-        }
-
-        if self.ptype != "DR":
-            results["DR Exponent"] = self.exp
-        return results
+        return dadr_results(
+            self.ptype,
+            self.isotherm.material_unit,
+            self.microp_volume,
+            self.potential,
+            self.exponent,
+            self.slope,
+            self.intercept,
+            self.corr_coef,
+            self.limits,
+        )
 
     def export_results(self):
         """Save results as a file."""
@@ -1,10 +1,9 @@
-import numpy as np
 from qtpy import QtWidgets as QW
 
 import pygaps
 from pygaps.graphing.iast_graphs import plot_iast
 from pygaps.graphing.labels import label_units_iso
-from pygaps.iast.pgiast import iast_point_fraction
+from pygapsgui.utilities.iast_solver import iast_points
 from pygapsgui.utilities.log_hook import log_hook
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
@@ -31,7 +30,7 @@ class IASTModel():
         self.view = view
 
         if any(isinstance(i, pygaps.PointIsotherm) for i in isotherms):
-            self.output = '<font color="magenta">Careful, using PointIsotherms interpolates then numerically calculates spreading pressure. Calculations may be slow.</font>'
+            self.output = '<font color="magenta">Careful, using PointIsotherms interpolates then numerically calculates spreading pressure.</font>'
             self.view.output.setText(self.output)
 
         if not all(i.temperature == isotherms[0].temperature for i in isotherms):
@@ -68,24 +67,21 @@ class IASTModel():
 
         pressures_t = self.view.data_table.data["Total P"].to_numpy()
         pressures_p = self.view.data_table.data.iloc[:, 1:].to_numpy()
-        fractions = np.apply_along_axis(lambda x: x / np.sum(x), 1, pressures_p)
 
         if pressures_t is None:
             error_dialog("First specify total pressure and partial pressures.")
             return
 
+        fractions = pressures_p / pressures_p.sum(axis=1, keepdims=True)
+
         with log_hook:
             try:
-                # Generate the array of partial pressures
-                results = np.zeros(pressures_p.shape)
-
-                for ind, fraction in enumerate(fractions):
-                    results[ind, :] = iast_point_fraction(
-                        self.isotherms,
-                        gas_mole_fraction=fraction,
-                        total_pressure=pressures_t[ind],
-                        branch=self.branch,
-                    )
+                # All compositions are solved together
+                results = iast_points(
+                    self.isotherms,
+                    fractions * pressures_t[:, None],
+                    branch=self.branch,
+                )
                 self.results = results
                 self.pressures = pressures_t
                 self.fractions = fractions
@@ -3,8 +3,10 @@ from qtpy import QtWidgets as QW
 import pygaps
 from pygaps.graphing.iast_graphs import plot_iast_svp
 from pygaps.graphing.labels import label_units_iso
-from pygaps.iast import iast_binary_svp
+from pygapsgui.utilities.iast_solver import iast_binary_svp
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.worker import RecalcScheduler
+from pygapsgui.utilities.worker import TaskCancelled
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -46,55 +48,111 @@ class IASTSVPModel():
         self.view.branch_dropdown.addItems(["ads", "des"])
         self.view.branch_dropdown.setCurrentText(self.branch)
 
+        # background calculation, restarted when inputs change
+        self.scheduler = RecalcScheduler(
+            self.calculate,
+            self.show_results,
+            progress=self.show_progress,
+            interrupt=True,
+            parent=self.view,
+        )
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.data_table.set_data(props=["Pressure"], data=self.pressure_points)
         self.view.calc_button.clicked.connect(self.calc_auto)
+        self.view.calc_cancel_button.clicked.connect(self.calc_cancel)
         self.view.button_box.accepted.connect(self.export_results)
         self.view.button_box.rejected.connect(self.view.reject)
 
         # Calculation
 
     def calc_auto(self):
-        """Automatic calculation."""
-        if self.calculate():
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
-
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
-        self.pressure_points = self.view.data_table.data["Pressure"].to_numpy()
-        if self.pressure_points is None:
-            error_dialog("First specify pressure points.")
+        """Start a calculation in the background."""
+        settings = self.read_settings()
+        if settings is None:
             return
+        self.view.progress.setValue(0)
+        self.view.calc_cancel_button.setEnabled(True)
+        self.scheduler.request(settings)
+
+    def calc_cancel(self):
+        """Stop the running calculation."""
+        self.scheduler.cancel()
+        self.view.calc_cancel_button.setEnabled(False)
+        self.view.progress.setValue(0)
+        self.view.output.setText("Calculation cancelled.")
+
+    def read_settings(self):
+        """Read calculation settings from the view, in the GUI thread, or None if incomplete."""
+        pressure_points = self.view.data_table.data["Pressure"].to_numpy()
+        if pressure_points is None:
+            error_dialog("First specify pressure points.")
+            return None
         slider = float(self.view.fraction_slider.getValue())
-        self.mole_fractions = [slider, 1 - slider]
-        self.main_adsorbate = self.view.adsorbate_input.currentText()
-        self.isotherms = sorted(
-            self.isotherms,
-            key=lambda x: x.adsorbate == self.main_adsorbate,
-            reverse=True,
-        )
+        main_adsorbate = self.view.adsorbate_input.currentText()
+        return {
+            "isotherms": sorted(
+                self.isotherms,
+                key=lambda x: x.adsorbate == main_adsorbate,
+                reverse=True,
+            ),
+            "main_adsorbate": main_adsorbate,
+            "mole_fractions": [slider, 1 - slider],
+            "pressure_points": pressure_points,
+            "branch": self.branch,
+        }
 
+    def calculate(self, settings, progress=None):
+        """Call pyGAPS to perform main calculation, returning the results, settings used and logs."""
         with log_hook:
             try:
-                self.results = iast_binary_svp(
-                    self.isotherms,
-                    mole_fractions=self.mole_fractions,
-                    pressures=self.pressure_points,
-                    branch=self.branch,
+                results = iast_binary_svp(
+                    settings["isotherms"],
+                    mole_fractions=settings["mole_fractions"],
+                    pressures=settings["pressure_points"],
+                    branch=settings["branch"],
                     warningoff=False,
+                    progress=progress,
                 )
+            except TaskCancelled:
+                raise
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Model failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, settings, f'<font color="red">Model failed! <br> {e}</font>'
+            return results, settings, log_hook.get_logs()
+
+    def show_progress(self, done, total):
+        """Display calculation progress."""
+        self.view.progress.setMaximum(total)
+        self.view.progress.setValue(done)
+
+    def store_results(self, outcome) -> bool:
+        """Store the results, settings and logs of a calculation, returning whether it succeeded."""
+        results, settings, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results = results
+        # the settings the results were calculated with, for plots and export
+        self.isotherms = settings["isotherms"]
+        self.main_adsorbate = settings["main_adsorbate"]
+        self.mole_fractions = settings["mole_fractions"]
+        self.pressure_points = settings["pressure_points"]
+        return True
+
+    def show_results(self, outcome):
+        """Display the results of a background calculation."""
+        self.view.calc_cancel_button.setEnabled(False)
+        if self.store_results(outcome):
+            self.output_log()
+            self.output_results()
+            self.plot_results()
+        else:
+            self.output_log()
+            self.plot_clear()
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -126,6 +184,8 @@ class IASTSVPModel():
 
     def select_branch(self):
         """Handle isotherm branch selection."""
+        self.scheduler.cancel()
+        self.view.calc_cancel_button.setEnabled(False)
         self.branch = self.view.branch_dropdown.currentText()
         self.plot_clear()
 
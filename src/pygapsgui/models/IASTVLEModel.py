@@ -1,8 +1,10 @@
 import pygaps
 from pygaps.graphing.iast_graphs import plot_iast_vle
-from pygaps.iast import iast_binary_vle
 from pygaps.utilities.exceptions import CalculationError
+from pygapsgui.utilities.iast_solver import iast_binary_vle
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.worker import RecalcScheduler
+from pygapsgui.utilities.worker import TaskCancelled
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -48,54 +50,107 @@ class IASTVLEModel():
         self.view.branch_dropdown.addItems(["ads", "des"])
         self.view.branch_dropdown.setCurrentText(self.branch)
 
+        # background calculation, restarted when inputs change
+        self.scheduler = RecalcScheduler(
+            self.calculate,
+            self.show_results,
+            progress=self.show_progress,
+            interrupt=True,
+            parent=self.view,
+        )
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.calc_button.clicked.connect(self.calc_auto)
+        self.view.calc_cancel_button.clicked.connect(self.calc_cancel)
         self.view.pressure_input.valueChanged.connect(self.calc_autobox)
         self.view.point_input.valueChanged.connect(self.calc_autobox)
         self.view.button_box.accepted.connect(self.export_results)
         self.view.button_box.rejected.connect(self.view.reject)
 
     def calc_auto(self):
-        """Automatic calculation."""
-        if self.calculate():
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        """Start a calculation in the background."""
+        settings = self.read_settings()
+        self.view.progress.setValue(0)
+        self.view.calc_cancel_button.setEnabled(True)
+        self.scheduler.request(settings)
 
     def calc_autobox(self):
         if self.view.calc_autobox.isChecked():
             self.calc_auto()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
-        self.total_pressure = self.view.pressure_input.value()
-        self.number_points = self.view.point_input.value()
-        self.main_adsorbate = self.view.adsorbate_input.currentText()
-        self.isotherms = sorted(
-            self.isotherms,
-            key=lambda x: x.adsorbate == self.main_adsorbate,
-            reverse=True,
-        )
+    def calc_cancel(self):
+        """Stop the running calculation."""
+        self.scheduler.cancel()
+        self.view.calc_cancel_button.setEnabled(False)
+        self.view.progress.setValue(0)
+        self.view.output.setText("Calculation cancelled.")
+
+    def read_settings(self) -> dict:
+        """Read calculation settings from the view, in the GUI thread."""
+        main_adsorbate = self.view.adsorbate_input.currentText()
+        return {
+            "isotherms": sorted(
+                self.isotherms,
+                key=lambda x: x.adsorbate == main_adsorbate,
+                reverse=True,
+            ),
+            "main_adsorbate": main_adsorbate,
+            "total_pressure": self.view.pressure_input.value(),
+            "number_points": self.view.point_input.value(),
+            "branch": self.branch,
+        }
 
+    def calculate(self, settings, progress=None):
+        """Call pyGAPS to perform main calculation, returning the results, settings used and logs."""
         with log_hook:
             try:
-                self.results = iast_binary_vle(
-                    self.isotherms,
-                    total_pressure=self.total_pressure,
-                    npoints=self.number_points,
-                    branch=self.branch,
+                results = iast_binary_vle(
+                    settings["isotherms"],
+                    total_pressure=settings["total_pressure"],
+                    npoints=settings["number_points"],
+                    branch=settings["branch"],
                     warningoff=False,
+                    progress=progress,
                 )
+            except TaskCancelled:
+                raise
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Model failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, settings, f'<font color="red">Model failed! <br> {e}</font>'
+            return results, settings, log_hook.get_logs()
+
+    def show_progress(self, done, total):
+        """Display calculation progress."""
+        self.view.progress.setMaximum(total)
+        self.view.progress.setValue(done)
+
+    def store_results(self, outcome) -> bool:
+        """Store the results, settings and logs of a calculation, returning whether it succeeded."""
+        results, settings, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results = results
+        # the settings the results were calculated with, for plots and export
+        self.isotherms = settings["isotherms"]
+        self.main_adsorbate = settings["main_adsorbate"]
+        self.total_pressure = settings["total_pressure"]
+        self.number_points = settings["number_points"]
+        return True
+
+    def show_results(self, outcome):
+        """Display the results of a background calculation."""
+        self.view.calc_cancel_button.setEnabled(False)
+        if self.store_results(outcome):
+            self.output_log()
+            self.output_results()
+            self.plot_results()
+        else:
+            self.output_log()
+            self.plot_clear()
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -127,6 +182,8 @@ class IASTVLEModel():
 
     def select_branch(self):
         """Handle isotherm branch selection."""
+        self.scheduler.cancel()
+        self.view.calc_cancel_button.setEnabled(False)
         self.branch = self.view.branch_dropdown.currentText()
         self.plot_clear()
 
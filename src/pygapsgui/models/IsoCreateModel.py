@@ -1,4 +1,3 @@
-import pygaps
 from pygaps import ModelIsotherm
 from pygaps import PointIsotherm
 from pygaps.core.baseisotherm import BaseIsotherm
@@ -6,6 +5,8 @@ from pygaps.units.converter_mode import _LOADING_MODE
 from pygaps.units.converter_mode import _MATERIAL_MODE
 from pygaps.units.converter_mode import _PRESSURE_MODE
 from pygaps.units.converter_unit import _TEMPERATURE_UNITS
+from pygapsgui.models.CatalogueModel import adsorbate_model
+from pygapsgui.models.CatalogueModel import material_model
 from pygapsgui.utilities.log_hook import log_hook
 
 
@@ -38,9 +39,9 @@ class IsoCreateModel():
         self.view = view
 
         # populate view
-        self.view.material_input.addItems([mat.name for mat in pygaps.MATERIAL_LIST])
+        material_model().attach(self.view.material_input)
         self.view.material_input.setCurrentText(self.base_isotherm.material.name)
-        self.view.adsorbate_input.addItems([ads.name for ads in pygaps.ADSORBATE_LIST])
+        adsorbate_model().attach(self.view.adsorbate_input)
         self.view.adsorbate_input.setCurrentText(self.base_isotherm.adsorbate.name)
         self.view.temperature_input.setValue(self.base_isotherm.temperature)
         self.view.unit_widget.init_boxes(
@@ -162,7 +163,7 @@ class IsoCreateModel():
                 if self.iso_type == 0:
                     self.full_isotherm = PointIsotherm.from_isotherm(
                         isotherm=self.base_isotherm,
-                        isotherm_data=self.view.point_edit.datatable_model._data,
+                        isotherm_data=self.view.point_edit.datatable_model.dataframe(),
                         pressure_key="pressure",
                         loading_key="loading",
                     )
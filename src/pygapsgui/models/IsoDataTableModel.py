@@ -12,8 +12,8 @@ class IsoDataTableModel(dfTableModel):
     def data(self, index=QC.QModelIndex(), role=QC.Qt.DisplayRole):
         """Intercept data to display ads/des for branches"""
         if role in [QC.Qt.DisplayRole, QC.Qt.EditRole]:
-            if self._data.columns[index.column()] == "branch":
-                val = self._data.values[index.row()][index.column()]
+            if self._store.names[index.column()] == "branch":
+                val = self._value(index.row(), index.column())
                 return "des" if val else "ads"
         return super().data(index, role)
 
@@ -23,10 +23,9 @@ class IsoDataTableModel(dfTableModel):
             return False
 
         if role == QC.Qt.EditRole:
-            if self._data.columns[index.column()] == "branch":
+            if self._store.names[index.column()] == "branch":
                 if value in ("ads", "des", "0", "1", "False", "True"):
-                    self._data.iloc[index.row(), index.column()] = _BRANCH_CHOICES[value]
-                    self.dataChanged.emit(index, index)
+                    self._set_cell(index.row(), index.column(), _BRANCH_CHOICES[value])
                     return True
                 else:
                     error_dialog("Branch can only be 'ads'/0/True or 'des'/1/False.")
@@ -34,6 +33,23 @@ class IsoDataTableModel(dfTableModel):
 
         return super().setData(index, value, role)
 
+    def setDataRange(self, index, values, role: int = QC.Qt.EditRole, append=False) -> bool:
+        """Report values that cannot be converted instead of failing."""
+        try:
+            return super().setDataRange(index, values, role, append)
+        except ValueError as err:
+            error_dialog(f"Could not set data: {err}")
+            return False
+
+    def _convert_column(self, col, values):
+        """Convert ads/des for branches."""
+        if self._store.names[col] == "branch":
+            keys = values.astype(str).str.strip()
+            if not keys.isin(list(_BRANCH_CHOICES)).all():
+                raise ValueError("Branch can only be 'ads'/0/True or 'des'/1/False.")
+            return keys.map(_BRANCH_CHOICES).to_numpy()
+        return super()._convert_column(col, values)
+
     def insertColumns(self, column: int, count: int, parent=None) -> bool:
         """Ensure only insert at the end."""
         return super().insertColumns(max(column, 2), count, parent)
@@ -41,7 +57,7 @@ class IsoDataTableModel(dfTableModel):
     def removeColumns(self, column: int, count: int, parent=None) -> bool:
         """Ensure base parameters cant be deleted."""
         if any(
-            self._data.columns[column + c] in ["pressure", "loading", "branch"]
+            self._store.names[column + c] in ["pressure", "loading", "branch"]
             for c in range(count)
         ):
             error_dialog("Cannot remove basic data types (pressure, loading or branch).")
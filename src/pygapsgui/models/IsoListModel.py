@@ -1,6 +1,11 @@
+from collections import OrderedDict
+
 from qtpy import QtCore as QC
 from qtpy import QtGui as QG
 
+from pygapsgui.models.IsoModel import sort_keys
+from pygapsgui.utilities.string_match import SearchIndex
+
 
 class IsoListModel(QG.QStandardItemModel):
     """
@@ -16,107 +21,230 @@ class IsoListModel(QG.QStandardItemModel):
         selected isotherm is changed by clicking the item/arrow keys
         checked items are changed by clicking the checkmark
 
+    Checked items are also kept in a set, so that they are found without
+    going through all rows. Check states should therefore be changed
+    through the model (`check_all`, `uncheck_all`) or by the user.
+
+    Lazy isotherm items are only kept in memory while recently used:
+    at most `lazy_limit` of them, not counting checked or selected ones.
+
+    Isotherms can be searched by name and metadata through `search`, and
+    sorted by the keys from `item_keys`. Items are (re)indexed when next
+    needed after they are added or marked through `mark_changed`.
+
+    Items cannot be hashed with all Qt bindings, so they are kept in
+    containers by their id, mapped back to the item through `_items`.
+
     """
 
     checked_changed = QC.Signal()
-    index_selected = None
+    item_selected = None
+    lazy_limit = 50
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # recently used lazy items, oldest first, by id as items cannot be hashed
+        self._lazy_used = OrderedDict()
+        # ids of checked items
+        self._checked = set()
         # this emits when any checked are changed
         self.itemChanged.connect(self.handle_check_change)
+        # all items, by id
+        self._items = {}
+        # search index and sort keys of isotherm names and metadata
+        self.search_index = SearchIndex()
+        self._search_stale = set()  # ids of items to (re)index
+        self._keys = {}  # item id: sort keys
+        self.itemChanged.connect(self.mark_changed)
+        self.rowsInserted.connect(self.handle_rows_inserted)
+        self.rowsAboutToBeRemoved.connect(self.handle_rows_removed)
+        self.modelReset.connect(self.handle_reset)
+
+    def _set_check(self, item, state):
+        """Set an item check state without signals, keeping the checked set."""
+        self.blockSignals(True)
+        item.setCheckState(state)
+        self.blockSignals(False)
+        if state == QC.Qt.Checked:
+            self._checked.add(id(item))
+        else:
+            self._checked.discard(id(item))
 
     def handle_check_change(self, item):
         """If an item got checked, we need to check why."""
         # Can never uncheck a selected item so we re-mark it as checked
-        if item.index() == self.index_selected:
-            self.blockSignals(True)
-            item.setCheckState(QC.Qt.Checked)
-            self.blockSignals(False)
+        if item is self.item_selected:
+            self._set_check(item, QC.Qt.Checked)
             return
-        # Otherwise emit change
-        self.checked_changed.emit()
+        # Otherwise emit change, if any
+        was_checked = id(item) in self._checked
+        if item.checkState() == QC.Qt.Checked:
+            self._checked.add(id(item))
+        else:
+            self._checked.discard(id(item))
+        if was_checked != (id(item) in self._checked):
+            self.checked_changed.emit()
 
     def handle_item_select(self, new_index, old_index):
-        """When isotherm is selected, ensure it is marked checked."""
+        """
+        When isotherm is selected, ensure it is marked checked.
+
+        The previous item is the one last selected, as `old_index` is
+        invalid once the item is hidden by a filter.
+        """
 
         # Restore previous item check state to user state
-        old_item = self.itemFromIndex(old_index)
+        old_item = self.item_selected if self.item_selected is not None else self.itemFromIndex(old_index)
         if old_item:
-            self.blockSignals(True)
-            old_item.setCheckState(old_item.userCheckState)
-            self.blockSignals(False)
+            self._set_check(old_item, old_item.userCheckState)
 
         # Save user check state and mark selected item as checked
         new_item = self.itemFromIndex(new_index)
+        self.item_selected = new_item
         if new_item:
             # Before any changes, store old state
             new_item.userCheckState = new_item.checkState()
 
-            self.blockSignals(True)
-            new_item.setCheckState(QC.Qt.Checked)
-            self.blockSignals(False)
-
-            # store index
-            self.index_selected = new_index
+            self._set_check(new_item, QC.Qt.Checked)
 
             # improve performance by emitting check change only if something changed
-            # TODO what about when it is deleted?
             if (
                 old_item and old_item.checkState() == QC.Qt.Checked
                 and new_item.userCheckState == QC.Qt.Checked
             ):
                 return
+        if new_item or old_item:
             self.checked_changed.emit()
 
-    def get_checked(self):
-        """Return list of checked isotherms."""
-        # There is no standard method for this
-        return [
-            self.item(row).data()
-            for row in range(self.rowCount())
-            if self.item(row).checkState() == QC.Qt.Checked
-        ]
-
-    def check_all(self):
-        """Tick all items and mark them for display."""
-        nrows = self.rowCount()
-        if not nrows:
+    def touch_lazy(self, item):
+        """Mark a lazy item as recently used and release the least recently used."""
+        self._lazy_used[id(item)] = item
+        self._lazy_used.move_to_end(id(item))
+        excess = len(self._lazy_used) - self.lazy_limit
+        if excess <= 0:
             return
-
-        self.blockSignals(True)
-        for row in range(nrows):
+        for key, old_item in list(self._lazy_used.items()):
+            if excess <= 0:
+                break
+            if key in self._checked or old_item is self.item_selected:
+                continue
+            old_item.release()
+            del self._lazy_used[key]
+            excess -= 1
+
+    def mark_changed(self, item):
+        """Re-index an item when next needed, as its name or metadata changed."""
+        self._search_stale.add(id(item))
+        self._keys.pop(id(item), None)
+
+    def handle_rows_inserted(self, parent, first, last):
+        """Index new items when needed, and record those already checked."""
+        for row in range(first, last + 1):
             item = self.item(row)
-            item.setCheckState(QC.Qt.Checked)
-        self.blockSignals(False)
-
-        self.layoutChanged.emit()  # let models know something changed
-        self.checked_changed.emit()  # and that checked state changed
+            self._items[id(item)] = item
+            self._search_stale.add(id(item))
+            if item.checkState() == QC.Qt.Checked:
+                self._checked.add(id(item))
+
+    def handle_rows_removed(self, parent, first, last):
+        """Forget removed items."""
+        for row in range(first, last + 1):
+            item = self.item(row)
+            self._items.pop(id(item), None)
+            self._search_stale.discard(id(item))
+            self._keys.pop(id(item), None)
+            self._checked.discard(id(item))
+            self._lazy_used.pop(id(item), None)
+            self.search_index.remove(id(item))
+            if item is self.item_selected:
+                self.item_selected = None
+
+    def handle_reset(self):
+        """Forget all items."""
+        self._items.clear()
+        self._search_stale.clear()
+        self._keys.clear()
+        self._checked.clear()
+        self._lazy_used.clear()
+        self.search_index.clear()
+        self.item_selected = None
+
+    def search(self, text: str) -> list:
+        """Return the isotherm items matching a text, best first."""
+        for key in self._search_stale:
+            self.search_index.add(key, self._items[key].search_strings())
+        self._search_stale.clear()
+        return [self._items[key] for key in self.search_index.search(text)]
+
+    def matches(self, item, text: str) -> bool:
+        """Whether an item not yet indexed matches a text."""
+        return self.search_index.match(text, item.search_strings())
+
+    def is_indexed(self, item) -> bool:
+        """Whether an item is searched through the index."""
+        return id(item) in self.search_index and id(item) not in self._search_stale
+
+    def item_keys(self, item) -> dict:
+        """Sort keys of an item (name, material, adsorbate, temperature, date, BET area)."""
+        keys = self._keys.get(id(item))
+        if keys is None:
+            keys = self._keys[id(item)] = sort_keys(item.summary())
+        return keys
+
+    def get_checked_items(self):
+        """Return list of checked isotherm items, in list order."""
+        return sorted((self._items[key] for key in self._checked), key=lambda item: item.row())
 
-    def uncheck_all(self):
-        """Un-tick all items and update selection."""
-        nrows = self.rowCount()
-        if not nrows:
+    def get_checked(self):
+        """Return list of checked isotherms, skipping those which could not be loaded."""
+        isotherms = (item.data() for item in self.get_checked_items())
+        return [isotherm for isotherm in isotherms if isotherm is not None]
+
+    def check_all(self, items=None):
+        """Tick all items, or only those given, and mark them for display."""
+        if items is None:
+            items = [self.item(row) for row in range(self.rowCount())]
+        items = [item for item in items if id(item) not in self._checked]
+        if not items:
             return
 
-        self.blockSignals(True)
-        for row in range(nrows):
-            item = self.item(row)
-            # only untick non-selected isotherms
-            if item.index() != self.index_selected:
-                item.setCheckState(QC.Qt.Unchecked)
-        self.blockSignals(False)
+        for item in items:
+            self._set_check(item, QC.Qt.Checked)
+        self._emit_check_states()
+
+    def uncheck_all(self, items=None):
+        """Un-tick all items, or only those given, and update selection."""
+        if items is None:
+            items = [self._items[key] for key in self._checked]
+        # only untick non-selected isotherms
+        items = [item for item in items if id(item) in self._checked and item is not self.item_selected]
+        if not items:
+            return
 
-        self.layoutChanged.emit()  # let models know something changed
+        for item in items:
+            self._set_check(item, QC.Qt.Unchecked)
+        self._emit_check_states()
+
+    def _emit_check_states(self):
+        """Let views know check states changed, without a layout change."""
+        if self.rowCount():
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, 0),
+                [QC.Qt.CheckStateRole],
+            )
         self.checked_changed.emit()  # and that checked state changed
 
-    def removeRow(self, row, parent=QC.QModelIndex()):
-        """Remove isotherm from model."""
-        # LayoutChanged called automatically BEFORE actual removal
-        # Therefore must ensure old isotherm is not ticked
-        self.blockSignals(True)
-        self.item(row).setCheckState(QC.Qt.Unchecked)
-        self.blockSignals(False)
+    def removeRows(self, row, count, parent=QC.QModelIndex()):
+        """Remove isotherms from model."""
+        # Ensure old isotherms are not ticked, before removal
+        removed = [self.item(row + n) for n in range(count) if self.item(row + n)]
+        was_checked = any(id(item) in self._checked for item in removed)
+        for item in removed:
+            self._set_check(item, QC.Qt.Unchecked)
 
         # Call method for removal
-        super().removeRow(row, parent)
+        result = super().removeRows(row, count, parent)
+        if was_checked:
+            self.checked_changed.emit()
+        return result
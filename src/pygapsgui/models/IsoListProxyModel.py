@@ -0,0 +1,71 @@
+from qtpy import QtCore as QC
+
+
+class IsoListProxyModel(QC.QSortFilterProxyModel):
+    """
+    Sorted and filtered view of an IsoListModel, for the isotherm explorer.
+
+    Items are sorted by one of the cached keys of the IsoListModel (see
+    `IsoModel.SORT_KEYS`), or kept in the order they were loaded. The
+    filter text is searched once in the index of the IsoListModel, and
+    rows are then accepted by looking up the set of matching items. Items
+    added or changed since are matched on their own.
+
+    Sorting and filtering are not dynamic, as check state changes do not
+    affect them: sorting is redone through `resort`, such as after
+    isotherms are loaded.
+    """
+
+    sort_key: str = None  # None keeps the loading order
+    filter_text: str = ""
+
+    def __init__(self, source_model, parent=None):
+        super().__init__(parent)
+        self._matches = set()  # ids of the items matching the filter text
+        self.setDynamicSortFilter(False)
+        self.setSourceModel(source_model)
+
+    def item(self, index):
+        """Return the isotherm item at a proxy index."""
+        return self.sourceModel().itemFromIndex(self.mapToSource(index))
+
+    def visible_items(self) -> list:
+        """Return the isotherm items which pass the filter, in displayed order."""
+        return [self.item(self.index(row, 0)) for row in range(self.rowCount())]
+
+    def set_filter_text(self, text: str):
+        """Only show the isotherms with a name or metadata matching a text."""
+        self.filter_text = text
+        self._matches = {id(item) for item in self.sourceModel().search(text)} if text else set()
+        self.invalidateFilter()
+
+    def set_sort_key(self, key: str = None, order=QC.Qt.AscendingOrder):
+        """Sort by one of the item keys, or in loading order if None."""
+        self.sort_key = key
+        self.resort(order)
+
+    def resort(self, order=None):
+        """Sort again, such as after items were added."""
+        if order is None:
+            order = self.sortOrder()
+        if self.sort_key is None:
+            self.sort(-1)
+        else:
+            self.sort(0, order)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        """Accept items matching the filter text."""
+        if not self.filter_text:
+            return True
+        model = self.sourceModel()
+        item = model.item(source_row)
+        if model.is_indexed(item):
+            return id(item) in self._matches
+        return model.matches(item, self.filter_text)
+
+    def lessThan(self, left, right):
+        """Compare items through their cached sort keys."""
+        model = self.sourceModel()
+        left_key = model.item_keys(model.itemFromIndex(left))[self.sort_key]
+        right_key = model.item_keys(model.itemFromIndex(right))[self.sort_key]
+        return left_key < right_key
@@ -1,9 +1,59 @@
+import os
+
 from qtpy import QtCore as QC
 from qtpy import QtGui as QG
 
 import pygaps as pg
+from pygaps.units.converter_mode import c_temperature
 from pygapsgui.utilities.color_theme import COLORS
 
+#: Keys by which isotherm items can be sorted
+SORT_KEYS = ("name", "material", "adsorbate", "temperature", "date", "BET area")
+
+
+def search_strings(summary: dict) -> list:
+    """Strings through which an isotherm is found in a search."""
+    properties = summary["properties"]
+    return [
+        summary["name"],
+        summary["material"],
+        summary["adsorbate"],
+        f"{summary['temperature']:g} {summary['temperature_unit']}",
+        *map(str, properties.keys()),
+        *map(str, properties.values()),
+    ]
+
+
+def sort_keys(summary: dict) -> dict:
+    """
+    Values by which an isotherm is sorted, for each of `SORT_KEYS`.
+
+    Each value is a tuple whose first element is True if it is missing,
+    so that isotherms without a date or BET area come last.
+    """
+    properties = summary["properties"]
+    try:
+        temperature = c_temperature(summary["temperature"], summary["temperature_unit"], "K")
+    except Exception:  # pylint: disable=broad-except
+        temperature = None
+    date = str(properties.get("date", ""))
+    bet_area = None
+    for key, value in properties.items():
+        if str(key).startswith("BET area"):
+            try:
+                bet_area = float(value)
+            except (TypeError, ValueError):
+                pass
+            break
+    return {
+        "name": (False, summary["name"].casefold()),
+        "material": (False, summary["material"].casefold()),
+        "adsorbate": (False, summary["adsorbate"].casefold()),
+        "temperature": (temperature is None, temperature or 0),
+        "date": (not date, date),
+        "BET area": (bet_area is None, bet_area or 0),
+    }
+
 
 class IsoModel(QG.QStandardItem):
     """Overloading a standard item to store an isotherm."""
@@ -24,3 +74,128 @@ class IsoModel(QG.QStandardItem):
         if isinstance(isotherm, pg.ModelIsotherm):
             self.setForeground(QG.QColor(COLORS['primary-lighter']))
         super().setData(isotherm, *args, **kwargs)
+
+    def summary(self) -> dict:
+        """Name and metadata of the isotherm, as in a cached isotherm header."""
+        isotherm = self.data()
+        return {
+            "name": self.text(),
+            "material": str(isotherm.material),
+            "adsorbate": str(isotherm.adsorbate),
+            "temperature": isotherm._temperature,
+            "temperature_unit": isotherm.temperature_unit,
+            "properties": isotherm.properties,
+        }
+
+    def search_strings(self) -> list:
+        """Name and metadata through which the isotherm can be searched."""
+        return search_strings(self.summary())
+
+
+class LazyIsoModel(IsoModel):
+    """
+    An isotherm item which only holds the full isotherm while it is needed.
+
+    The item stores the path it was loaded from and a small header
+    (material, adsorbate, temperature). The isotherm is loaded the first
+    time the item data is requested, for example when it is selected,
+    checked or analysed, and can later be released by the list model
+    to save memory. Items which were modified are pinned in memory,
+    as they no longer match their file, as are items whose file has
+    changed or disappeared since they were loaded.
+
+    If the isotherm cannot be loaded, the item is marked as broken,
+    its data is None and the error is reported once.
+    """
+
+    pinned = False
+    broken = False
+
+    def __init__(self, name, path, header, loader, *args, **kwargs):
+        super().__init__(name, *args, **kwargs)
+        self.path = path
+        self.header = header
+        self.loader = loader
+        self._isotherm = None
+        self._stamp = None  # file stamp when the isotherm was loaded
+        if header["model"]:
+            self.setForeground(QG.QColor(COLORS['primary-lighter']))
+        self.setToolTip(
+            f"{header['material']} | {header['adsorbate']} | "
+            f"{header['temperature']:g} {header['temperature_unit']}"
+        )
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the full isotherm is in memory."""
+        return self._isotherm is not None
+
+    def file_stamp(self):
+        """Modification time and size of the source file, or None if it cannot be read."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def isotherm(self):
+        """Return the full isotherm, loading it if needed, or None if it cannot be loaded."""
+        if self._isotherm is None:
+            if self.broken:
+                return None
+            try:
+                self._stamp = self.file_stamp()
+                self._isotherm = self.loader(self.path)
+                if self._isotherm is None:
+                    raise ValueError("No isotherm found.")
+            except Exception as err:  # pylint: disable=broad-except
+                self.mark_broken(err)
+                return None
+        model = self.model()
+        if model:
+            model.touch_lazy(self)
+        return self._isotherm
+
+    def mark_broken(self, error):
+        """Mark the item as impossible to load and report why."""
+        from pygapsgui.widgets.UtilityDialogs import error_dialog
+        self.broken = True
+        self.setForeground(QG.QColor(COLORS['disabled-fg']))
+        self.setToolTip(f"Could not load {self.path}: {error}")
+        # not reported from within the item view or model code requesting the data
+        QC.QTimer.singleShot(0, lambda: error_dialog(f"Could not load isotherm {self.text()}:<br>{error}"))
+
+    def relink(self, path, loader):
+        """Read the isotherm from another file from now on, such as a newly saved session."""
+        self.path = path
+        self.loader = loader
+        if self._isotherm is not None:
+            self._stamp = self.file_stamp()
+
+    def summary(self) -> dict:
+        """Name and metadata of the isotherm, from the header unless it was modified."""
+        if self.pinned:
+            return super().summary()
+        return {"properties": {}, **self.header, "name": self.text()}
+
+    def release(self):
+        """Drop the full isotherm from memory, unless pinned or it could not be read back."""
+        if self.pinned or self._isotherm is None:
+            return
+        if self.file_stamp() != self._stamp:
+            # the file changed or disappeared: keep the copy the user has seen
+            self.pinned = True
+            return
+        self._isotherm = None
+
+    def data(self, role=QC.Qt.UserRole + 1):
+        if role == QC.Qt.UserRole + 1:
+            return self.isotherm()
+        return super().data(role)
+
+    def setData(self, isotherm, role=QC.Qt.UserRole + 1):
+        if role == QC.Qt.UserRole + 1:
+            self._isotherm = isotherm
+            self.pinned = True
+            return
+        super().setData(isotherm, role)
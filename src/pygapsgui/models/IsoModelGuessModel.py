@@ -4,8 +4,9 @@ from qtpy import QtWidgets as QW
 from pygaps import ModelIsotherm
 from pygaps.modelling import _GUESS_MODELS
 from pygaps.modelling import _MODELS
-from pygaps.utilities.exceptions import CalculationError
-from pygapsgui.utilities.log_hook import log_hook
+from pygaps.modelling import model_from_dict
+from pygapsgui.utilities.batch import fit_model
+from pygapsgui.utilities.worker import ProcessRunner
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -26,8 +27,10 @@ class IsoModelGuessModel():
     branch = "ads"
     limits = None
     auto = True
+    timeout = 30  # seconds, for each model
 
     # Results
+    failures = None
     output = ""
     success = True
 
@@ -56,6 +59,7 @@ class IsoModelGuessModel():
             self.view.model_list.addItem(item)
         self.view.branch_dropdown.addItems(["ads", "des"])
         self.view.branch_dropdown.setCurrentText(self.branch)
+        self.view.timeout_input.setValue(self.timeout)
 
         # plot setup
         self.view.iso_graph.branch = self.branch
@@ -63,10 +67,18 @@ class IsoModelGuessModel():
         self.view.iso_graph.set_isotherms([self.isotherm])
         self.limits = self.view.iso_graph.x_range
 
+        # models are fit in parallel processes
+        self.runner = ProcessRunner(parent=self.view)
+        self.runner.result.connect(self.handle_fit)
+        self.runner.failed.connect(self.handle_fit_failed)
+        self.runner.finished.connect(self.handle_fit_finished)
+        self.view.finished.connect(self.runner.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.x_select.slider.rangeChanged.connect(self.calculate_with_limits)
         self.view.calc_auto_button.clicked.connect(self.calculate_auto)
+        self.view.calc_cancel_button.clicked.connect(self.calculate_cancel)
 
         # populate initial
         self.prepare_values()
@@ -92,9 +104,9 @@ class IsoModelGuessModel():
         """Automatic calculation."""
         self.auto = True
         if self.calculate():
-            self.output_log()
+            self.view.calc_auto_button.setEnabled(False)
+            self.view.calc_cancel_button.setEnabled(True)
             self.output_results()
-            self.plot_results()
         else:
             self.output_log()
             self.plot_clear()
@@ -104,47 +116,59 @@ class IsoModelGuessModel():
         self.limits = [left, right]
         self.prepare_values()
 
+    def calculate_cancel(self):
+        """Stop fitting, keeping the models fit so far."""
+        self.runner.cancel()
+        self.failures.append('<font color="red">Fitting cancelled.</font>')
+        self.handle_fit_finished()
+
     def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+        """Start fitting each checked model in a separate process."""
         self.model_attempts = []
+        self.model_isotherm = None
+        self.failures = []
         checked_models = [
             self.view.model_list.item(row).data(QC.Qt.DisplayRole)
             for row in range(self.view.model_list.count())
             if self.view.model_list.item(row).checkState() == QC.Qt.Checked
         ]
-        with log_hook:
-            try:
-                for model in checked_models:
-                    try:
-                        isotherm = ModelIsotherm(
-                            pressure=self.pressure,
-                            loading=self.loading,
-                            branch=self.branch,
-                            model=model,
-                            verbose=True,
-                            plot_fit=False,
-                            **self.iso_params,
-                        )
-                        self.model_attempts.append(isotherm)
-                    except CalculationError as err:
-                        log_hook.logger.info(
-                            f'<font color="red">Modelling using {model} failed.</font>'
-                        )
-                # We catch any errors or warnings and display them to the user
-            except Exception as err:
-                self.output += f'<font color="red">Model fitting failed! <br> {err}</font>'
-                return False
-            self.output += log_hook.get_logs()
-
-            if not self.model_attempts:
-                self.output += '<font color="red">No model could be reliably fit on the isotherm.</font><br>'
-                return False
-
-            errors = [x.model.rmse for x in self.model_attempts]
-            self.model_isotherm = self.model_attempts[errors.index(min(errors))]
-            self.output += f'<font color="green">Best model fit is {self.model_isotherm.model.name}.</font><br>'
-            self.output += self.model_isotherm.model.__str__().replace("\n", "<br>")
-            return True
+        if not checked_models:
+            self.output += '<font color="red">Select at least one model to fit.</font><br>'
+            return False
+
+        self.runner.timeout = self.view.timeout_input.value()
+        self.runner.run({
+            model: (fit_model, (self.iso_params, self.pressure, self.loading, self.branch, model))
+            for model in checked_models
+        })
+        return True
+
+    def handle_fit(self, model, model_dict):
+        """Add a successful fit, keeping fits ranked by their RMSE."""
+        isotherm = ModelIsotherm(
+            model=model_from_dict(model_dict),
+            branch=self.branch,
+            **self.iso_params,
+        )
+        self.model_attempts.append(isotherm)
+        self.model_attempts.sort(key=lambda iso: iso.model.rmse)
+        if self.model_attempts[0] is not self.model_isotherm:
+            self.model_isotherm = self.model_attempts[0]
+            self.plot_results()
+        self.output_results()
+
+    def handle_fit_failed(self, model, error):
+        """Record a failed fit."""
+        self.failures.append(f'<font color="red">Modelling using {model} failed: {error}</font>')
+        self.output_results()
+
+    def handle_fit_finished(self):
+        """Display the best fit once all models are done."""
+        self.view.calc_auto_button.setEnabled(True)
+        self.view.calc_cancel_button.setEnabled(False)
+        self.output_results()
+        if not self.model_attempts:
+            self.plot_clear()
 
     def plot_results(self):
         """Fill in any GUI plots with results."""
@@ -157,7 +181,19 @@ class IsoModelGuessModel():
 
     def output_results(self):
         """Fill in any GUI text output with results"""
-        pass
+        for rank, isotherm in enumerate(self.model_attempts, 1):
+            self.output += f'{rank}. {isotherm.model.name}: RMSE is {isotherm.model.rmse:.3g}<br>'
+        for failure in self.failures:
+            self.output += f'{failure}<br>'
+
+        if self.runner.is_running():
+            self.output += f'<font color="gray">Fitting ({self.runner.done}/{self.runner.total})...</font><br>'
+        elif not self.model_attempts:
+            self.output += '<font color="red">No model could be reliably fit on the isotherm.</font><br>'
+        else:
+            self.output += f'<font color="green">Best model fit is {self.model_isotherm.model.name}.</font><br>'
+            self.output += self.model_isotherm.model.__str__().replace("\n", "<br>")
+        self.output_log()
 
     def output_log(self):
         """Output text or dialog error/warning/info."""
@@ -171,6 +207,9 @@ class IsoModelGuessModel():
 
     def select_branch(self):
         """Handle isotherm branch selection."""
+        self.runner.cancel()
+        self.view.calc_auto_button.setEnabled(True)
+        self.view.calc_cancel_button.setEnabled(False)
         self.branch = self.view.branch_dropdown.currentText()
         self.view.iso_graph.branch = self.branch
         self.model_isotherm = None
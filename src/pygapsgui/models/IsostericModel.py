@@ -2,7 +2,10 @@ import numpy
 
 from pygaps.characterisation.isosteric_enth import isosteric_enthalpy
 from pygaps.graphing.calc_graphs import isosteric_enthalpy_plot
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import isosteric_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -45,6 +48,11 @@ class IsostericModel():
         self.view.iso_graph.lgd_keys = ["temperature"]
         self.view.iso_graph.set_isotherms(self.isotherms)
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         self.view.points_input.lineEdit().editingFinished.connect(self.select_points)
@@ -59,24 +67,24 @@ class IsostericModel():
         self.calc_auto()
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
         self.loading_points = None
-        if self.calculate():
-            self.limits = (self.results["loading"][0], self.results["loading"][-1])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.branch, self.loading_points)
 
     def calc_with_limits(self, down, up):
         """Set limits on calculation."""
         self.limits = [down, up]
         self.loading_points = numpy.linspace(down, up, self.loading_point_no)
-        if self.calculate():
+        self.scheduler.request(self.branch, self.loading_points)
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (self.results["loading"][0], self.results["loading"][-1])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -84,22 +92,30 @@ class IsostericModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, branch, loading_points):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
             try:
-                self.results = isosteric_enthalpy(
+                results = calc_cache.call(
+                    isosteric_enthalpy,
                     self.isotherms,
-                    branch=self.branch,
-                    loading_points=self.loading_points,
+                    branch=branch,
+                    loading_points=loading_points,
                 )
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                self.limits = None
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            self.limits = None
+            return False
+        self.results = results
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -157,14 +173,11 @@ class IsostericModel():
             error_dialog("No results to export.")
             return
         from pygapsgui.utilities.result_export import serialize
-        results = {
-            f"Loading [{self.isotherms[0].loading_unit}/{self.isotherms[0].material_unit}]":
-            self.results.get("loading"),
-            "Isosteric Enthalpy [kJ/mol]":
-            self.results.get("isosteric_enthalpy"),
-            "Standard Error [kJ/mol]":
-            self.results.get("std_errs"),
-        }
+        results = isosteric_results(
+            self.isotherms[0].loading_unit,
+            self.isotherms[0].material_unit,
+            self.results,
+        )
         serialize(results, how="V", parent=self.view)
 
     def help_dialog(self):
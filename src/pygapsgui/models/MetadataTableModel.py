@@ -1,8 +1,21 @@
 from qtpy import QtCore as QC
 
+from pygapsgui.models.TableCommands import InsertEntriesCommand
+from pygapsgui.models.TableCommands import RemoveEntriesCommand
+from pygapsgui.models.TableCommands import ReplaceEntryCommand
+from pygapsgui.models.TableCommands import push_command
+
 
 class MetadataTableModel(QC.QAbstractTableModel):
-    """Table model to display various coreclass (Isotherm, Adsorbate, Material) properties."""
+    """
+    Table model to display various coreclass (Isotherm, Adsorbate, Material) properties.
+
+    Edits are commands which are pushed to `undo_stack` if one is set,
+    and which store only the entries they change.
+    """
+
+    undo_stack = None
+
     def __init__(self, coreclass, parent=None):
         super().__init__(parent)
 
@@ -70,33 +83,22 @@ class MetadataTableModel(QC.QAbstractTableModel):
             return False
 
         if role == QC.Qt.EditRole:
-            if index.column() == 0:
-                if value not in [p[0] for p in self.params]:
-                    self.params.insert(index.row(), [value, None, None])
-
-            if index.column() == 1:
-                self.coreclass.properties[self.params[index.row()][0]] = value
-
-            self.params[index.row()][index.column()] = value
-
-            self.dataChanged.emit(index, index)
+            entry = list(self.params[index.row()])
+            entry[index.column()] = value
+            self.setRowData(index.row(), entry)
             return True
 
         return False
 
     def setRowData(self, row, data):
         """Set data of a whole row."""
-        for col in range(len(data)):
-            index = self.createIndex(row, col)
-            self.setData(index, data[col], role=QC.Qt.EditRole)
+        old = list(self.params[row])
+        if list(data) != old:
+            push_command(ReplaceEntryCommand(self, row, old, list(data)), self.undo_stack)
 
     def removeRows(self, position, rows=1, index=QC.QModelIndex()):
         """Delete a row from the model. Removes attribute from coreclass."""
-        self.beginRemoveRows(index, position, position + rows - 1)
-        for row in range(rows):
-            del self.coreclass.properties[self.params[position + row][0]]
-        del self.params[position:position + rows]
-        self.endRemoveRows()
+        push_command(RemoveEntriesCommand(self, position, rows), self.undo_stack)
         return True
 
     def insertRow(self, position, data, parent=QC.QModelIndex()):
@@ -108,12 +110,37 @@ class MetadataTableModel(QC.QAbstractTableModel):
         if not data or count != len(data):
             return False
 
-        for row, datarow in enumerate(data):
-            self.beginInsertRows(parent, position + row, position + row + count - 1)
-            self.setRowData(position + row, datarow)
-            self.endInsertRows()
+        entries = [list(datarow) for datarow in data]
+        push_command(InsertEntriesCommand(self, position, entries), self.undo_stack)
         return True
 
+    def _insert_entries(self, row, entries):
+        """Insert [name, value, type] entries, adding them to the coreclass."""
+        self.beginInsertRows(QC.QModelIndex(), row, row + len(entries) - 1)
+        for entry in entries:
+            self.coreclass.properties[entry[0]] = entry[1]
+        self.params[row:row] = [list(entry) for entry in entries]
+        self.endInsertRows()
+
+    def _remove_entries(self, row, count):
+        """Remove entries, deleting them from the coreclass, and return them."""
+        entries = [list(entry) for entry in self.params[row:row + count]]
+        self.beginRemoveRows(QC.QModelIndex(), row, row + count - 1)
+        for entry in entries:
+            self.coreclass.properties.pop(entry[0], None)
+        del self.params[row:row + count]
+        self.endRemoveRows()
+        return entries
+
+    def _replace_entry(self, row, entry):
+        """Replace an entry, renaming the coreclass property if needed."""
+        name = self.params[row][0]
+        if name != entry[0]:
+            self.coreclass.properties.pop(name, None)
+        self.coreclass.properties[entry[0]] = entry[1]
+        self.params[row] = list(entry)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 2))
+
     def setOrInsertRow(self, data, parent=QC.QModelIndex()):
         """Convenience for combined row set/insert."""
         metaNames = [p[0] for p in self.params]
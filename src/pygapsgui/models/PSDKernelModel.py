@@ -2,7 +2,10 @@ from pygaps.characterisation.psd_kernel import psd_dft
 from pygaps.data import KERNELS
 from pygaps.graphing.calc_graphs import psd_plot
 from pygaps.utilities.exceptions import CalculationError
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import psd_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -50,6 +53,11 @@ class PSDKernelModel():
         self.view.iso_graph.loading_unit = "mmol"
         self.view.iso_graph.set_isotherms([self.isotherm])
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.calc_auto_button.clicked.connect(self.calc_auto)
         self.view.x_select.slider.rangeChanged.connect(self.calc_with_limits)
@@ -66,25 +74,25 @@ class PSDKernelModel():
         self.calc_auto()
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (
-                self.pressure[self.limit_indices[0]],
-                self.pressure[self.limit_indices[1]],
-            )
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.limits, self.read_settings())
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.limits, self.read_settings())
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (
+                    self.pressure[self.limit_indices[0]],
+                    self.pressure[self.limit_indices[1]],
+                )
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -97,27 +105,41 @@ class PSDKernelModel():
         # Pressure
         self.pressure = self.isotherm.pressure(branch=self.branch)
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def read_settings(self) -> dict:
+        """Read calculation settings from the view, in the GUI thread."""
+        self.branch = self.view.branch_dropdown.currentText()
+        self.kernel = self.view.kernel_dropdown.currentText()
+        self.bspline_order = int(self.view.smooth_input.cleanText())
+        return {
+            "branch": self.branch,
+            "kernel": self.kernel,
+            "bspline_order": self.bspline_order,
+        }
+
+    def calculate(self, limits, settings):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
-            self.branch = self.view.branch_dropdown.currentText()
-            self.kernel = self.view.kernel_dropdown.currentText()
-            self.bspline_order = int(self.view.smooth_input.cleanText())
             try:
-                self.results = psd_dft(
+                results = calc_cache.call(
+                    psd_dft,
                     self.isotherm,
-                    branch=self.branch,
-                    kernel=self.kernel,
-                    bspline_order=self.bspline_order,
-                    p_limits=self.limits,
+                    p_limits=limits,
+                    **settings,
                 )
-                self.limit_indices = self.results.get('limits')
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results = results
+        self.limit_indices = self.results.get('limits')
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -165,6 +187,7 @@ class PSDKernelModel():
 
     def select_branch(self):
         """Handle isotherm branch selection."""
+        self.scheduler.cancel()
         self.branch = self.view.branch_dropdown.currentText()
         self.view.iso_graph.branch = self.branch
         self.plot_clear()
@@ -172,14 +195,7 @@ class PSDKernelModel():
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            "Pore widths [nm]":
-            self.results.get("pore_widths"),
-            "Pore distribution [dV/dW]":
-            self.results.get("pore_distribution"),
-            "Pore cumulative volume [cm3/{self.isotherm.material_unit}]":
-            self.results.get("pore_volume_cumulative"),
-        }
+        return psd_results(self.isotherm.material_unit, self.results)
 
     def export_results(self):
         """Save results as a file."""
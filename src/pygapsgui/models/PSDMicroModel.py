@@ -4,7 +4,10 @@ from pygaps.characterisation.psd_micro import _PORE_GEOMETRIES
 from pygaps.characterisation.psd_micro import psd_microporous
 from pygaps.graphing.calc_graphs import psd_plot
 from pygaps.utilities.exceptions import CalculationError
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import psd_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -65,6 +68,11 @@ class PSDMicroModel():
         self.view.iso_graph.pressure_mode = "relative"
         self.view.iso_graph.set_isotherms([self.isotherm])
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.calc_auto_button.clicked.connect(self.calc_auto)
         self.view.x_select.slider.rangeChanged.connect(self.calc_with_limits)
@@ -79,25 +87,25 @@ class PSDMicroModel():
         self.calc_auto()
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            pressure = self.isotherm.pressure(branch=self.branch, pressure_mode="relative")
-            if self.branch == 'des':
-                pressure = pressure[::-1]
-            self.limits = (pressure[self.limit_indices[0]], pressure[self.limit_indices[1]])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.limits, self.read_settings())
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.limits, self.read_settings())
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                pressure = self.isotherm.pressure(branch=self.branch, pressure_mode="relative")
+                if self.branch == 'des':
+                    pressure = pressure[::-1]
+                self.limits = (pressure[self.limit_indices[0]], pressure[self.limit_indices[1]])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -105,29 +113,42 @@ class PSDMicroModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def read_settings(self) -> dict:
+        """Read calculation settings from the view, in the GUI thread."""
+        self.psd_model = self.view.model_dropdown.currentText()
+        self.material_model = self.view.amodel_dropdown.currentText()
+        self.pore_geometry = self.view.geometry_dropdown.currentText()
+        return {
+            "branch": self.branch,
+            "psd_model": self.psd_model,
+            "pore_geometry": self.pore_geometry,
+            "material_model": self.material_model,
+        }
+
+    def calculate(self, limits, settings):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
-            self.psd_model = self.view.model_dropdown.currentText()
-            self.material_model = self.view.amodel_dropdown.currentText()
-            self.pore_geometry = self.view.geometry_dropdown.currentText()
             try:
-                self.results = psd_microporous(
+                results = calc_cache.call(
+                    psd_microporous,
                     self.isotherm,
-                    branch=self.branch,
-                    psd_model=self.psd_model,
-                    pore_geometry=self.pore_geometry,
-                    material_model=self.material_model,
-                    p_limits=self.limits,
+                    p_limits=limits,
+                    **settings,
                 )
-                self.limit_indices = self.results.get('limits')
-
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results = results
+        self.limit_indices = self.results.get('limits')
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -171,20 +192,14 @@ class PSDMicroModel():
 
     def select_branch(self):
         """Handle isotherm branch selection."""
+        self.scheduler.cancel()
         self.branch = self.view.branch_dropdown.currentText()
         self.view.iso_graph.branch = self.branch
         self.plot_clear()
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            "Pore widths [nm]":
-            self.results.get("pore_widths"),
-            "Pore distribution [dV/dW]":
-            self.results.get("pore_distribution"),
-            "Pore cumulative volume [cm3/{self.isotherm.material_unit}]":
-            self.results.get("pore_volume_cumulative"),
-        }
+        return psd_results(self.isotherm.material_unit, self.results)
 
     def export_results(self):
         """Save results as a file."""
@@ -7,7 +7,10 @@ from pygaps.characterisation.area_lang import area_langmuir
 from pygaps.graphing.calc_graphs import tp_plot
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import linear_region_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -72,6 +75,11 @@ class PlotAlphaSModel():
         self.view.refbranch_dropdown.addItems(["ads", "des"])
         self.view.refbranch_dropdown.setCurrentText(self.ref_branch)
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.refarea_dropdown.currentTextChanged.connect(self.select_area)
         self.view.refarea_input.editingFinished.connect(self.select_area_specify)
@@ -133,22 +141,32 @@ class PlotAlphaSModel():
             return True
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (0, self.alphas_curve[-1])
-            self.slider_reset()
-            self.output_results()
-            self.output_log()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.request()
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.request()
+
+    def request(self):
+        """Request a calculation with the current values and limits."""
+        self.scheduler.request(
+            self.loading,
+            self.reference_loading,
+            self.alpha_s_point,
+            self.reference_area,
+            self.limits,
+        )
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (0, self.alphas_curve[-1])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -156,26 +174,34 @@ class PlotAlphaSModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, loading, reference_loading, alpha_s_point, reference_area, limits):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
             try:
-                self.results, self.alphas_curve = alpha_s_raw(
-                    self.loading,
-                    self.reference_loading,
-                    self.alpha_s_point,
-                    self.reference_area,
+                results = calc_cache.call(
+                    alpha_s_raw,
+                    loading,
+                    reference_loading,
+                    alpha_s_point,
+                    reference_area,
                     self.liquid_density,
                     self.molar_mass,
-                    t_limits=self.limits,
+                    t_limits=limits,
                 )
 
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results, self.alphas_curve = results
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -230,6 +256,7 @@ class PlotAlphaSModel():
 
     def select_area(self, area_type):
         """Handle reference area selection."""
+        self.scheduler.cancel()
         with log_hook:
             if area_type == "BET":
                 self.reference_area = area_BET(self.ref_isotherm).get('area')
@@ -248,6 +275,7 @@ class PlotAlphaSModel():
 
     def select_area_specify(self):
         """Use area specified by user."""
+        self.scheduler.cancel()
         ref_area_str = self.view.refarea_input.text()
         if not ref_area_str:
             return
@@ -257,39 +285,28 @@ class PlotAlphaSModel():
 
     def select_branch(self, branch):
         """Handle isotherm branch selection."""
+        self.scheduler.cancel()
         self.branch = branch
         if self.prepare_values():
             self.calc_auto()
 
     def select_refbranch(self, branch):
         """Handle reference isotherm branch selection."""
+        self.scheduler.cancel()
         self.ref_branch = branch
         if self.prepare_values():
             self.calc_auto()
 
     def select_redpressure(self):
         """Handle reducing pressure selection."""
+        self.scheduler.cancel()
         self.reducing_pressure = float(self.view.pressure_input.text())
         if self.prepare_values():
             self.calc_auto()
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            e: {
-                f"Alpha S pore volume [cm3/{self.isotherm.material_unit}]":
-                result.get("adsorbed_volume"),
-                f"Alpha S area [m2/{self.isotherm.material_unit}]":
-                result.get("area"),
-                "Alpha S R^2":
-                result.get("corr_coef"),
-                "Alpha S slope":
-                result.get("slope"),
-                "Alpha S intercept":
-                result.get("intercept"),
-            }
-            for e, result in enumerate(self.results)
-        }
+        return linear_region_results("Alpha S", self.isotherm.material_unit, self.results)
 
     def export_results(self):
         """Save results as a file."""
@@ -7,7 +7,10 @@ from pygaps.characterisation.t_plots import t_plot_raw
 from pygaps.graphing.calc_graphs import tp_plot
 from pygaps.utilities.exceptions import CalculationError
 from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.log_hook import log_hook
+from pygapsgui.utilities.result_dicts import linear_region_results
+from pygapsgui.utilities.worker import RecalcScheduler
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
@@ -68,6 +71,11 @@ class PlotTModel():
         models.remove("zero thickness")  # Not an option
         self.view.thickness_dropdown.addItems(models)
 
+        # background recalculation when limits change
+        self.scheduler = RecalcScheduler(self.calculate, self.show_results, parent=self.view)
+        self.scheduler.busy.connect(self.view.accept_btn.setDisabled)
+        self.view.finished.connect(self.scheduler.cancel)
+
         # connect signals
         self.view.branch_dropdown.currentIndexChanged.connect(self.select_branch)
         # TODO: add the ability for custom callable models
@@ -100,22 +108,22 @@ class PlotTModel():
         )
 
     def calc_auto(self):
-        """Automatic calculation."""
+        """Automatic calculation, choosing the limits."""
         self.limits = None
-        if self.calculate():
-            self.limits = (0, self.t_curve[-1])
-            self.slider_reset()
-            self.output_log()
-            self.output_results()
-            self.plot_results()
-        else:
-            self.output_log()
-            self.plot_clear()
+        self.scheduler.request(self.pressure, self.loading, self.thickness_model, self.limits)
 
     def calc_with_limits(self, left, right):
         """Set limits on calculation."""
         self.limits = [left, right]
-        if self.calculate():
+        self.scheduler.request(self.pressure, self.loading, self.thickness_model, self.limits)
+
+    def show_results(self, outcome):
+        """Display the results of a calculation."""
+        if self.store_results(outcome):
+            if self.limits is None:
+                # automatic calculation, show the limits chosen
+                self.limits = (0, self.t_curve[-1])
+                self.slider_reset()
             self.output_log()
             self.output_results()
             self.plot_results()
@@ -123,24 +131,32 @@ class PlotTModel():
             self.output_log()
             self.plot_clear()
 
-    def calculate(self):
-        """Call pyGAPS to perform main calculation."""
+    def calculate(self, pressure, loading, thickness_model, limits):
+        """Call pyGAPS to perform main calculation, returning the results and logs."""
         with log_hook:
             try:
-                self.results, self.t_curve = t_plot_raw(
-                    self.loading,
-                    self.pressure,
-                    self.thickness_model,
+                results = calc_cache.call(
+                    t_plot_raw,
+                    loading,
+                    pressure,
+                    thickness_model,
                     self.liquid_density,
                     self.molar_mass,
-                    t_limits=self.limits,
+                    t_limits=limits,
                 )
             # We catch any errors or warnings and display them to the user
             except Exception as e:
-                self.output += f'<font color="red">Calculation failed! <br> {e}</font>'
-                return False
-            self.output += log_hook.get_logs()
-            return True
+                return None, f'<font color="red">Calculation failed! <br> {e}</font>'
+            return results, log_hook.get_logs()
+
+    def store_results(self, outcome) -> bool:
+        """Store the results and logs of a calculation, returning whether it succeeded."""
+        results, logs = outcome
+        self.output += logs
+        if results is None:
+            return False
+        self.results, self.t_curve = results
+        return True
 
     def output_results(self):
         """Fill in any GUI text output with results"""
@@ -205,17 +221,7 @@ class PlotTModel():
 
     def result_dict(self):
         """Return a dictionary of results."""
-        return {
-            e: {
-                f"t-plot pore volume [cm3/{self.isotherm.material_unit}]":
-                result.get("adsorbed_volume"),
-                f"t-plot area [m2/{self.isotherm.material_unit}]": result.get("area"),
-                "t-plot R^2": result.get("corr_coef"),
-                "t-plot slope": result.get("slope"),
-                "t-plot intercept": result.get("intercept"),
-            }
-            for e, result in enumerate(self.results)
-        }
+        return linear_region_results("t-plot", self.isotherm.material_unit, self.results)
 
     def export_results(self):
         """Save results as a file."""
@@ -0,0 +1,228 @@
+"""
+Undoable edits of table models.
+
+Each command only stores the part of the table it changes: the old and new
+values of the edited cells, the removed rows or columns, or the names of a
+renamed column. Undoing a paste into a large table therefore costs as much
+memory as the pasted block, not a copy of the table.
+
+The commands call private primitives of the models (`_write_block`,
+`_insert_rows`, ...), which do the edit and notify the views, without
+recording anything themselves.
+"""
+
+from qtpy import QtGui as QG
+from qtpy import QtWidgets as QW
+
+# QUndoStack moved to QtGui in Qt6
+QUndoStack = getattr(QW, "QUndoStack", None) or QG.QUndoStack
+
+#: Edits kept by an undo stack
+UNDO_LIMIT = 200
+
+
+def make_undo_stack(parent=None):
+    """Create an undo stack with a bounded number of edits."""
+    stack = QUndoStack(parent)
+    stack.setUndoLimit(UNDO_LIMIT)
+    return stack
+
+
+def push_command(command, stack=None):
+    """Apply a command, through the undo stack if there is one."""
+    if stack is None:
+        command.redo()
+    else:
+        stack.push(command)
+
+
+class SetBlockCommand(QW.QUndoCommand):
+    """Replace a block of cells, storing the old and new values of each column of the block."""
+    def __init__(self, model, row, col, old, new, text="Edit cells", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.col = col
+        self.old = old
+        self.new = new
+
+    def redo(self):
+        """Write the new values."""
+        self.model._write_block(self.row, self.col, self.new)
+
+    def undo(self):
+        """Write back the old values."""
+        self.model._write_block(self.row, self.col, self.old)
+
+
+class InsertRowsCommand(QW.QUndoCommand):
+    """Insert rows, given as one array per column."""
+    def __init__(self, model, row, columns, text="Insert rows", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.columns = columns
+
+    def redo(self):
+        """Insert the rows."""
+        self.model._insert_rows(self.row, self.columns)
+
+    def undo(self):
+        """Remove the inserted rows."""
+        self.model._remove_rows(self.row, len(self.columns[0]))
+
+
+class RemoveRowsCommand(QW.QUndoCommand):
+    """Remove rows, keeping only the removed values to restore them."""
+    def __init__(self, model, row, count, text="Remove rows", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.count = count
+        self.columns = None
+
+    def redo(self):
+        """Remove the rows."""
+        self.columns = self.model._remove_rows(self.row, self.count)
+
+    def undo(self):
+        """Insert the removed rows back."""
+        self.model._insert_rows(self.row, self.columns)
+        self.columns = None
+
+
+class InsertColumnsCommand(QW.QUndoCommand):
+    """Insert named columns."""
+    def __init__(self, model, col, names, columns, text="Insert columns", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.col = col
+        self.names = names
+        self.columns = columns
+
+    def redo(self):
+        """Insert the columns."""
+        self.model._insert_columns(self.col, self.names, self.columns)
+
+    def undo(self):
+        """Remove the inserted columns."""
+        self.model._remove_columns(self.col, len(self.names))
+
+
+class RemoveColumnsCommand(QW.QUndoCommand):
+    """Remove columns, keeping only the removed columns to restore them."""
+    def __init__(self, model, col, count, text="Remove columns", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.col = col
+        self.count = count
+        self.names = None
+        self.columns = None
+
+    def redo(self):
+        """Remove the columns."""
+        self.names, self.columns = self.model._remove_columns(self.col, self.count)
+
+    def undo(self):
+        """Insert the removed columns back."""
+        self.model._insert_columns(self.col, self.names, self.columns)
+        self.names = self.columns = None
+
+
+class RenameColumnCommand(QW.QUndoCommand):
+    """Change the name of a column."""
+    def __init__(self, model, col, old, new, text="Rename column", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.col = col
+        self.old = old
+        self.new = new
+
+    def redo(self):
+        """Set the new name."""
+        self.model._rename_column(self.col, self.new)
+
+    def undo(self):
+        """Set the old name."""
+        self.model._rename_column(self.col, self.old)
+
+
+class PasteCommand(QW.QUndoCommand):
+    """
+    Paste a block of cells, adding rows past the end of the table if needed.
+
+    The block edit and the row insertion are kept as attributes rather than
+    child commands, as PySide would not keep children alive.
+    """
+    def __init__(self, model, row, col, old, new, appended=None, text="Paste", parent=None):
+        super().__init__(text, parent)
+        self.set_block = SetBlockCommand(model, row, col, old, new, text)
+        self.insert_rows = None
+        if appended is not None:
+            self.insert_rows = InsertRowsCommand(model, row + len(old[0]), appended, text)
+
+    def redo(self):
+        """Write the block, then add the rows past the end."""
+        self.set_block.redo()
+        if self.insert_rows is not None:
+            self.insert_rows.redo()
+
+    def undo(self):
+        """Remove the added rows, then write back the block."""
+        if self.insert_rows is not None:
+            self.insert_rows.undo()
+        self.set_block.undo()
+
+
+class InsertEntriesCommand(QW.QUndoCommand):
+    """Insert metadata entries, as [name, value, type] rows."""
+    def __init__(self, model, row, entries, text="Insert metadata", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.entries = entries
+
+    def redo(self):
+        """Insert the entries."""
+        self.model._insert_entries(self.row, self.entries)
+
+    def undo(self):
+        """Remove the inserted entries."""
+        self.model._remove_entries(self.row, len(self.entries))
+
+
+class RemoveEntriesCommand(QW.QUndoCommand):
+    """Remove metadata entries, keeping them to restore them."""
+    def __init__(self, model, row, count, text="Remove metadata", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.count = count
+        self.entries = None
+
+    def redo(self):
+        """Remove the entries."""
+        self.entries = self.model._remove_entries(self.row, self.count)
+
+    def undo(self):
+        """Insert the removed entries back."""
+        self.model._insert_entries(self.row, self.entries)
+        self.entries = None
+
+
+class ReplaceEntryCommand(QW.QUndoCommand):
+    """Replace a metadata entry, storing the old and new [name, value, type] rows."""
+    def __init__(self, model, row, old, new, text="Edit metadata", parent=None):
+        super().__init__(text, parent)
+        self.model = model
+        self.row = row
+        self.old = old
+        self.new = new
+
+    def redo(self):
+        """Set the new entry."""
+        self.model._replace_entry(self.row, self.new)
+
+    def undo(self):
+        """Set the old entry."""
+        self.model._replace_entry(self.row, self.old)
@@ -2,35 +2,245 @@ import numpy as np
 import pandas as pd
 from qtpy import QtCore as QC
 
+from pygapsgui.models.TableCommands import InsertColumnsCommand
+from pygapsgui.models.TableCommands import InsertRowsCommand
+from pygapsgui.models.TableCommands import PasteCommand
+from pygapsgui.models.TableCommands import RemoveColumnsCommand
+from pygapsgui.models.TableCommands import RemoveRowsCommand
+from pygapsgui.models.TableCommands import RenameColumnCommand
+from pygapsgui.models.TableCommands import SetBlockCommand
+from pygapsgui.models.TableCommands import push_command
+
+
+class ColumnStore():
+    """
+    Columns of a table as NumPy arrays, with spare capacity after the last row.
+
+    Capacity doubles whenever it runs out, so that adding rows at the end is
+    amortised constant time, and removing rows at the end only changes the
+    size. Each column is a contiguous array, and a column of the table is a
+    view of the first `size` elements.
+    """
+
+    min_capacity = 16
+
+    def __init__(self, frame: pd.DataFrame):
+        self.names = list(frame.columns)
+        self.size = len(frame)
+        self.capacity = max(self.size, self.min_capacity)
+        self.buffers = [self._allocate(frame.iloc[:, col].to_numpy()) for col in range(frame.shape[1])]
+
+    def _allocate(self, values):
+        """Copy values into a buffer of the current capacity."""
+        buffer = np.zeros(self.capacity, dtype=values.dtype)
+        buffer[:len(values)] = values
+        return buffer
+
+    def reserve(self, size):
+        """Ensure there is space for `size` rows."""
+        if size <= self.capacity:
+            return
+        while self.capacity < size:
+            self.capacity *= 2
+        self.buffers = [self._allocate(buffer[:self.size]) for buffer in self.buffers]
+
+    def column(self, col):
+        """Values of a column, as a view."""
+        return self.buffers[col][:self.size]
+
+    def resize(self, size):
+        """Drop rows past `size`, or add zeroed rows up to it."""
+        self.reserve(size)
+        for buffer in self.buffers:
+            buffer[self.size:size] = 0
+        self.size = size
+
+    def insert_rows(self, row, count, values=None):
+        """Insert `count` rows before `row`, with `values` (a scalar or array per column)."""
+        self.reserve(self.size + count)
+        for col, buffer in enumerate(self.buffers):
+            # overlapping slice assignment is a memmove in NumPy
+            buffer[row + count:self.size + count] = buffer[row:self.size]
+            buffer[row:row + count] = 0 if values is None else values[col]
+        self.size += count
+
+    def remove_rows(self, row, count):
+        """Remove `count` rows starting at `row`."""
+        for buffer in self.buffers:
+            buffer[row:self.size - count] = buffer[row + count:self.size]
+        self.size -= count
+
+    def insert_column(self, col, name, fill=np.nan):
+        """Insert a new column, filled with a value or with an array of values."""
+        self.names.insert(col, name)
+        if isinstance(fill, np.ndarray):
+            self.buffers.insert(col, self._allocate(fill))
+        else:
+            self.buffers.insert(col, np.full(self.capacity, fill))
+
+    def remove_columns(self, col, count):
+        """Remove `count` columns starting at `col`."""
+        del self.names[col:col + count]
+        del self.buffers[col:col + count]
+
+    def set_column(self, col, values):
+        """Replace all values of a column, taking on their type."""
+        self.buffers[col] = self._allocate(np.asarray(values)[:self.size])
+
+    def astype(self, col, dtype):
+        """Change the type of a column."""
+        self.buffers[col] = self.buffers[col].astype(dtype)
+
+    def dtype(self, col):
+        """Type of a column."""
+        return self.buffers[col].dtype
+
+    def frame(self) -> pd.DataFrame:
+        """Copy the table into a new DataFrame."""
+        frame = pd.DataFrame({col: self.column(col).copy() for col in range(len(self.names))})
+        frame.columns = self.names
+        return frame
+
 
 class dfTableModel(QC.QAbstractTableModel):
-    """Table model to display/edit a Pandas dataframe."""
+    """
+    Table model to display/edit a Pandas dataframe.
+
+    The dataframe is copied into a ColumnStore, which the model edits in
+    place, and is only rebuilt when requested through `dataframe`. Cells
+    are served directly from the column arrays. Rows are exposed to the view
+    in batches of `fetch_size` as it scrolls, so that very long tables open
+    immediately.
+
+    Edits made through the Qt model interface are commands which are pushed
+    to `undo_stack` if one is set, and store only the cells they change.
+    `setRowCount`, `setColumnData` and `setColumnDtype` edit the table
+    directly and are not undoable.
+    """
+
+    fetch_size = 10000
+    undo_stack = None
+
     def __init__(self, data=None, parent=None):
         super().__init__(parent)
         if data is None:
             data = pd.DataFrame({"pressure": [0.0], "loading": [0.0], "branch": [0]})
-        self._data = data
+        self._store = ColumnStore(data)
+        self._loaded = min(self._store.size, self.fetch_size)
+
+    def dataframe(self) -> pd.DataFrame:
+        """Return the table contents as a new DataFrame."""
+        return self._store.frame()
+
+    def _column(self, col):
+        """Array of a column."""
+        return self._store.column(col)
+
+    def _value(self, row, col):
+        """Value of a cell, as a Python object."""
+        value = self._store.buffers[col][row]
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def _invalidate(self):
+        """Expose at least the first batch of rows after the size changed."""
+        self._loaded = min(self._store.size, max(self._loaded, self.fetch_size))
+
+    def _push(self, command):
+        """Apply an edit, recording it if there is an undo stack."""
+        push_command(command, self.undo_stack)
+
+    def _write_block(self, row, col, columns):
+        """Write arrays into consecutive columns, starting at a cell."""
+        nrows = len(columns[0])
+        for offset, values in enumerate(columns):
+            self._store.buffers[col + offset][row:row + nrows] = values
+        last_row = min(row + nrows, self._loaded) - 1
+        if last_row >= row:
+            self.dataChanged.emit(
+                self.index(row, col), self.index(last_row, col + len(columns) - 1)
+            )
+
+    def _insert_rows(self, row, columns):
+        """Insert rows before `row`, given as one array per column."""
+        count = len(columns[0])
+        # rows past those fetched are not yet known to the view
+        visible = row <= self._loaded
+        if visible:
+            self.beginInsertRows(QC.QModelIndex(), row, row + count - 1)
+        self._store.insert_rows(row, count, columns)
+        if visible:
+            self._loaded += count
+            self.endInsertRows()
+
+    def _remove_rows(self, row, count):
+        """Remove rows, returning their values as one array per column."""
+        removed = [self._column(col)[row:row + count].copy() for col in range(self.columnCount())]
+        visible = min(row + count, self._loaded) - row
+        if visible > 0:
+            self.beginRemoveRows(QC.QModelIndex(), row, row + visible - 1)
+        self._store.remove_rows(row, count)
+        if visible > 0:
+            self._loaded -= visible
+            self.endRemoveRows()
+        return removed
+
+    def _insert_columns(self, col, names, columns):
+        """Insert named columns before `col`."""
+        self.beginInsertColumns(QC.QModelIndex(), col, col + len(names) - 1)
+        for offset, (name, values) in enumerate(zip(names, columns)):
+            self._store.insert_column(col + offset, name, values)
+        self.endInsertColumns()
+
+    def _remove_columns(self, col, count):
+        """Remove columns, returning their names and values."""
+        names = self._store.names[col:col + count]
+        columns = [self._column(c).copy() for c in range(col, col + count)]
+        self.beginRemoveColumns(QC.QModelIndex(), col, col + count - 1)
+        self._store.remove_columns(col, count)
+        self.endRemoveColumns()
+        return names, columns
+
+    def _rename_column(self, col, name):
+        """Set the name of a column."""
+        self._store.names[col] = name
+        self.headerDataChanged.emit(QC.Qt.Horizontal, col, col)
+
+    def _set_cell(self, row, col, value):
+        """Set a single cell, as an undoable edit."""
+        old = [self._store.buffers[col][row:row + 1].copy()]
+        new = [np.array([value], dtype=self._store.dtype(col))]
+        self._push(SetBlockCommand(self, row, col, old, new, "Edit cell"))
 
     def rowCount(self, index=QC.QModelIndex()):
-        """Rows are df rows."""
-        return self._data.shape[0]
+        """Rows are df rows, as far as fetched by the view."""
+        return self._loaded
+
+    def canFetchMore(self, parent=QC.QModelIndex()) -> bool:
+        """Check if rows remain to be shown."""
+        return self._loaded < self._store.size
+
+    def fetchMore(self, parent=QC.QModelIndex()):
+        """Show the next batch of rows."""
+        count = min(self.fetch_size, self._store.size - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QC.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
 
     def columnCount(self, index=QC.QModelIndex()):
         """Columns are df columns."""
-        return self._data.shape[1]
+        return len(self._store.names)
 
     def setRowCount(self, nrows):
-        """Slice existing rows or insert new ones by appending a new df."""
-        if nrows == self.rowCount():
+        """Slice existing rows or add new zeroed ones."""
+        if nrows == self._store.size:
             return
-        if nrows < self.rowCount():
-            self._data = self._data.iloc[0:nrows]
-        if nrows > self.rowCount():
-            newrows = pd.DataFrame(
-                columns=self._data.columns,
-                data=np.empty((nrows - self.rowCount(), self.columnCount())),
-            )
-            self._data = self._data.append(newrows, ignore_index=True)
+        self._store.resize(nrows)
+        self._loaded = min(self._loaded, nrows)
+        self._invalidate()
         self.dataChanged.emit(QC.QModelIndex(), QC.QModelIndex())
         self.layoutChanged.emit()
 
@@ -40,7 +250,7 @@ class dfTableModel(QC.QAbstractTableModel):
             return None
 
         if role in [QC.Qt.DisplayRole, QC.Qt.EditRole]:
-            return self._data.values[index.row()][index.column()]
+            return self._value(index.row(), index.column())
 
         if role == QC.Qt.TextAlignmentRole:
             return QC.Qt.AlignCenter
@@ -51,52 +261,78 @@ class dfTableModel(QC.QAbstractTableModel):
             return False
 
         if role == QC.Qt.EditRole:
-            dtype = self._data.dtypes[index.column()]
+            dtype = self._store.dtype(index.column())
 
             if dtype in (np.float32, np.float64):
                 value = float(value)
             elif dtype in (np.int32, np.int64):
                 value = int(value)
 
-            self._data.iloc[index.row(), index.column()] = value
-            self.dataChanged.emit(index, index)
+            self._set_cell(index.row(), index.column(), value)
             return True
 
         return False
 
     def setDataRange(self, index, values, role: int = QC.Qt.EditRole, append=False) -> bool:
-        """Intercept setdata to correctly set ads/des for branches"""
-        if not index.isValid():
+        """
+        Set a block of data starting at an index, such as a pasted table.
+
+        `values` can be a DataFrame or a list of rows. Each column of the block
+        is converted to the type of the column it lands in, then written as
+        a single slice. With `append`, rows are added to fit the block.
+        The whole block is a single undoable edit, which stores the
+        overwritten values and the new ones.
+        """
+        if not index.isValid() or role != QC.Qt.EditRole:
             return False
 
         row0 = index.row()
         col0 = index.column()
-        current_index = index
-
-        if append:
-            rows_needed = self.rowCount() - row0
-            if len(values) > rows_needed:
-                self.insertRows(self.rowCount(), len(values) - rows_needed)
-
-        self.blockSignals(True)
-        for i, row in enumerate(values):
-            for j, col in enumerate(row):
-                current_index = self.index(row0 + i, col0 + j)
-                self.setData(current_index, col, role)
-        self.blockSignals(False)
-        self.dataChanged.emit(index, current_index)
+        if not isinstance(values, pd.DataFrame):
+            values = pd.DataFrame(list(values))
+        size = self._store.size
+        ncols = min(values.shape[1], self.columnCount() - col0)
+        nrows = len(values) if append else min(len(values), size - row0)
+        if nrows <= 0 or ncols <= 0:
+            return False
+
+        # convert everything first, so a bad value leaves the table untouched
+        columns = [
+            self._convert_column(col0 + j, values.iloc[:nrows, j]) for j in range(ncols)
+        ]
+
+        nset = min(nrows, size - row0)
+        old = [self._store.buffers[col0 + j][row0:row0 + nset].copy() for j in range(ncols)]
+        appended = None
+        if nrows > nset:
+            # rows past the end are inserted with their values, the columns
+            # outside the block copying the last row
+            appended = [
+                columns[col - col0][nset:] if col0 <= col < col0 + ncols else
+                np.repeat(buffer[size - 1:size], nrows - nset)
+                for col, buffer in enumerate(self._store.buffers)
+            ]
+        self._push(
+            PasteCommand(self, row0, col0, old, [column[:nset] for column in columns], appended)
+        )
         return True
 
+    def _convert_column(self, col, values):
+        """Convert a series of values to the type of a column, raising ValueError if impossible."""
+        dtype = self._store.dtype(col)
+        if dtype in (np.float32, np.float64, np.int32, np.int64):
+            return pd.to_numeric(values).to_numpy().astype(dtype)
+        return values.to_numpy()
+
     def setColumnData(self, col, values, role: int = QC.Qt.EditRole) -> bool:
         """Set data of a whole column."""
         start = self.index(0, col)
-        end = self.index(self._data.shape[0] - 1, col)
+        end = self.index(self.rowCount() - 1, col)
         if not start.isValid() or not end.isValid():
             return False
 
         if role == QC.Qt.EditRole:
-            colname = self._data.columns[col]
-            self._data[colname] = values
+            self._store.set_column(col, values)
             self.dataChanged.emit(start, end)
             return True
 
@@ -104,8 +340,7 @@ class dfTableModel(QC.QAbstractTableModel):
 
     def setColumnDtype(self, col, dtype) -> bool:
         """Set the dtype of a column"""
-        colname = self._data.columns[col]
-        self._data = self._data.astype({colname: dtype})
+        self._store.astype(col, dtype)
         return True
 
     def headerData(self, section, orientation, role=QC.Qt.DisplayRole):
@@ -113,61 +348,54 @@ class dfTableModel(QC.QAbstractTableModel):
         if role != QC.Qt.DisplayRole:
             return None
         if orientation == QC.Qt.Horizontal:
-            return self._data.columns[section]
+            return self._store.names[section]
         if orientation == QC.Qt.Vertical:
-            return self._data.index[section] + 1
+            return section + 1
 
     def setHeaderData(self, section, orientation, value, role=QC.Qt.EditRole) -> bool:
         """Set data in the header as df columns, only horizontal."""
         if role in [QC.Qt.DisplayRole, QC.Qt.EditRole]:
             if orientation == QC.Qt.Horizontal:
-                old_col = self._data.columns[section]
-                self._data.rename(columns={old_col: value}, inplace=True)
-                self.headerDataChanged.emit(QC.Qt.Horizontal, section, section)
+                old = self._store.names[section]
+                if value != old:
+                    self._push(RenameColumnCommand(self, section, old, value))
+                return True
+        return False
 
     def insertRows(self, row: int, count: int, parent=QC.QModelIndex()) -> bool:
-        """Convenience/fast function for row insertion."""
+        """Insert rows copying a neighbour, amortised constant time at the end."""
+        size = self._store.size
         if row == -1:
-            row = self.rowCount()
-        self.beginInsertRows(parent, row, row + count - 1)
-        # if appending
-        if row == len(self._data):
-            line = pd.DataFrame([self._data.iloc[row - 1].values],
-                                index=range(count),
-                                columns=self._data.columns)
-            self._data = self._data.append(line, ignore_index=True)
-        # if anywhere else
+            row = size
+        # copy the previous row if appending, else the one at the insertion point
+        source = row - 1 if row == size else row
+        if size:
+            columns = [np.repeat(buffer[source:source + 1], count) for buffer in self._store.buffers]
         else:
-            line = pd.DataFrame([self._data.iloc[row].values],
-                                index=range(count),
-                                columns=self._data.columns)
-            self._data = pd.concat([self._data.iloc[:row], line,
-                                    self._data.iloc[row:]]).reset_index(drop=True)
-        self.endInsertRows()
+            columns = [np.zeros(count, dtype=buffer.dtype) for buffer in self._store.buffers]
+        self._push(InsertRowsCommand(self, row, columns))
         return True
 
     def removeRows(self, row: int, count: int, parent=QC.QModelIndex()) -> bool:
-        """Convenience/fast function for row deletion."""
-        if self.rowCount() == 1:
+        """Remove rows, constant time at the end."""
+        if self._store.size == 1:
             return False
-        self.beginRemoveRows(parent, row, row + count - 1)
-        self._data.drop(self._data.index[row:row + count], inplace=True)
-        self._data.reset_index(drop=True, inplace=True)
-        self.endRemoveRows()
+        count = min(count, self._store.size - row)
+        if count <= 0:
+            return False
+        self._push(RemoveRowsCommand(self, row, count))
         return True
 
     def insertColumns(self, column: int, count: int, parent=QC.QModelIndex()) -> bool:
         """Convenience/fast function for column insertion."""
-        self.beginInsertColumns(parent, column, column + count - 1)
-        self._data.insert(column, "newcol", np.nan)
-        self.endInsertColumns()
+        names = ["newcol"] * count
+        columns = [np.full(self._store.size, np.nan) for _ in range(count)]
+        self._push(InsertColumnsCommand(self, column, names, columns))
         return True
 
     def removeColumns(self, column: int, count: int, parent=QC.QModelIndex()) -> bool:
         """Convenience/fast function for column deletion."""
-        self.beginRemoveColumns(parent, column, column + count - 1)
-        self._data.drop(self._data.columns[column:column + count], axis=1, inplace=True)
-        self.endRemoveColumns()
+        self._push(RemoveColumnsCommand(self, column, count))
         return True
 
     def flags(self, index=QC.QModelIndex()):
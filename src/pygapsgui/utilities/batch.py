@@ -0,0 +1,329 @@
+"""
+Run characterisation methods on many isotherms, without any GUI.
+
+The result dictionaries are built by the same functions as in the
+characterisation dialogs, so that batch results can be saved as
+metadata or exported in the same way as single results.
+"""
+
+import numpy
+
+from pygaps.characterisation.area_bet import area_BET_raw
+from pygaps.characterisation.area_lang import area_langmuir_raw
+from pygaps.characterisation.dr_da_plots import da_plot_raw
+from pygaps.characterisation.isosteric_enth import isosteric_enthalpy
+from pygaps.characterisation.models_hk import _ADSORBENT_MODELS
+from pygaps.characterisation.models_kelvin import _KELVIN_MODELS
+from pygaps.characterisation.models_thickness import _THICKNESS_MODELS
+from pygaps.characterisation.models_thickness import get_thickness_model
+from pygaps.characterisation.psd_kernel import psd_dft
+from pygaps.characterisation.psd_meso import _MENISCUS_GEOMETRIES
+from pygaps.characterisation.psd_meso import _MESO_PSD_MODELS
+from pygaps.characterisation.psd_meso import _PORE_GEOMETRIES as _MESO_GEOMETRIES
+from pygaps.characterisation.psd_meso import psd_mesoporous
+from pygaps.characterisation.psd_micro import _MICRO_PSD_MODELS
+from pygaps.characterisation.psd_micro import _PORE_GEOMETRIES as _MICRO_GEOMETRIES
+from pygaps.characterisation.psd_micro import psd_microporous
+from pygaps.characterisation.t_plots import t_plot_raw
+from pygaps.data import KERNELS
+from pygaps.utilities.pygaps_utilities import get_iso_loading_and_pressure_ordered
+from pygapsgui.utilities.result_dicts import bet_results
+from pygapsgui.utilities.result_dicts import dadr_results
+from pygapsgui.utilities.result_dicts import isosteric_results
+from pygapsgui.utilities.result_dicts import langmuir_results
+from pygapsgui.utilities.result_dicts import linear_region_results
+from pygapsgui.utilities.result_dicts import psd_results
+
+_BRANCHES = ["ads", "des"]
+
+
+def area_bet(isotherm, branch="ads"):
+    """BET area with automatic limits, as in the BET dialog."""
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": "molar",
+            "loading_unit": "mol"
+        }, {"pressure_mode": "relative"}
+    )
+    cross_section = isotherm.adsorbate.get_prop("cross_sectional_area")
+    (
+        bet_area,
+        c_const,
+        n_monolayer,
+        p_monolayer,
+        slope,
+        intercept,
+        min_point,
+        max_point,
+        corr_coef,
+    ) = area_BET_raw(pressure, loading, cross_section)
+    return bet_results(
+        isotherm.material_unit,
+        bet_area,
+        c_const,
+        n_monolayer,
+        p_monolayer,
+        slope,
+        intercept,
+        corr_coef,
+        (pressure[min_point], pressure[max_point]),
+    )
+
+
+def area_langmuir(isotherm, branch="ads"):
+    """Langmuir area with automatic limits, as in the Langmuir dialog."""
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": "molar",
+            "loading_unit": "mol"
+        }, {"pressure_mode": "relative"}
+    )
+    cross_section = isotherm.adsorbate.get_prop("cross_sectional_area")
+    (
+        lang_area,
+        k_const,
+        n_monolayer,
+        slope,
+        intercept,
+        min_point,
+        max_point,
+        corr_coef,
+    ) = area_langmuir_raw(pressure, loading, cross_section)
+    return langmuir_results(
+        isotherm.material_unit,
+        lang_area,
+        k_const,
+        n_monolayer,
+        slope,
+        intercept,
+        corr_coef,
+        (pressure[min_point], pressure[max_point]),
+    )
+
+
+def t_plot(isotherm, branch="ads", thickness_model="Harkins/Jura"):
+    """t-plot with automatic linear region detection, as in the t-plot dialog."""
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": "molar",
+            "loading_unit": "mmol"
+        }, {"pressure_mode": "relative"}
+    )
+    results, _ = t_plot_raw(
+        loading,
+        pressure,
+        get_thickness_model(thickness_model),
+        isotherm.adsorbate.liquid_density(isotherm.temperature),
+        isotherm.adsorbate.molar_mass(),
+    )
+    return linear_region_results("t-plot", isotherm.material_unit, results)
+
+
+def dadr_plot(isotherm, branch="ads", ptype="DR"):
+    """Dubinin-Radushkevich or Dubinin-Astakov micropore volume, as in the DR/DA dialog."""
+    pressure, loading = get_iso_loading_and_pressure_ordered(
+        isotherm, branch, {
+            "loading_basis": "molar",
+            "loading_unit": "mol"
+        }, {"pressure_mode": "relative"}
+    )
+    (
+        microp_volume,
+        potential,
+        exp,
+        slope,
+        intercept,
+        min_point,
+        max_point,
+        corr_coef,
+    ) = da_plot_raw(
+        pressure,
+        loading,
+        isotherm.temperature,
+        isotherm.adsorbate.molar_mass(),
+        isotherm.adsorbate.liquid_density(isotherm.temperature),
+        2 if ptype == "DR" else None,
+    )
+    return dadr_results(
+        ptype,
+        isotherm.material_unit,
+        microp_volume,
+        potential,
+        exp,
+        slope,
+        intercept,
+        corr_coef,
+        (pressure[min_point], pressure[max_point]),
+    )
+
+
+def psd_micro(isotherm, **settings):
+    """Microporous PSD with automatic limits."""
+    return psd_results(isotherm.material_unit, psd_microporous(isotherm, **settings))
+
+
+def psd_meso(isotherm, meniscus_geometry="auto", **settings):
+    """Mesoporous PSD with automatic limits."""
+    if meniscus_geometry == "auto":
+        meniscus_geometry = None
+    return psd_results(
+        isotherm.material_unit,
+        psd_mesoporous(isotherm, meniscus_geometry=meniscus_geometry, **settings),
+    )
+
+
+def psd_kernel(isotherm, **settings):
+    """DFT kernel fitting PSD with automatic limits."""
+    return psd_results(isotherm.material_unit, psd_dft(isotherm, **settings))
+
+
+def isosteric(isotherms, branch="ads"):
+    """Isosteric enthalpy of several isotherms, as in the isosteric enthalpy dialog."""
+    results = isosteric_enthalpy(isotherms, branch=branch)
+    return isosteric_results(isotherms[0].loading_unit, isotherms[0].material_unit, results)
+
+
+def fit_model(iso_params, pressure, loading, branch, model):
+    """Fit one model to isotherm data, returning the fitted model as a dictionary."""
+    from pygaps import ModelIsotherm
+    isotherm = ModelIsotherm(
+        pressure=pressure,
+        loading=loading,
+        branch=branch,
+        model=model,
+        verbose=False,
+        **iso_params,
+    )
+    return isotherm.model.to_dict()
+
+
+_THICKNESS = [model for model in _THICKNESS_MODELS if model != "zero thickness"]
+
+#: Available methods: name -> (function, {setting: choices, first is default})
+METHODS = {
+    "BET area": (area_bet, {
+        "branch": _BRANCHES
+    }),
+    "Langmuir area": (area_langmuir, {
+        "branch": _BRANCHES
+    }),
+    "t-plot": (t_plot, {
+        "branch": _BRANCHES,
+        "thickness_model": _THICKNESS,
+    }),
+    "Dubinin-Radushkevich": (dadr_plot, {
+        "branch": _BRANCHES,
+        "ptype": ["DR"],
+    }),
+    "Dubinin-Astakov": (dadr_plot, {
+        "branch": _BRANCHES,
+        "ptype": ["DA"],
+    }),
+    "PSD microporous": (
+        psd_micro, {
+            "branch": _BRANCHES,
+            "psd_model": list(_MICRO_PSD_MODELS),
+            "pore_geometry": list(_MICRO_GEOMETRIES),
+            "material_model": list(_ADSORBENT_MODELS),
+        }
+    ),
+    "PSD mesoporous": (
+        psd_meso, {
+            "branch": ["des", "ads"],
+            "psd_model": list(_MESO_PSD_MODELS),
+            "pore_geometry": list(_MESO_GEOMETRIES),
+            "meniscus_geometry": ["auto"] + list(_MENISCUS_GEOMETRIES),
+            "thickness_model": list(_THICKNESS_MODELS),
+            "kelvin_model": list(_KELVIN_MODELS),
+        }
+    ),
+    "PSD kernel fitting": (psd_kernel, {
+        "branch": _BRANCHES,
+        "kernel": list(KERNELS),
+    }),
+}
+
+#: Methods using several isotherms at once, same format as METHODS
+MULTI_METHODS = {
+    "Isosteric enthalpy": (isosteric, {
+        "branch": _BRANCHES
+    }),
+}
+
+
+def flatten_results(results: dict, prefix: str = "") -> dict:
+    """
+    Flatten nested results and convert arrays to lists.
+
+    Nested dictionaries (such as the several linear regions of a t-plot)
+    get their key appended to the name of each result.
+    """
+    flat = {}
+    for name, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten_results(value, prefix=f"{prefix}{name}: "))
+            continue
+        if isinstance(value, numpy.ndarray):
+            value = value.tolist()
+        elif isinstance(value, numpy.generic):
+            value = value.item()
+        elif isinstance(value, tuple):
+            value = [v.item() if isinstance(v, numpy.generic) else v for v in value]
+        flat[f"{prefix}{name}"] = value
+    return flat
+
+
+def isotherm_to_batch(isotherm) -> dict:
+    """
+    Reduce an isotherm to a picklable form to send to another process.
+
+    The adsorbate is included, as it may have been modified in this session.
+    """
+    from pygapsgui.utilities.iso_cache import isotherm_to_stored
+    stored = isotherm_to_stored(isotherm)
+    stored["adsorbate"] = isotherm.adsorbate.to_dict()
+    return stored
+
+
+def isotherm_from_batch(stored: dict):
+    """Rebuild an isotherm sent by `isotherm_to_batch`."""
+    import pygaps
+    from pygapsgui.utilities.iso_cache import isotherm_from_stored
+    adsorbate = stored.get("adsorbate")
+    if adsorbate:
+        try:
+            adsorbate = pygaps.Adsorbate(**adsorbate)
+        except Exception:  # pylint: disable=broad-except
+            pass  # fall back to the adsorbate of this process
+        else:
+            pygaps.ADSORBATE_LIST[:] = [
+                ads for ads in pygaps.ADSORBATE_LIST if ads.name != adsorbate.name
+            ]
+            pygaps.ADSORBATE_LIST.append(adsorbate)
+    return isotherm_from_stored(stored)
+
+
+def run_method(method: str, isotherm, settings: dict = None) -> dict:
+    """
+    Run a characterisation method on one isotherm.
+
+    Parameters
+    ----------
+    method : str
+        A name from METHODS.
+    isotherm : BaseIsotherm or dict
+        An isotherm, or its form from `isotherm_to_batch`.
+    settings : dict
+        Method settings, by default the first of each choice.
+
+    Returns
+    -------
+    dict
+        Flat dictionary of results.
+    """
+    function, choices = METHODS[method]
+    options = {name: values[0] for name, values in choices.items()}
+    options.update(settings or {})
+    if isinstance(isotherm, dict):
+        isotherm = isotherm_from_batch(isotherm)
+    return flatten_results(function(isotherm, **options))
@@ -0,0 +1,188 @@
+"""
+An in-memory cache of characterisation results, shared between dialogs.
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+from pygapsgui.utilities.log_hook import log_hook
+
+
+class CalculationCache():
+    """
+    Memoise pyGAPS calculations by isotherm, method and parameters.
+
+    The key of a calculation is made from the function called and all its
+    arguments. Isotherms in the arguments are represented by their pyGAPS
+    hash (`iso_id`), which covers their data, units and metadata, while
+    arrays are represented by a digest of their contents. Reopening a dialog
+    on the same isotherm, or dragging a slider back to previous limits,
+    therefore returns the stored result instead of recalculating.
+
+    Computing an isotherm hash is not free, so it is kept per isotherm
+    object until the isotherm is modified, which must be reported through
+    `invalidate`. Any log output produced by the calculation is stored with
+    the result and replayed into the log hook on a cache hit. Failed
+    calculations are not cached.
+
+    Results are shared and must be treated as read-only. The number of
+    stored results is capped, and least recently used ones are dropped first.
+
+    Data read from an isotherm in other units, such as for plotting, is
+    stored separately per isotherm object through `converted`, and
+    dropped when the isotherm is invalidated or garbage collected.
+    """
+
+    max_entries = 128
+
+    def __init__(self, max_entries=None):
+        if max_entries is not None:
+            self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._results = OrderedDict()  # key: (result, logs)
+        self._iso_ids = {}  # id(isotherm): (weakref, iso_id)
+        self._converted = {}  # id(isotherm): (weakref, {key: data})
+
+    def call(self, function, *args, **kwargs):
+        """Return `function(*args, **kwargs)`, from the cache if possible."""
+        try:
+            key = self.key(function, args, kwargs)
+        except Exception:  # pylint: disable=broad-except
+            # the isotherm could not be hashed, do not cache
+            return function(*args, **kwargs)
+
+        with self._lock:
+            stored = self._results.get(key)
+            if stored is not None:
+                self._results.move_to_end(key)
+        log_stream = log_hook.log_stream
+        if stored is not None:
+            result, logs = stored
+            if log_stream is not None:
+                log_stream.write(logs)
+            return result
+
+        start = log_stream.tell() if log_stream is not None else 0
+        result = function(*args, **kwargs)
+        logs = log_stream.getvalue()[start:] if log_stream is not None else ""
+
+        with self._lock:
+            self._results[key] = (result, logs)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+        return result
+
+    def converted(self, isotherm, method: str, *args, **kwargs):
+        """
+        Return `isotherm.<method>(*args, **kwargs)`, stored per isotherm.
+
+        Meant for data accessors which convert units, such as `pressure`,
+        `loading` or `other_data`, called with the same units on every
+        redraw. Unlike `call`, no isotherm hash is computed.
+        """
+        key = (method, self._freeze(args), self._freeze(kwargs))
+        ident = id(isotherm)
+        with self._lock:
+            stored = self._converted.get(ident)
+            if stored is not None and stored[0]() is isotherm and key in stored[1]:
+                return stored[1][key]
+
+        data = getattr(isotherm, method)(*args, **kwargs)
+
+        def forget(ref):
+            with self._lock:
+                if self._converted.get(ident, (None, ))[0] is ref:
+                    del self._converted[ident]
+
+        with self._lock:
+            stored = self._converted.get(ident)
+            if stored is None or stored[0]() is not isotherm:
+                stored = (weakref.ref(isotherm, forget), {})
+                self._converted[ident] = stored
+            stored[1][key] = data
+        return data
+
+    def key(self, function, args, kwargs) -> tuple:
+        """Build the hashable key of a calculation."""
+        return (
+            function.__module__,
+            function.__qualname__,
+            self._freeze(args),
+            self._freeze(kwargs),
+        )
+
+    def iso_id(self, isotherm) -> str:
+        """Return the (memoised) pyGAPS hash of an isotherm."""
+        with self._lock:
+            stored = self._iso_ids.get(id(isotherm))
+        if stored is not None and stored[0]() is isotherm:
+            return stored[1]
+
+        iso_id = isotherm.iso_id
+        ident = id(isotherm)
+
+        def forget(ref):
+            with self._lock:
+                if self._iso_ids.get(ident, (None, ))[0] is ref:
+                    del self._iso_ids[ident]
+
+        with self._lock:
+            self._iso_ids[ident] = (weakref.ref(isotherm, forget), iso_id)
+        return iso_id
+
+    def invalidate(self, isotherm):
+        """
+        Mark an isotherm as modified.
+
+        Its hash is recalculated on next use, and results calculated
+        directly from its previous state, as well as its converted data,
+        are dropped.
+        """
+        with self._lock:
+            self._converted.pop(id(isotherm), None)
+            stored = self._iso_ids.pop(id(isotherm), None)
+            if stored is None:
+                return
+            old_id = ("isotherm", stored[1])
+            for key in [key for key in self._results if _contains(key, old_id)]:
+                del self._results[key]
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._results.clear()
+            self._iso_ids.clear()
+            self._converted.clear()
+
+    def _freeze(self, value):
+        """Convert a calculation argument to a hashable form."""
+        import numpy
+        from pygaps.core.baseisotherm import BaseIsotherm
+
+        if isinstance(value, BaseIsotherm):
+            return ("isotherm", self.iso_id(value))
+        if isinstance(value, numpy.ndarray):
+            value = numpy.ascontiguousarray(value)
+            digest = hashlib.sha1(value.view(numpy.uint8)).hexdigest()
+            return ("array", value.dtype.str, value.shape, digest)
+        if isinstance(value, dict):
+            return tuple(sorted((key, self._freeze(val)) for key, val in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(self._freeze(val) for val in value)
+        if value is None or isinstance(value, (str, bool, int, float)):
+            return value
+        return repr(value)
+
+
+def _contains(frozen, item) -> bool:
+    """Check if a frozen key contains an item at any depth."""
+    if frozen == item:
+        return True
+    if isinstance(frozen, tuple):
+        return any(_contains(part, item) for part in frozen)
+    return False
+
+
+calc_cache = CalculationCache()
@@ -3,6 +3,7 @@ import operator as ope
 import pathlib
 import platform
 import re
+import sys
 import typing
 
 import qtpy
@@ -23,6 +24,9 @@ _PATTERN_ENV_PATCH = re.compile(r"\$env_patch\{[\s\S]*?\}")
 # Resource location
 _RESOURCES_BASE_DIR = pathlib.Path(get_resource("icons/themed")).as_posix()
 
+# Theme currently applied, also used for matplotlib once it is loaded
+CURRENT_THEME = None
+
 
 def _compare_v(v1: str, operator: str, v2: str) -> bool:
     """Comparing two versions."""
@@ -144,7 +148,7 @@ def _parse_env_patch(stylesheet: str) -> "dict[str, str]":
 @QC.Slot()
 def theme_apply(theme) -> None:
     """Apply a custom theme."""
-    global COLORS
+    global COLORS, CURRENT_THEME
     qss = None
     if theme == 'light':
         qss = "stylesheets/light.qss"
@@ -171,8 +175,16 @@ def theme_apply(theme) -> None:
     # Set
     QW.QApplication.instance().setStyleSheet(stylesheet)
 
-    # Matplotlib theme
+    # Matplotlib theme, only if already loaded so as not to slow startup
+    CURRENT_THEME = theme
+    if "matplotlib" in sys.modules:
+        mpl_theme_apply()
+
+
+def mpl_theme_apply() -> None:
+    """Apply the current theme to matplotlib."""
     import matplotlib.pyplot as plt
+    theme = CURRENT_THEME
     if theme == "dark":
         plt.style.use('dark_background')
         plt.rcParams.update({
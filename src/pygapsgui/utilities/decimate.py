@@ -0,0 +1,78 @@
+"""
+Level of detail reduction of dense lines for plotting.
+
+A line with many more points than the pixels it spans is drawn as the
+first, last, lowest and highest point in each pixel-wide bucket of the
+x axis. The drawn line is then indistinguishable from the full one, but
+costs a few points per pixel, whatever the number of points in the data.
+"""
+
+import numpy
+
+#: Points kept per bucket (first, last, minimum, maximum)
+POINTS_PER_BUCKET = 4
+
+
+def minmax_indices(x, y, limits, buckets, log=False):
+    """
+    Select the visually significant points of a line in the current view.
+
+    The x range in view is divided into `buckets` equal intervals, in
+    logarithmic space if `log`. In each, the first and last points (in data
+    order) and those with the lowest and highest y are kept. Points outside
+    the view are grouped in two more buckets, on either side, so that lines
+    leaving the view are still drawn towards the right point. The data
+    extremes are always kept, so that limits calculated from the reduced
+    line are those of the full line. Since minimum and maximum do not
+    depend on a logarithmic y scale, only x scaling is considered.
+
+    Parameters
+    ----------
+    x, y : array
+        Line data, in data order.
+    limits : tuple
+        Lower and upper x limit of the view.
+    buckets : int
+        Number of buckets, typically the width of the axes in pixels.
+    log : bool
+        Whether the x axis is logarithmic.
+
+    Returns
+    -------
+    array or None
+        Sorted indices of the points to draw, or None if the points in view
+        are few enough to be drawn in full.
+    """
+    low, high = sorted(limits)
+    if log:
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            x = numpy.log10(x)
+        low, high = numpy.log10(max(low, numpy.finfo(float).tiny)), numpy.log10(high)
+    if not high > low:
+        return None
+
+    position = (x - low) / (high - low) * buckets
+    # non-finite positions (such as log of zero) go left of the view
+    position[~numpy.isfinite(position)] = -1
+    bucket = numpy.clip(numpy.floor(position), -1, buckets).astype(int)
+
+    in_view = numpy.count_nonzero((bucket >= 0) & (bucket < buckets))
+    if in_view <= POINTS_PER_BUCKET * buckets:
+        return None
+
+    # points in data order within each bucket, then sorted by y
+    by_index = numpy.argsort(bucket, kind="stable")
+    by_value = numpy.lexsort((y, bucket))
+    sorted_buckets = bucket[by_index]
+    starts = numpy.flatnonzero(numpy.r_[True, sorted_buckets[1:] != sorted_buckets[:-1]])
+    ends = numpy.r_[starts[1:], len(bucket)] - 1
+
+    return numpy.unique(
+        numpy.concatenate([
+            by_index[starts],
+            by_index[ends],
+            by_value[starts],
+            by_value[ends],
+            [numpy.nanargmin(x), numpy.nanargmax(x)],
+        ]).astype(int)
+    )
@@ -0,0 +1,445 @@
+"""
+Vectorised IAST, solving many mixture points at once.
+
+pyGAPS solves IAST one point at a time, and integrates the spreading
+pressure of each isotherm from scratch at every solver step. Here the
+reduced spreading pressure of each isotherm is tabulated once, then all
+points are solved together, which makes sweeps of hundreds of points fast.
+"""
+
+import textwrap
+
+import numpy
+
+from pygaps import logger
+from pygaps.core.modelisotherm import ModelIsotherm
+from pygaps.modelling import is_model_iast
+from pygaps.utilities.exceptions import CalculationError
+from pygaps.utilities.exceptions import ParameterError
+
+
+class SpreadingPressure():
+    r"""
+    Reduced spreading pressure of one isotherm branch, as a function of pressure.
+
+    The loading is taken as piecewise linear between nodes, so that the
+    integral
+
+    .. math::
+
+        \Pi(p) = \int_0^p \frac{q(\hat{p})}{ \hat{p}} d\hat{p}
+
+    is exact on each segment, as in ``PointIsotherm.spreading_pressure_at``.
+    For a PointIsotherm the nodes are the data points, for a ModelIsotherm
+    they are a dense logarithmic grid of the model, extended on demand. The
+    table is therefore built once and then inverted by interpolation. Below
+    the first node the isotherm follows Henry's law, above the last node it
+    is taken to plateau.
+
+    Parameters
+    ----------
+    isotherm : PointIsotherm or ModelIsotherm
+        The pure component isotherm.
+    branch : {'ads', 'des'}
+        The branch to use.
+    """
+
+    #: Grid density for model isotherms
+    nodes_per_decade = 128
+    #: How many times a model grid may be extended to reach a spreading pressure
+    max_extensions = 12
+
+    def __init__(self, isotherm, branch="ads"):
+        self.branch = branch
+        self.is_model = isinstance(isotherm, ModelIsotherm)
+        self.nodes = None  # (pressure, loading, slope, intercept, area), replaced as a whole
+
+        if self.is_model:
+            if branch and branch != isotherm.branch:
+                raise ParameterError(
+                    f"ModelIsotherm is based on an '{isotherm.branch}' branch "
+                    f"(while parameter supplied was '{branch}')."
+                )
+            # the isotherm itself is not kept, so that a cached table
+            # does not keep it alive
+            self.model = isotherm.model
+            low, high = self.model.pressure_range
+            if not numpy.isfinite(high) or high <= 0:
+                high = 1
+            if not numpy.isfinite(low) or low <= 0:
+                low = high * 1e-3
+            self.max_pressure = high
+            self._tabulate(low * 1e-3, high * 10)
+        else:
+            pressure = numpy.asarray(isotherm.pressure(branch=branch), dtype=float)
+            loading = numpy.asarray(isotherm.loading(branch=branch), dtype=float)
+            order = numpy.argsort(pressure)
+            pressure, loading = pressure[order], loading[order]
+            pressure, unique = numpy.unique(pressure, return_index=True)
+            loading = loading[unique]
+            positive = pressure > 0
+            if positive.sum() < 2:
+                raise CalculationError("Not enough isotherm points to calculate spreading pressure.")
+            self.max_pressure = pressure[-1]
+            self._set_nodes(pressure[positive], loading[positive])
+
+    def _tabulate(self, low, high):
+        """Evaluate the model on a logarithmic grid between two pressures."""
+        number = max(int(self.nodes_per_decade * numpy.log10(high / low)), 2) + 1
+        pressure = numpy.geomspace(low, high, number)
+        try:
+            loading = numpy.asarray(self.model.loading(pressure), dtype=float)
+            if loading.shape != pressure.shape:
+                raise ValueError
+        except CalculationError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            # some models can only be evaluated one pressure at a time
+            loading = numpy.array([float(self.model.loading(point)) for point in pressure])
+        self._set_nodes(pressure, loading)
+
+    def _set_nodes(self, pressure, loading):
+        """Store nodes and the cumulative spreading pressure at each of them."""
+        loading = numpy.maximum(loading, numpy.abs(loading).max() * 1e-12)
+        slope = numpy.diff(loading) / numpy.diff(pressure)
+        intercept = loading[:-1] - slope * pressure[:-1]
+        segments = slope * numpy.diff(pressure) + intercept * numpy.log(pressure[1:] / pressure[:-1])
+        area = numpy.concatenate(([loading[0]], loading[0] + numpy.cumsum(segments)))
+        self.nodes = (pressure, loading, slope, intercept, area)
+
+    def _cover(self, pressure):
+        """Extend a model grid to cover the highest pressure requested."""
+        if not self.is_model:
+            return
+        highest = numpy.max(pressure, initial=0)
+        nodes = self.nodes[0]
+        if highest > nodes[-1]:
+            self._tabulate(nodes[0], highest * 10)
+
+    def loading_at(self, pressure):
+        """Loading at each pressure."""
+        pressure = numpy.asarray(pressure, dtype=float)
+        self._cover(pressure)
+        nodes, loading, _, _, _ = self.nodes
+        return numpy.where(
+            pressure < nodes[0],
+            loading[0] / nodes[0] * pressure,
+            numpy.interp(pressure, nodes, loading),
+        )
+
+    def spreading_pressure_at(self, pressure):
+        """Reduced spreading pressure at each pressure."""
+        pressure = numpy.asarray(pressure, dtype=float)
+        self._cover(pressure)
+        nodes, loading, slope, intercept, area = self.nodes
+        index = numpy.clip(numpy.searchsorted(nodes, pressure, side='right') - 1, 0, len(nodes) - 2)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            inside = area[index] + slope[index] * (pressure - nodes[index]) + \
+                intercept[index] * numpy.log(pressure / nodes[index])
+            above = area[-1] + loading[-1] * numpy.log(pressure / nodes[-1])
+        return numpy.select(
+            [pressure < nodes[0], pressure >= nodes[-1]],
+            [loading[0] / nodes[0] * pressure, above],
+            inside,
+        )
+
+    def pressure_at(self, spreading_pressure):
+        """Pressure at which each reduced spreading pressure is reached."""
+        spreading_pressure = numpy.asarray(spreading_pressure, dtype=float)
+
+        extensions = 0
+        while self.is_model and extensions < self.max_extensions and \
+                numpy.max(spreading_pressure, initial=0) > self.nodes[4][-1]:
+            self._tabulate(self.nodes[0][0], self.nodes[0][-1] * 100)
+            extensions += 1
+
+        nodes, loading, slope, intercept, area = self.nodes
+        index = numpy.clip(
+            numpy.searchsorted(area, spreading_pressure, side='right') - 1, 0, len(nodes) - 2
+        )
+        low, high = numpy.log(nodes[index]), numpy.log(nodes[index + 1])
+
+        # linear guess within the segment, then Newton steps on log pressure,
+        # since the derivative of the spreading pressure there is the loading
+        fraction = (spreading_pressure - area[index]) / (area[index + 1] - area[index])
+        log_p = numpy.clip(low + fraction * (high - low), low, high)
+        for _ in range(4):
+            pressure = numpy.exp(log_p)
+            residual = spreading_pressure - (
+                area[index] + slope[index] * (pressure - nodes[index]) + intercept[index] *
+                (log_p - low)
+            )
+            segment_loading = loading[index] + slope[index] * (pressure - nodes[index])
+            log_p = numpy.clip(log_p + residual / segment_loading, low, high)
+        pressure = numpy.exp(log_p)
+
+        return numpy.select(
+            [spreading_pressure < area[0], spreading_pressure >= area[-1]],
+            [
+                spreading_pressure * nodes[0] / loading[0],
+                nodes[-1] * numpy.exp((spreading_pressure - area[-1]) / loading[-1]),
+            ],
+            pressure,
+        )
+
+
+def spreading_pressures(isotherms, branch="ads"):
+    """
+    Return the spreading pressure tables of several isotherms.
+
+    Tables are kept in the calculation cache, so that the IAST dialogs
+    reuse them whenever pressures, fractions or numbers of points change,
+    until the isotherm is modified.
+    """
+    from pygapsgui.utilities.calc_cache import calc_cache
+    return [calc_cache.call(SpreadingPressure, isotherm, branch) for isotherm in isotherms]
+
+
+def check_isotherms(isotherms):
+    """Raise a ParameterError if the isotherms cannot be used for IAST."""
+    for isotherm in isotherms:
+        if isinstance(isotherm, ModelIsotherm):
+            if not is_model_iast(isotherm.model.name):
+                raise ParameterError(f"Model {isotherm.model.name} cannot be used with IAST.")
+    if any(iso.pressure_mode.startswith("relative") for iso in isotherms):
+        raise ParameterError("IAST only runs with isotherms on an absolute pressure basis.")
+    if len(isotherms) < 2:
+        raise ParameterError("Pass at least two isotherms.")
+
+
+def _solve(spreading, partial_pressures, tolerance, max_iterations):
+    """Solve mixtures together, returning pure component pressures and loadings."""
+    n_points, n_components = partial_pressures.shape
+    present = partial_pressures > 0
+    solvable = present.any(axis=1)
+
+    def fictitious_pressures(pi):
+        return numpy.stack([sp.pressure_at(pi) for sp in spreading], axis=1)
+
+    def fictitious_loadings(pressure0):
+        return numpy.stack([sp.loading_at(pressure0[:, i]) for i, sp in enumerate(spreading)],
+                           axis=1)
+
+    def mole_fraction_sum(pi, rows):
+        """Sum of adsorbed mole fractions, and its derivative by the spreading pressure."""
+        pressure0 = fictitious_pressures(pi)
+        loading0 = fictitious_loadings(pressure0)
+        fractions = numpy.where(present[rows], partial_pressures[rows] / pressure0, 0)
+        slope = numpy.where(present[rows], partial_pressures[rows] / (pressure0 * loading0), 0)
+        return fractions.sum(axis=1) - 1, -slope.sum(axis=1)
+
+    pi_low = numpy.max([
+        sp.spreading_pressure_at(partial_pressures[:, i]) for i, sp in enumerate(spreading)
+    ], axis=0)
+    pi_high = numpy.max([
+        sp.spreading_pressure_at(partial_pressures[:, i] * n_components)
+        for i, sp in enumerate(spreading)
+    ], axis=0)
+    pi = (pi_low + pi_high) / 2
+
+    active = solvable.copy()
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        residual, slope = mole_fraction_sum(pi[active], active)
+        converged = numpy.abs(residual) < tolerance
+        low, high, current = pi_low[active], pi_high[active], pi[active]
+        low = numpy.where(residual > 0, current, low)
+        high = numpy.where(residual < 0, current, high)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            step = current - residual / slope
+        bisect = ~numpy.isfinite(step) | (step <= low) | (step >= high)
+        pi_low[active], pi_high[active] = low, high
+        pi[active] = numpy.where(converged, current, numpy.where(bisect, (low + high) / 2, step))
+        active[active] = ~converged & (high - low > tolerance * numpy.abs(high))
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        pressure0 = fictitious_pressures(pi)
+        fractions = numpy.where(present, partial_pressures / pressure0, 0)
+        fractions[solvable] /= fractions[solvable].sum(axis=1, keepdims=True)
+        inverse_loading = numpy.where(present, fractions / fictitious_loadings(pressure0), 0)
+        loading_total = numpy.zeros(n_points)
+        loading_total[solvable] = 1 / inverse_loading[solvable].sum(axis=1)
+
+    return pressure0, fractions * loading_total[:, None]
+
+
+def iast_points(
+    isotherms,
+    partial_pressures,
+    branch="ads",
+    warningoff=False,
+    spreading=None,
+    tolerance=1e-10,
+    max_iterations=100,
+    progress=None,
+    chunk_size=25,
+):
+    """
+    Perform IAST calculations for many mixtures at once.
+
+    For each mixture, the common reduced spreading pressure is found such that
+    the adsorbed mole fractions, given by the partial pressures divided by the
+    pure component pressures at that spreading pressure, sum up to one.
+    This is a single monotonic equation per mixture, bracketed between the
+    largest pure component spreading pressures at the partial pressures and at
+    the partial pressures times the number of components, and solved for all
+    mixtures together with safeguarded Newton steps.
+
+    Parameters
+    ----------
+    isotherms : list of ModelIsotherms or PointIsotherms
+        Pure component isotherms, in the same pressure and loading units.
+    partial_pressures : array
+        Partial pressures, one row per mixture and one column per isotherm.
+    branch : str
+        Which branch of the isotherms to use.
+    warningoff : bool, optional
+        When False, log a warning if a model isotherm had to be extrapolated.
+    spreading : list of SpreadingPressure, optional
+        Spreading pressure tables of the isotherms, taken from the
+        cache if not given.
+    tolerance : float, optional
+        Tolerance on the sum of adsorbed mole fractions.
+    max_iterations : int, optional
+        Maximum number of solver iterations.
+    progress : callable, optional
+        If given, mixtures are solved in chunks of `chunk_size`, and
+        ``progress(done, total)`` is called after each. It may raise to stop
+        the calculation.
+    chunk_size : int, optional
+        Number of mixtures solved together when reporting progress.
+
+    Returns
+    -------
+    loading : array
+        Predicted uptakes, one row per mixture and one column per isotherm.
+
+    Raises
+    ------
+    ParameterError
+        If the isotherms or partial pressures are not suitable.
+    CalculationError
+        If the solution cannot be reached without extrapolating a PointIsotherm.
+    """
+    check_isotherms(isotherms)
+    partial_pressures = numpy.atleast_2d(numpy.asarray(partial_pressures, dtype=float))
+    n_points, n_components = partial_pressures.shape
+    if n_components != len(isotherms):
+        raise ParameterError("Number of partial pressures != number of isotherms.")
+    if not numpy.all(numpy.isfinite(partial_pressures)) or numpy.any(partial_pressures < 0):
+        raise ParameterError("Partial pressures must be positive numbers.")
+
+    if spreading is None:
+        spreading = spreading_pressures(isotherms, branch)
+
+    pressure0 = numpy.empty_like(partial_pressures)
+    loadings = numpy.empty_like(partial_pressures)
+    step = chunk_size if progress is not None else n_points
+    for start in range(0, n_points, max(step, 1)):
+        rows = slice(start, start + step)
+        pressure0[rows], loadings[rows] = _solve(
+            spreading, partial_pressures[rows], tolerance, max_iterations
+        )
+        if progress is not None:
+            progress(min(start + step, n_points), n_points)
+
+    present = partial_pressures > 0
+    for i, (isotherm, sp) in enumerate(zip(isotherms, spreading)):
+        extrapolated = present[:, i] & (pressure0[:, i] > sp.max_pressure)
+        if not extrapolated.any():
+            continue
+        highest = pressure0[extrapolated, i].max()
+        if not sp.is_model:
+            raise CalculationError(
+                textwrap.dedent(
+                    f"""
+                    Component {i:d} ({isotherm.adsorbate}) would need its isotherm to be
+                    extrapolated to p0 = {highest:.4g} {isotherm.pressure_unit}, above the
+                    highest pressure in its data ({sp.max_pressure:.4g} {isotherm.pressure_unit}).
+                    Fit a model to the isotherm to allow extrapolation."""
+                )
+            )
+        if not warningoff:
+            logger.warning(
+                textwrap.dedent(
+                    f"""
+                    WARNING:
+                    Component {i:d}: p0 = {highest:.4g} > {sp.max_pressure:.4g}
+                    the highest pressure exhibited in the pure-component
+                    isotherm data. Thus, pyGAPS had to extrapolate the
+                    isotherm data to achieve this IAST result."""
+                )
+            )
+
+    return loadings
+
+
+def iast_binary_vle(
+    isotherms, total_pressure, branch="ads", npoints=30, warningoff=False, progress=None
+):
+    """
+    Vapour-liquid equilibrium of a binary mixture at a fixed total pressure.
+
+    Same as ``pygaps.iast.iast_binary_vle``, with all points solved together.
+    A `progress` callable is passed on to `iast_points`.
+
+    Returns
+    -------
+    dict
+        Dictionary with two components:
+            - `y` the mole fraction of the first adsorbate in the gas phase
+            - `x` the mole fraction of the first adsorbate in the adsorbed phase
+    """
+    if len(isotherms) != 2:
+        raise ParameterError(
+            "The binary equilibrium calculation can only take two components as parameters."
+        )
+    y_data = numpy.linspace(0.01, 0.99, npoints)
+    loadings = iast_points(
+        isotherms,
+        numpy.stack((y_data, 1 - y_data), axis=1) * total_pressure,
+        branch=branch,
+        warningoff=warningoff,
+        progress=progress,
+    )
+    x_data = loadings[:, 0] / loadings.sum(axis=1)
+    return dict(
+        x=numpy.concatenate([[0], x_data, [1]]),
+        y=numpy.concatenate([[0], y_data, [1]]),
+    )
+
+
+def iast_binary_svp(
+    isotherms, mole_fractions, pressures, branch="ads", warningoff=False, progress=None
+):
+    """
+    Selectivity of a binary mixture of fixed composition, at several pressures.
+
+    Same as ``pygaps.iast.iast_binary_svp``, with all points solved together.
+    A `progress` callable is passed on to `iast_points`.
+
+    Returns
+    -------
+    dict
+        Dictionary with two components:
+            - `selectivity` the selectivity of the first component
+            - `pressure` the pressure for each selectivity
+    """
+    if len(isotherms) != 2 or len(mole_fractions) != 2:
+        raise ParameterError(
+            "The selectivity calculation can only take two components as parameters."
+        )
+    if sum(mole_fractions) != 1:
+        raise ParameterError("Mole fractions do not add up to unity")
+    pressures = numpy.asarray(pressures, dtype=float)
+    mole_fractions = numpy.asarray(mole_fractions, dtype=float)
+    loadings = iast_points(
+        isotherms,
+        pressures[:, None] * mole_fractions,
+        branch=branch,
+        warningoff=warningoff,
+        progress=progress,
+    )
+    selectivity = (loadings[:, 0] / mole_fractions[0]) / (loadings[:, 1] / mole_fractions[1])
+    return dict(pressure=pressures, selectivity=selectivity)
@@ -0,0 +1,214 @@
+"""
+An on-disk cache of parsed isotherms, to avoid re-parsing unchanged files.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import threading
+
+# Bump to invalidate all cache entries when the stored format changes
+_CACHE_VERSION = 2
+
+
+class IsothermCache():
+    """
+    Store parsed isotherms on disk, keyed by file path, mtime and size.
+
+    The key also includes the pyGAPS version and any extra parsing
+    options, so that a file is re-parsed if anything which could change
+    the resulting isotherm is different. Entries are stored as pickled
+    isotherm parameters and raw data, rather than as isotherm objects, to
+    avoid pickling thermodynamic backends.
+
+    Next to each entry, a small JSON header with the isotherm material,
+    adsorbate, temperature and user metadata is kept, so that isotherms
+    can be listed and searched without reading their data.
+
+    The total cache size is capped, and least recently used entries are
+    removed first. Access time is tracked through the entry file mtime.
+    """
+
+    max_size = 512 * 1024**2  # bytes
+
+    def __init__(self, directory=None, max_size=None):
+        self._directory = directory
+        if max_size is not None:
+            self.max_size = max_size
+        self._lock = threading.Lock()
+        self._pygaps_version = None
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """Cache location, by default in the user cache folder."""
+        if self._directory is None:
+            from qtpy import QtCore as QC
+            base = QC.QStandardPaths.writableLocation(QC.QStandardPaths.CacheLocation)
+            self._directory = pathlib.Path(base) / "isotherms"
+        self._directory.mkdir(parents=True, exist_ok=True)
+        return self._directory
+
+    @property
+    def pygaps_version(self) -> str:
+        """Version of pyGAPS that parsed the isotherms."""
+        if self._pygaps_version is None:
+            from importlib.metadata import version
+            self._pygaps_version = version("pygaps")
+        return self._pygaps_version
+
+    def key(self, path, extra: str = "") -> str:
+        """Hash of everything that identifies a parsed file."""
+        path = pathlib.Path(path).resolve()
+        stat = path.stat()
+        ident = "|".join(
+            map(
+                str, (
+                    _CACHE_VERSION,
+                    self.pygaps_version,
+                    path,
+                    stat.st_mtime_ns,
+                    stat.st_size,
+                    extra,
+                )
+            )
+        )
+        return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+    def get(self, path, extra: str = ""):
+        """Return a cached isotherm or None if not available."""
+        entry = self.directory / f"{self.key(path, extra)}.pkl"
+        try:
+            with open(entry, "rb") as file:
+                stored = pickle.load(file)
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # corrupt or incompatible entry
+            entry.unlink(missing_ok=True)
+            return None
+        return isotherm_from_stored(stored)
+
+    def get_header(self, path, extra: str = ""):
+        """Return a cached isotherm header or None if not available."""
+        header = self.directory / f"{self.key(path, extra)}.json"
+        try:
+            with open(header, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            header.unlink(missing_ok=True)
+            return None
+
+    def put(self, path, isotherm, extra: str = ""):
+        """Store an isotherm in the cache, evicting old entries if needed."""
+        key = self.key(path, extra)
+        entry = self.directory / f"{key}.pkl"
+        temp = entry.with_suffix(f".{threading.get_ident()}.tmp")
+        with open(temp, "wb") as file:
+            pickle.dump(isotherm_to_stored(isotherm), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, entry)
+        with open(temp, "w", encoding="utf-8") as file:
+            json.dump(isotherm_header(isotherm), file)
+        os.replace(temp, entry.with_suffix(".json"))
+        self.evict()
+
+    def load(self, path, parser, extra: str = ""):
+        """Return an isotherm from the cache, or parse and cache it."""
+        isotherm = self.get(path, extra)
+        if isotherm is not None:
+            return isotherm
+        isotherm = parser(path)
+        if isotherm:
+            try:
+                self.put(path, isotherm, extra)
+            except Exception:  # pylint: disable=broad-except
+                pass  # failing to cache should never prevent loading
+        return isotherm
+
+    def load_header(self, path, parser, extra: str = ""):
+        """
+        Return an isotherm header from the cache, or parse and cache the isotherm.
+
+        The parsed isotherm itself is discarded, to be read back
+        from the cache when it is first needed.
+        """
+        header = self.get_header(path, extra)
+        if header is not None:
+            return header
+        isotherm = self.load(path, parser, extra)
+        if isotherm:
+            return isotherm_header(isotherm)
+        return None
+
+    def evict(self):
+        """Remove least recently used entries until under the size cap."""
+        with self._lock:
+            entries = []
+            for entry in self.directory.glob("*.pkl"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries):
+                if total <= self.max_size:
+                    break
+                entry.unlink(missing_ok=True)
+                entry.with_suffix(".json").unlink(missing_ok=True)
+                total -= size
+
+    def clear(self):
+        """Remove all cached entries."""
+        with self._lock:
+            for entry in self.directory.glob("*.pkl"):
+                entry.unlink(missing_ok=True)
+                entry.with_suffix(".json").unlink(missing_ok=True)
+
+
+def isotherm_header(isotherm) -> dict:
+    """A small summary of an isotherm, enough to list it."""
+    import pygaps
+    return {
+        "material": str(isotherm.material),
+        "adsorbate": str(isotherm.adsorbate),
+        "temperature": isotherm._temperature,
+        "temperature_unit": isotherm.temperature_unit,
+        "model": isinstance(isotherm, pygaps.ModelIsotherm),
+        "properties": {str(key): str(value) for key, value in isotherm.properties.items()},
+    }
+
+
+def isotherm_to_stored(isotherm) -> dict:
+    """Reduce an isotherm to picklable parameters and data."""
+    import pygaps
+    if isinstance(isotherm, pygaps.PointIsotherm):
+        return {
+            "type": "point",
+            "parameters": isotherm.to_dict(),
+            "pressure_key": isotherm.pressure_key,
+            "loading_key": isotherm.loading_key,
+            "data": isotherm.data_raw,
+        }
+    return {"type": "json", "json": isotherm.to_json()}
+
+
+def isotherm_from_stored(stored: dict):
+    """Rebuild an isotherm from its stored form."""
+    import pygaps
+    if stored["type"] == "point":
+        return pygaps.PointIsotherm(
+            isotherm_data=stored["data"],
+            pressure_key=stored["pressure_key"],
+            loading_key=stored["loading_key"],
+            **stored["parameters"],
+        )
+    import pygaps.parsing as pgp
+    return pgp.isotherm_from_json(stored["json"])
+
+
+iso_cache = IsothermCache()
@@ -1,4 +1,5 @@
 import logging
+import threading
 
 logging.captureWarnings(True)
 from io import StringIO
@@ -14,49 +15,92 @@ class LogFilter():
         return logRecord.levelno <= self._level
 
 
+class ThreadStreamHandler(logging.Handler):
+    """Write logs to the capture stream of the thread they were emitted from, if any."""
+    def __init__(self, streams):
+        super().__init__()
+        self.streams = streams
+
+    def emit(self, record):
+        stream = self.streams.get(record.thread)
+        if stream is not None:
+            stream.write(self.format(record) + "\n")
+
+
 class LogHook():
-    """Ties in to the pyGAPS logging functionality and temporarily captures all output."""
+    """
+    Ties in to the pyGAPS logging functionality and temporarily captures all output.
+
+    Captures are kept separately for each thread, so that calculations
+    running at the same time in worker threads only get their own logs.
+    """
 
-    log_stream = None
     logger = None
-    handler = None
 
     def __init__(self):
-        self.log_stream = StringIO()
         self.logger = logging.getLogger('pygaps')
-        self.infohandler = logging.StreamHandler(stream=self.log_stream)
+        self._lock = threading.Lock()
+        self._streams = {}  # thread id: captured logs
+        self._depths = {}  # thread id: number of nested captures
+        self.infohandler = ThreadStreamHandler(self._streams)
         self.infohandler.setLevel(logging.INFO)
         self.infohandler.addFilter(LogFilter(logging.INFO))
         info_fmt = logging.Formatter("<font color=\"black\">%(message)s</font>")
         self.infohandler.setFormatter(info_fmt)
-        self.warninghandler = logging.StreamHandler(stream=self.log_stream)
+        self.warninghandler = ThreadStreamHandler(self._streams)
         self.warninghandler.setLevel(logging.WARNING)
         self.warninghandler.addFilter(LogFilter(logging.WARNING))
         warning_fmt = logging.Formatter("<font color=\"magenta\">Warning: %(message)s</font>")
         self.warninghandler.setFormatter(warning_fmt)
-        self.errorhandler = logging.StreamHandler(stream=self.log_stream)
+        self.errorhandler = ThreadStreamHandler(self._streams)
         self.errorhandler.setLevel(logging.ERROR)
         self.errorhandler.addFilter(LogFilter(logging.ERROR))
         error_fmt = logging.Formatter("<font color=\"red\">Error: %(message)s</font>")
         self.errorhandler.setFormatter(error_fmt)
 
     def __enter__(self):
-        self.logger.addHandler(self.infohandler)
-        self.logger.addHandler(self.warninghandler)
-        self.logger.addHandler(self.errorhandler)
+        ident = threading.get_ident()
+        with self._lock:
+            if not self._depths:
+                self.logger.addHandler(self.infohandler)
+                self.logger.addHandler(self.warninghandler)
+                self.logger.addHandler(self.errorhandler)
+            if ident not in self._depths:
+                self._streams[ident] = StringIO()
+            self._depths[ident] = self._depths.get(ident, 0) + 1
         return self
 
     def __exit__(self, type, value, traceback):
-        self.logger.removeHandler(self.infohandler)
-        self.logger.removeHandler(self.warninghandler)
-        self.logger.removeHandler(self.errorhandler)
+        ident = threading.get_ident()
+        with self._lock:
+            self._depths[ident] -= 1
+            if not self._depths[ident]:
+                del self._depths[ident]
+                del self._streams[ident]
+            if not self._depths:
+                self.logger.removeHandler(self.infohandler)
+                self.logger.removeHandler(self.warninghandler)
+                self.logger.removeHandler(self.errorhandler)
+        if type is not None:
+            # a cancelled background calculation must still stop
+            from pygapsgui.utilities.worker import TaskCancelled
+            if issubclass(type, TaskCancelled):
+                return False
         return True
 
+    @property
+    def log_stream(self):
+        """Stream of the logs captured in the current thread, or None if not capturing."""
+        return self._streams.get(threading.get_ident())
+
     def get_logs(self):
-        """Get all logs during the capture as a string."""
-        logs = self.log_stream.getvalue().replace("\n", "<br>")
-        self.log_stream.truncate(0)
-        self.log_stream.seek(0)
+        """Get all logs of the current thread during the capture as a string."""
+        log_stream = self.log_stream
+        if log_stream is None:
+            return ''
+        logs = log_stream.getvalue().replace("\n", "<br>")
+        log_stream.truncate(0)
+        log_stream.seek(0)
         if logs:
             return logs
         else:
@@ -0,0 +1,19 @@
+"""
+Read isotherm files, without any GUI.
+"""
+
+
+def parse_isotherm(path):
+    """Use pygaps parsing to read an isotherm from a file, based on its extension."""
+    import pygaps.parsing as pgp
+
+    ext = path.suffix
+    if ext == '.csv':
+        return pgp.isotherm_from_csv(path)
+    if ext == '.json':
+        return pgp.isotherm_from_json(path)
+    if ext == '.xls':
+        return pgp.isotherm_from_xl(path)
+    if ext == '.aif':
+        return pgp.isotherm_from_aif(path)
+    raise Exception(f"Unknown isotherm type '{ext}'.")
@@ -0,0 +1,110 @@
+"""
+Names and units of characterisation results.
+
+Used by both the characterisation dialogs and the batch runner, so that
+results exported or saved as metadata are named in the same way.
+"""
+
+
+def bet_results(
+    material_unit,
+    bet_area,
+    c_const,
+    n_monolayer,
+    p_monolayer,
+    slope,
+    intercept,
+    corr_coef,
+    limits,
+) -> dict:
+    """BET area results, with the monolayer uptake in mol."""
+    return {
+        f"BET area [m2/{material_unit}]": bet_area,
+        "BET R^2": corr_coef,
+        "BET C constant": c_const,
+        f"BET monolayer uptake [mmol/{material_unit}]": n_monolayer * 1000,
+        "BET monolayer pressure [p/p0]": p_monolayer,
+        "BET slope": slope,
+        "BET intercept": intercept,
+        "BET pressure limits": limits,
+    }
+
+
+def langmuir_results(
+    material_unit,
+    lang_area,
+    k_const,
+    n_monolayer,
+    slope,
+    intercept,
+    corr_coef,
+    limits,
+) -> dict:
+    """Langmuir area results, with the monolayer uptake in mol."""
+    return {
+        f"Langmuir area [m2/{material_unit}]": lang_area,
+        "Langmuir R^2": corr_coef,
+        "Langmuir K constant": k_const,
+        f"Langmuir monolayer uptake [mmol/{material_unit}]": n_monolayer * 1000,
+        "Langmuir monolayer pressure [p/p0]": 1,  # assumed by the langmuir model
+        "Langmuir slope": slope,
+        "Langmuir intercept": intercept,
+        "Langmuir pressure limits": limits,
+    }
+
+
+def linear_region_results(name, material_unit, results) -> dict:
+    """Results of each linear region of a t-plot or alpha-s plot, `name` being the method."""
+    return {
+        e: {
+            f"{name} pore volume [cm3/{material_unit}]": result.get("adsorbed_volume"),
+            f"{name} area [m2/{material_unit}]": result.get("area"),
+            f"{name} R^2": result.get("corr_coef"),
+            f"{name} slope": result.get("slope"),
+            f"{name} intercept": result.get("intercept"),
+        }
+        for e, result in enumerate(results)
+    }
+
+
+def dadr_results(
+    ptype,
+    material_unit,
+    microp_volume,
+    potential,
+    exponent,
+    slope,
+    intercept,
+    corr_coef,
+    limits,
+) -> dict:
+    """Dubinin-Radushkevich ("DR") or Dubinin-Astakov ("DA") results."""
+    results = {
+        f"{ptype} mircropore Volume [cm3/{material_unit}]": microp_volume * 1000,
+        f"{ptype} effective potential [kJ/mol]": potential,
+        f"{ptype} R^2": corr_coef,
+        f"{ptype} slope": slope,
+        f"{ptype} intercept": intercept,
+        f"{ptype} pressure limits": limits,
+    }
+    if ptype != "DR":
+        results["DR Exponent"] = exponent
+    return results
+
+
+def psd_results(material_unit, results) -> dict:
+    """Pore size distribution results."""
+    return {
+        "Pore widths [nm]": results.get("pore_widths"),
+        "Pore distribution [dV/dW]": results.get("pore_distribution"),
+        f"Pore cumulative volume [cm3/{material_unit}]": results.get("pore_volume_cumulative"),
+    }
+
+
+def isosteric_results(loading_unit, material_unit, results) -> dict:
+    """Isosteric enthalpy results."""
+    return {
+        f"Loading [{loading_unit}/{material_unit}]": results.get("loading"),
+        "Isosteric Enthalpy [kJ/mol]": results.get("isosteric_enthalpy"),
+        "Standard Error [kJ/mol]": results.get("std_errs"),
+    }
@@ -0,0 +1,188 @@
+"""
+Session files, storing all loaded isotherms and the workspace state in one file.
+
+A session file is laid out as::
+
+    magic (8 bytes) | index size (8 bytes) | index | isotherm chunks
+
+The index is zlib-compressed JSON with the workspace state (graph
+settings, explorer order and filter, selected isotherm) and, for each
+isotherm, its name, header, check state and the position of its chunk.
+Only the index is read when a session is opened: isotherms are listed
+from their headers and each chunk is read when the isotherm is first
+needed, so that large sessions open quickly.
+
+Each chunk holds a zlib-compressed JSON description of the isotherm
+(parameters, metadata and units, as in the isotherm cache) followed by
+its data columns, each as a separately compressed array.
+"""
+
+import json
+import os
+import struct
+import zlib
+
+import numpy
+
+from pygapsgui.utilities.iso_cache import isotherm_from_stored
+from pygapsgui.utilities.iso_cache import isotherm_to_stored
+
+MAGIC = b"PGGUISS\x01"
+SESSION_VERSION = 1
+_SIZE = struct.Struct("<Q")
+
+
+def _to_json(value):
+    """Convert values json cannot, such as numpy types."""
+    if isinstance(value, numpy.generic):
+        return value.item()
+    if isinstance(value, numpy.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _dumps(obj) -> bytes:
+    return zlib.compress(json.dumps(obj, default=_to_json).encode("utf-8"))
+
+
+def _loads(data: bytes):
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def encode_isotherm(isotherm) -> bytes:
+    """Pack an isotherm in a session chunk."""
+    stored = isotherm_to_stored(isotherm)
+    blobs = []
+    if stored["type"] == "point":
+        data = stored.pop("data")
+        columns = []
+        for name in data.columns:
+            values = data[name].to_numpy()
+            if values.dtype.kind in "biuf":
+                blob = zlib.compress(numpy.ascontiguousarray(values).tobytes())
+                columns.append([name, values.dtype.str, len(blob)])
+                blobs.append(blob)
+            else:
+                # text columns are few and small
+                columns.append([name, None, values.tolist()])
+        stored["columns"] = columns
+    description = _dumps(stored)
+    return b"".join([_SIZE.pack(len(description)), description, *blobs])
+
+
+def decode_isotherm(chunk: bytes):
+    """Rebuild an isotherm from a session chunk."""
+    import pandas
+    (size, ) = _SIZE.unpack_from(chunk)
+    position = _SIZE.size + size
+    stored = _loads(chunk[_SIZE.size:position])
+    if stored["type"] == "point":
+        data = {}
+        for name, dtype, value in stored.pop("columns"):
+            if dtype is None:
+                data[name] = value
+                continue
+            blob = zlib.decompress(chunk[position:position + value])
+            data[name] = numpy.frombuffer(blob, dtype=dtype)
+            position += value
+        stored["data"] = pandas.DataFrame(data)
+    return isotherm_from_stored(stored)
+
+
+class SessionChunk():
+    """
+    Loader of one isotherm from a session file, as used by LazyIsoModel.
+
+    Called with the session path, it reads and decodes only its chunk.
+    """
+    def __init__(self, offset: int, size: int):
+        self.offset = offset
+        self.size = size
+
+    def read(self, path) -> bytes:
+        """Read the raw chunk, such as to copy it to another session."""
+        with open(path, "rb") as file:
+            file.seek(self.offset)
+            chunk = file.read(self.size)
+        if len(chunk) != self.size:
+            raise ValueError("Session file is truncated.")
+        return chunk
+
+    def __call__(self, path):
+        return decode_isotherm(self.read(path))
+
+
+def write_session(path, state: dict, entries: list) -> list:
+    """
+    Write a session file.
+
+    Parameters
+    ----------
+    path : path-like
+        Session file to write, replaced only once fully written.
+    state : dict
+        Workspace state, json serialisable.
+    entries : list
+        For each isotherm, a dictionary with its "name", "header",
+        "checked" state and encoded "chunk".
+
+    Returns
+    -------
+    list
+        A SessionChunk for each isotherm, to read it back from the file.
+    """
+    isotherms = []
+    position = 0
+    for entry in entries:
+        size = len(entry["chunk"])
+        isotherms.append({
+            "name": entry["name"],
+            "header": entry["header"],
+            "checked": entry["checked"],
+            "offset": position,
+            "size": size,
+        })
+        position += size
+    index = _dumps({"version": SESSION_VERSION, "state": state, "isotherms": isotherms})
+    start = len(MAGIC) + _SIZE.size + len(index)
+
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as file:
+        file.write(MAGIC)
+        file.write(_SIZE.pack(len(index)))
+        file.write(index)
+        for entry in entries:
+            file.write(entry["chunk"])
+    os.replace(temp, path)
+
+    return [SessionChunk(start + iso["offset"], iso["size"]) for iso in isotherms]
+
+
+def read_session(path):
+    """
+    Read the index of a session file.
+
+    Returns
+    -------
+    tuple
+        The workspace state and, for each isotherm, a dictionary with its
+        "name", "header", "checked" state and "chunk" (a SessionChunk).
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError("Not a pyGAPS-gui session file.")
+        (size, ) = _SIZE.unpack(file.read(_SIZE.size))
+        index = _loads(file.read(size))
+    if index["version"] > SESSION_VERSION:
+        raise ValueError("Session file was saved by a newer version of pyGAPS-gui.")
+
+    start = len(MAGIC) + _SIZE.size + size
+    entries = []
+    for iso in index["isotherms"]:
+        entries.append({
+            "name": iso["name"],
+            "header": iso["header"],
+            "checked": iso["checked"],
+            "chunk": SessionChunk(start + iso["offset"], iso["size"]),
+        })
+    return index["state"], entries
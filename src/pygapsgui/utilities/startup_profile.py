@@ -0,0 +1,64 @@
+"""
+Timing of the application startup phases.
+
+Each phase of the startup (imports, creation of the application and of
+the main window, ...) is timed, so that the time to the first painted
+window can be followed. The profile is printed when starting with
+``--test``.
+"""
+
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile():
+    """Record the duration of named startup phases, and when they ended."""
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = []  # (name, duration, end since start)
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed code as a phase."""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, end - begin, end - self.start))
+
+    def mark(self, name: str):
+        """Record a point in time, such as the first paint, as an instant phase."""
+        end = time.perf_counter()
+        self.phases.append((name, 0.0, end - self.start))
+
+    def report(self) -> str:
+        """Table of all phases, in milliseconds."""
+        width = max([len(name) for name, _, _ in self.phases] + [5])
+        lines = [f"{'Phase':<{width}}  {'took':>8}  {'at':>8}"]
+        for name, duration, end in self.phases:
+            lines.append(f"{name:<{width}}  {duration * 1000:8.1f}  {end * 1000:8.1f}")
+        return "\n".join(lines)
+
+
+startup_profile = StartupProfile()
+
+#: Modules only needed once a calculation is started, imported after the first paint
+PRELOAD_MODULES = (
+    "pygaps.parsing",
+    "pygaps.characterisation",
+    "pygaps.modelling",
+    "pygaps.iast",
+    "pygapsgui.utilities.batch",
+)
+
+
+def preload_modules(modules=PRELOAD_MODULES):
+    """Import modules in advance, timing each, ignoring any failure."""
+    import importlib
+    for module in modules:
+        with startup_profile.phase(f"preload {module}"):
+            try:
+                importlib.import_module(module)
+            except Exception:  # pylint: disable=broad-except
+                pass  # reported when the module is actually used
@@ -2,6 +2,12 @@
 Utilities for string matching, particularly for search functionalities.
 """
 
+import bisect
+import functools
+import itertools
+from collections import Counter
+
+from rapidfuzz import fuzz
 from rapidfuzz import process
 
 
@@ -13,3 +19,183 @@ def fuzzy_match_list(text, txt_list, min_score=90) -> bool:
 def fuzzy_match_list_choice(text, txt_list, min_score=90) -> list:
     """Return best matches in a list using fuzzy matching."""
     return (a[0] for a in process.extract(text, txt_list, score_cutoff=min_score))
+
+
+@functools.lru_cache(maxsize=65536)
+def normalise(text: str) -> str:
+    """Lower case, single-spaced version of a string, for comparisons."""
+    return " ".join(str(text).casefold().split())
+
+
+def trigrams(text: str) -> set:
+    """Set of three character substrings of a normalised string, padded with spaces."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex():
+    """
+    Search a collection of entries, each with one or more strings.
+
+    Entries are any hashable key (a name, the id of a list item),
+    searched through their strings (such as aliases, or isotherm
+    metadata). Strings are normalised once, when added. A query is
+    answered in three steps:
+
+        - entries with a string starting with the query, found by
+          bisection in the sorted strings, which acts as a prefix tree
+        - entries with a string containing the query
+        - for longer queries, entries sharing enough trigrams with the
+          query, which are then scored through fuzzy matching
+
+    so that only a small part of the strings is compared to the query.
+    Results are ordered in the same way: prefix, substring then fuzzy
+    matches by decreasing score.
+
+    Parameters
+    ----------
+    min_score : int
+        Minimum fuzzy matching score (0-100) of a result.
+    """
+
+    #: Minimum fraction of query trigrams a string must have to be scored
+    trigram_fraction = 0.3
+    #: Maximum number of entries scored, those sharing the most trigrams
+    fuzzy_candidates = 500
+
+    def __init__(self, min_score=90):
+        self.min_score = min_score
+        self._entries = {}  # key: tuple of normalised strings
+        self._sorted = []  # (string, key id), sorted when needed
+        self._unsorted = False
+        self._ids = {}  # key: key id
+        self._keys = {}  # key id: key
+        self._trigrams = {}  # trigram: {id(key)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def add(self, key, strings):
+        """Add an entry, or update it if its strings have changed."""
+        strings = tuple(dict.fromkeys(normalise(s) for s in strings if s is not None))
+        if self._entries.get(key) == strings:
+            return
+        self.remove(key)
+        key_id = id(key)
+        self._entries[key] = strings
+        self._ids[key] = key_id
+        self._keys[key_id] = key
+        for string in strings:
+            self._sorted.append((string, key_id))
+            for gram in trigrams(string):
+                self._trigrams.setdefault(gram, set()).add(key_id)
+        self._unsorted = True
+
+    def remove(self, key):
+        """Remove an entry, if present."""
+        strings = self._entries.pop(key, None)
+        if strings is None:
+            return
+        key_id = self._ids.pop(key)
+        del self._keys[key_id]
+        self._sort()
+        for string in strings:
+            position = bisect.bisect_left(self._sorted, (string, key_id))
+            del self._sorted[position]
+            for gram in trigrams(string):
+                ids = self._trigrams.get(gram)
+                if ids is not None:
+                    ids.discard(key_id)
+                    if not ids:
+                        del self._trigrams[gram]
+
+    def clear(self):
+        """Remove all entries."""
+        self._entries.clear()
+        self._sorted.clear()
+        self._ids.clear()
+        self._keys.clear()
+        self._trigrams.clear()
+
+    def search(self, text: str) -> list:
+        """
+        Return the keys of the entries matching a text, best first.
+
+        An empty text matches nothing: callers should then show everything.
+        """
+        query = normalise(text)
+        if not query:
+            return []
+
+        results = {}  # key id: None, ordered
+
+        # prefix matches
+        self._sort()
+        position = bisect.bisect_left(self._sorted, (query, ))
+        while position < len(self._sorted) and self._sorted[position][0].startswith(query):
+            results[self._sorted[position][1]] = None
+            position += 1
+
+        # substring matches
+        # strings containing the query contain all its inner (unpadded) trigrams,
+        # while padded ones would only match strings with the query at a word start
+        inner = {query[i:i + 3] for i in range(len(query) - 2)}
+        if inner:
+            postings = sorted((self._trigrams.get(gram, set()) for gram in inner), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            candidates = self._keys
+        for key_id in candidates:
+            if key_id not in results:
+                if any(query in string for string in self._entries[self._keys[key_id]]):
+                    results[key_id] = None
+
+        # fuzzy matches
+        grams = trigrams(query) if inner else set()
+        if grams:
+            needed = max(1, int(len(grams) * self.trigram_fraction))
+            shared = Counter(
+                itertools.chain.from_iterable(self._trigrams.get(gram, ()) for gram in grams)
+            )
+            choices = {
+                (key_id, n): string
+                for key_id, count in shared.most_common(len(results) + self.fuzzy_candidates)
+                if count >= needed and key_id not in results
+                for n, string in enumerate(self._entries[self._keys[key_id]])
+            }
+            for _, _, (key_id, _) in process.extract(
+                query,
+                choices,
+                scorer=fuzz.WRatio,
+                score_cutoff=self.min_score,
+                limit=None,
+            ):
+                results.setdefault(key_id, None)
+
+        return [self._keys[key_id] for key_id in results]
+
+    def match(self, text: str, strings) -> bool:
+        """Whether a text matches any of some strings not in the index, as in `search`."""
+        query = normalise(text)
+        if not query:
+            return False
+        strings = [normalise(s) for s in strings if s is not None]
+        if any(query in string for string in strings):
+            return True
+        if len(query) < 3:
+            return False
+        return process.extractOne(
+            query,
+            strings,
+            scorer=fuzz.WRatio,
+            score_cutoff=self.min_score,
+        ) is not None
+
+    def _sort(self):
+        """Sort the strings added since the last search."""
+        if self._unsorted:
+            self._sorted.sort()
+            self._unsorted = False
@@ -11,13 +11,35 @@ def clipboard_to_table(table):
 
     model = table.model()
     indexes = table.selectedIndexes()
+    if not indexes:
+        return
     row0 = indexes[0].row()
     col0 = indexes[0].column()
 
     text = QW.QApplication.clipboard().text()
+    if not text.strip():
+        return
 
-    data = [list(row.split('\t')) for row in text.split('\n') if row]
-    model.setDataRange(model.index(row0, col0), data, append=True)
+    model.setDataRange(model.index(row0, col0), text_to_frame(text), append=True)
+
+
+def text_to_frame(text):
+    """
+    Parse tab-separated text, such as copied from a spreadsheet.
+
+    The pandas parser types numeric columns directly, which is much faster
+    than splitting and converting each value.
+    """
+    import pandas
+
+    width = max(line.count('\t') for line in text.splitlines() if line) + 1
+    return pandas.read_csv(
+        io.StringIO(text),
+        sep='\t',
+        header=None,
+        names=range(width),
+        skip_blank_lines=True,
+    )
 
 
 def table_to_clipboard(table):
@@ -0,0 +1,122 @@
+"""
+Memoised thermodynamic properties of adsorbates.
+
+pyGAPS asks the adsorbate for its saturation pressure, gas density and
+similar properties on every unit or mode conversion, and each time the
+thermodynamic backend (CoolProp) calculates them again. Once installed,
+the property methods of `pygaps.Adsorbate` are wrapped to store their
+values, so that switching units, plotting in relative pressure or opening
+characterisation dialogs only calls the backend once per adsorbate and
+temperature.
+"""
+
+import functools
+import inspect
+import threading
+
+#: Adsorbate methods which are memoised
+PROPERTIES = (
+    "molar_mass",
+    "saturation_pressure",
+    "surface_tension",
+    "liquid_density",
+    "liquid_molar_density",
+    "gas_density",
+    "gas_molar_density",
+    "enthalpy_liquefaction",
+)
+
+
+class ThermoCache():
+    """
+    Store adsorbate properties by adsorbate object, method and arguments.
+
+    Values which the backend cannot calculate and are read from the
+    adsorbate properties instead are also stored, so the cache must be
+    cleared through `clear` when an adsorbate is edited. Failures are not
+    stored. Calls to the backend are serialised, as each adsorbate keeps
+    a single backend state.
+    """
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._values = {}  # (id(adsorbate), method, arguments): (adsorbate, value)
+        self.installed = False
+
+    def install(self):
+        """Wrap the property methods of pyGAPS adsorbates."""
+        if self.installed:
+            return
+        from pygaps.core.adsorbate import Adsorbate
+        for name in PROPERTIES:
+            setattr(Adsorbate, name, self._wrap(getattr(Adsorbate, name)))
+        self.installed = True
+
+    def _wrap(self, method):
+        """Memoising version of an adsorbate method."""
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def cached(adsorbate, *args, **kwargs):
+            # the same call can be made with positional or keyword arguments
+            bound = signature.bind(adsorbate, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple(bound.arguments.items())[1:]
+            return self.lookup(method, adsorbate, arguments, args, kwargs)
+
+        return cached
+
+    def lookup(self, method, adsorbate, arguments, args, kwargs):
+        """Return a stored value, or call the method and store it."""
+        key = (id(adsorbate), method.__name__, arguments)
+        try:
+            hash(key)
+        except TypeError:
+            # such as array temperatures
+            return method(adsorbate, *args, **kwargs)
+
+        with self._lock:
+            stored = self._values.get(key)
+            if stored is not None and stored[0] is adsorbate:
+                return stored[1]
+            value = method(adsorbate, *args, **kwargs)
+            self._values[key] = (adsorbate, value)
+        return value
+
+    def clear(self):
+        """Remove all stored values."""
+        with self._lock:
+            self._values.clear()
+
+    def warm(self, targets):
+        """
+        Calculate the properties used in unit conversions in advance.
+
+        Parameters
+        ----------
+        targets : iterable
+            Adsorbate name, temperature and temperature unit of isotherms.
+
+        Adsorbates without a backend, or above their critical temperature,
+        are skipped, as their properties can only be read from their
+        parameters, which is fast.
+        """
+        import pygaps
+        from pygaps.units.converter_mode import c_temperature
+
+        for name, temperature, unit in set(targets):
+            try:
+                adsorbate = pygaps.Adsorbate.find(name)
+                if unit != "K":
+                    temperature = c_temperature(temperature, unit, "K")
+                with self._lock:
+                    if temperature >= adsorbate.backend.T_critical():
+                        continue
+                adsorbate.molar_mass()
+                adsorbate.saturation_pressure(temperature)
+                adsorbate.gas_density(temperature)
+                adsorbate.liquid_density(temperature)
+            except Exception:  # pylint: disable=broad-except
+                continue  # calculated and reported when needed
+
+
+thermo_cache = ThermoCache()
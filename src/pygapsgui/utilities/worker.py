@@ -0,0 +1,359 @@
+"""
+Utilities for running long calculations outside of the GUI thread.
+"""
+
+import multiprocessing
+import time
+import traceback
+from functools import partial
+
+from qtpy import QtCore as QC
+
+
+class TaskCancelled(Exception):
+    """Raised inside a cancelled Worker, when it reports progress."""
+
+
+class WorkerSignals(QC.QObject):
+    """Signals emitted by a Worker, delivered in the GUI thread."""
+
+    result = QC.Signal(object)
+    error = QC.Signal(str, str)
+    progress = QC.Signal(int, int)  # done, total
+    finished = QC.Signal()
+
+
+class Worker(QC.QRunnable):
+    """
+    Run a function in a QThreadPool and report back through signals.
+
+    A cancelled worker still emits `finished`, but never `result` or `error`,
+    so that stale results are never delivered to the GUI.
+    """
+    def __init__(self, function, *args, **kwargs):
+        super().__init__()
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        """Mark the worker as cancelled."""
+        self.cancelled = True
+
+    def report_progress(self, done, total):
+        """
+        Report progress from within the function.
+
+        Also the point where a running function is stopped: if the worker
+        was cancelled meanwhile, this raises `TaskCancelled`.
+        """
+        if self.cancelled:
+            raise TaskCancelled
+        self.signals.progress.emit(done, total)
+
+    def run(self):
+        """Call the function, unless cancelled before starting."""
+        try:
+            if self.cancelled:
+                return
+            result = self.function(*self.args, **self.kwargs)
+        except TaskCancelled:
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            if not self.cancelled:
+                self.signals.error.emit(str(exc), traceback.format_exc())
+        else:
+            if not self.cancelled:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+
+class RecalcScheduler(QC.QObject):
+    """
+    Run a repeated calculation in the background, only displaying the latest result.
+
+    Requests are coalesced: while a calculation is running, further
+    requests only mark that another run is needed, so that at most one
+    calculation runs at a time and at most one waits. Results of runs
+    made stale by a newer request are dropped instead of rendered.
+
+    The `calculate` callable runs in a worker thread, with the arguments
+    of the latest `request`. It should not touch the GUI nor use any
+    state which the GUI thread may change: everything it needs should be
+    passed as arguments, and it should return its results (and any logs),
+    which are passed to `render` in the GUI thread, to be stored and displayed.
+    As nothing is shared, a calculation is never waited for: `cancel` only
+    drops its result, and a newer one can start meanwhile.
+
+    The `busy` signal tells whether a result is still expected, for example
+    to hold off accepting a dialog until its latest results are shown.
+
+    If a `progress` callable is given, `calculate` receives a ``progress``
+    keyword argument to call as ``progress(done, total)``, which is relayed
+    to the GUI thread. With `interrupt`, a new request also cancels the
+    running calculation, which stops at its next progress report.
+    """
+
+    busy = QC.Signal(bool)
+
+    def __init__(self, calculate, render, interval=20, parent=None, progress=None, interrupt=False):
+        super().__init__(parent=parent)
+        self.calculate = calculate
+        self.render = render
+        self.progress = progress
+        self.interrupt = interrupt
+        self.pool = QC.QThreadPool.globalInstance()
+        self.running = None
+        self.pending = False
+        self.args = ()
+        self.generation = 0
+        self.is_busy = False
+
+        # collapse requests arriving in the same burst of events
+        self.timer = QC.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.start)
+
+    def request(self, *args):
+        """Ask for a new calculation with some arguments, superseding any previous one."""
+        self.generation += 1
+        self.pending = True
+        self.args = args
+        if self.interrupt and self.running is not None:
+            self.running.cancel()
+        if not self.timer.isActive():
+            self.timer.start()
+        self.update_busy()
+
+    def update_busy(self):
+        """Emit `busy` if a result started or stopped being expected."""
+        is_busy = self.pending or self.running is not None
+        if is_busy != self.is_busy:
+            self.is_busy = is_busy
+            self.busy.emit(is_busy)
+
+    def start(self):
+        """Start the pending calculation, unless one is already running."""
+        if self.running is not None or not self.pending:
+            return
+        self.pending = False
+        worker = Worker(self.calculate, *self.args)
+        if self.progress is not None:
+            worker.kwargs["progress"] = worker.report_progress
+            worker.signals.progress.connect(partial(self.handle_progress, self.generation))
+        worker.signals.result.connect(partial(self.handle_result, self.generation))
+        worker.signals.error.connect(partial(self.handle_error, self.generation))
+        worker.signals.finished.connect(partial(self.handle_finished, worker))
+        self.running = worker
+        self.pool.start(worker)
+
+    def handle_result(self, generation, result):
+        """Render the result if it is still current."""
+        if generation == self.generation:
+            self.render(result)
+
+    def handle_progress(self, generation, done, total):
+        """Relay progress if still current."""
+        if generation == self.generation:
+            self.progress(done, total)
+
+    def handle_error(self, generation, error, trace):
+        """Report unexpected errors if still current."""
+        if generation == self.generation:
+            from pygapsgui.widgets.UtilityDialogs import error_detail_dialog
+            error_detail_dialog(error, trace)
+
+    def handle_finished(self, worker):
+        """Start the next calculation if one was requested meanwhile."""
+        if worker is self.running:
+            self.running = None
+            self.start()
+            self.update_busy()
+
+    def cancel(self):
+        """
+        Drop pending requests and the result of any running calculation, without waiting.
+
+        The running calculation stops at its next progress report, if any,
+        otherwise it finishes in the background, while new ones can start.
+        """
+        self.timer.stop()
+        self.pending = False
+        self.generation += 1
+        if self.running is not None:
+            self.running.cancel()
+            self.running = None
+        self.update_busy()
+
+
+def _serve_tasks(connection):
+    """Run the tasks received in a child process and send back their outcomes, until told to stop."""
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        function, args = task
+        # the task is received once its modules are imported, which is not timed
+        connection.send(None)
+        try:
+            connection.send((True, function(*args)))
+        except Exception as exc:  # pylint: disable=broad-except
+            connection.send((False, str(exc)))
+    connection.close()
+
+
+class ProcessRunner(QC.QObject):
+    """
+    Run independent CPU-bound tasks in separate processes, with a timeout.
+
+    Tasks run in up to `max_workers` child processes, each running one task
+    at a time and reused for the next ones. Unlike a process pool, a worker
+    running a task which takes longer than `timeout` seconds, or all workers
+    when cancelled, can be terminated. Each worker has its own pipe, so
+    terminating one cannot affect the others. Outcomes are polled from the
+    GUI thread, and reported as each task finishes. Workers are stopped once
+    all tasks are done.
+
+    Workers are started with "spawn", as forking a multithreaded Qt process
+    is unsafe, so task functions and their arguments must be picklable,
+    and should not use Qt.
+    """
+
+    result = QC.Signal(object, object)  # key, result
+    failed = QC.Signal(object, str)  # key, error
+    progress = QC.Signal(int, int)  # done, total
+    finished = QC.Signal()
+
+    context = multiprocessing.get_context("spawn")
+
+    def __init__(self, timeout=None, max_workers=None, interval=50, parent=None):
+        super().__init__(parent=parent)
+        self.timeout = timeout
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.waiting = []
+        self.idle = []  # (process, connection) of workers without a task
+        self.running = {}  # key: (process, connection, start time, None until started)
+        self.total = 0
+        self.done = 0
+
+        self.timer = QC.QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.poll)
+
+    def run(self, tasks: dict):
+        """Start running tasks, given as {key: (function, args)}."""
+        self.cancel()
+        self.waiting = list(tasks.items())
+        self.total = len(self.waiting)
+        self.done = 0
+        if not self.total:
+            self.finished.emit()
+            return
+        self.start_waiting()
+        self.timer.start()
+
+    def is_running(self) -> bool:
+        """Whether tasks are still running or waiting."""
+        return bool(self.running or self.waiting)
+
+    def start_waiting(self):
+        """Give waiting tasks to free workers, starting workers as needed."""
+        while self.waiting and len(self.running) < self.max_workers:
+            key, task = self.waiting.pop(0)
+            if self.idle:
+                process, connection = self.idle.pop()
+            else:
+                connection, child_connection = self.context.Pipe()
+                process = self.context.Process(
+                    target=_serve_tasks,
+                    args=(child_connection, ),
+                    daemon=True,
+                )
+                process.start()
+                child_connection.close()  # only the child uses it
+            self.running[key] = (process, connection, None)
+            try:
+                connection.send(task)
+            except Exception as exc:  # pylint: disable=broad-except
+                self.finish(key, False, f"cannot send task: {exc}")
+
+    def poll(self):
+        """Collect outcomes, enforce timeouts and start waiting tasks."""
+        now = time.monotonic()
+        for key in list(self.running):
+            if key not in self.running:
+                continue  # cancelled by a handler meanwhile
+            process, connection, start = self.running[key]
+            # outcomes are sent before exiting, so check liveness first
+            alive = process.is_alive()
+            try:
+                message = connection.recv() if connection.poll() else False
+                if message is None:
+                    # the task started, time it from now
+                    start = now
+                    self.running[key] = (process, connection, start)
+                    message = connection.recv() if connection.poll() else False
+            except EOFError:
+                self.finish(key, False, f"process exited with code {process.exitcode}", keep=False)
+                continue
+            if message:
+                success, outcome = message
+                self.finish(key, success, outcome)
+            elif not alive:
+                self.finish(key, False, f"process exited with code {process.exitcode}", keep=False)
+            elif self.timeout and start is not None and now - start > self.timeout:
+                self.finish(key, False, f"timed out after {self.timeout:g} s", keep=False)
+
+        self.start_waiting()
+        if not self.is_running() and self.timer.isActive():
+            self.timer.stop()
+            self.stop_idle()
+            self.finished.emit()
+
+    def finish(self, key, success, outcome, keep=True):
+        """Report the outcome of a task, keeping its worker for the next one or terminating it."""
+        process, connection, _ = self.running.pop(key)
+        if keep:
+            self.idle.append((process, connection))
+        else:
+            self.terminate(process, connection)
+        if success:
+            self.result.emit(key, outcome)
+        else:
+            self.failed.emit(key, outcome)
+        self.done += 1
+        self.progress.emit(self.done, self.total)
+
+    @staticmethod
+    def terminate(process, connection):
+        """Stop a worker immediately."""
+        process.terminate()
+        connection.close()
+        process.join(0)
+
+    def stop_idle(self):
+        """Let the workers without a task exit."""
+        for process, connection in self.idle:
+            try:
+                connection.send(None)
+            except (OSError, ValueError):
+                process.terminate()
+            connection.close()
+            process.join(0)
+        self.idle = []
+
+    def cancel(self):
+        """Terminate all running tasks and drop waiting ones."""
+        self.timer.stop()
+        self.waiting = []
+        for process, connection, _ in self.running.values():
+            self.terminate(process, connection)
+        self.running = {}
+        self.stop_idle()
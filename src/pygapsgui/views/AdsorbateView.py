@@ -9,7 +9,7 @@ else:
 
 from pygaps import ADSORBATE_LIST
 from pygaps import Adsorbate
-from pygapsgui.utilities.string_match import fuzzy_match_list
+from pygapsgui.utilities.string_match import SearchIndex
 from pygapsgui.utilities.tex2svg import tex2svg
 from pygapsgui.widgets.MetadataEditWidget import MetadataEditWidget
 from pygapsgui.widgets.UtilityWidgets import LabelAlignCenter
@@ -167,6 +167,7 @@ class AdsorbateListDialog(QW.QDialog):
     """Dialog with a list of Adsorbates and an AdsorbateView."""
 
     adsorbates: dict = None  # all aliases of adsorbates
+    search_index: SearchIndex = None
     adsorbate_changed = QC.Signal(str)
 
     def __init__(self, *args, **kwargs):
@@ -212,6 +213,9 @@ class AdsorbateListDialog(QW.QDialog):
     def setup_view(self):
         """Add all adsorbates to the view list."""
         self.adsorbates = {ads.name: ads.alias for ads in ADSORBATE_LIST}
+        self.search_index = SearchIndex()
+        for name, alias in self.adsorbates.items():
+            self.search_index.add(name, [name, *alias])
         self.adsorbate_list.addItems(self.adsorbates.keys())
         self.adsorbate_list.currentItemChanged.connect(self.select_adsorbate)
 
@@ -226,9 +230,7 @@ class AdsorbateListDialog(QW.QDialog):
         if text == "":
             self.adsorbate_list.addItems(self.adsorbates.keys())
         else:
-            self.adsorbate_list.addItems([
-                k for (k, v) in self.adsorbates.items() if fuzzy_match_list(text, v)
-            ])
+            self.adsorbate_list.addItems(self.search_index.search(text))
 
     def translate_UI(self):
         """Set static UI text through QT translation."""
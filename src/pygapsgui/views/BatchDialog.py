@@ -0,0 +1,106 @@
+from qtpy import QtCore as QC
+from qtpy import QtWidgets as QW
+
+from pygapsgui.widgets.UtilityWidgets import LabelAlignRight
+from pygapsgui.widgets.UtilityWidgets import LabelOutput
+
+
+class BatchDialog(QW.QDialog):
+    """Batch characterisation of several isotherms: QT MVC Dialog."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setup_UI()
+        self.translate_UI()
+        self.connect_signals()
+
+    def setup_UI(self):
+        """Create and set-up static UI elements."""
+        self.setObjectName("BatchDialog")
+
+        _layout = QW.QVBoxLayout(self)
+
+        self.options_box = QW.QGroupBox()
+        _layout.addWidget(self.options_box)
+        self.res_box = QW.QGroupBox()
+        _layout.addWidget(self.res_box)
+
+        # Options box
+        self.options_layout = QW.QGridLayout(self.options_box)
+
+        self.options_layout.addWidget(LabelAlignRight("Method:"), 0, 0, 1, 1)
+        self.method_dropdown = QW.QComboBox()
+        self.options_layout.addWidget(self.method_dropdown, 0, 1, 1, 2)
+
+        self.run_button = QW.QPushButton()
+        self.run_button.setDefault(True)
+        self.run_button.setAutoDefault(True)
+        self.options_layout.addWidget(self.run_button, 0, 3, 1, 1)
+
+        ## Method specific settings, filled in by the model
+        self.settings_widget = QW.QWidget()
+        self.settings_layout = QW.QFormLayout(self.settings_widget)
+        self.settings_layout.setContentsMargins(0, 0, 0, 0)
+        self.settings_dropdowns = {}
+        self.options_layout.addWidget(self.settings_widget, 1, 0, 1, 4)
+
+        self.progress = QW.QProgressBar()
+        self.options_layout.addWidget(self.progress, 2, 0, 1, 4)
+
+        # Results box
+        self.res_layout = QW.QVBoxLayout(self.res_box)
+
+        self.res_table = QW.QTableWidget(0, 0, self)
+        self.res_table.setEditTriggers(QW.QAbstractItemView.NoEditTriggers)
+        self.res_table.verticalHeader().setSectionResizeMode(QW.QHeaderView.ResizeToContents)
+        self.res_table.setMinimumHeight(200)
+        self.res_layout.addWidget(self.res_table)
+
+        self.res_layout.addWidget(QW.QLabel("Calculation log:"))
+        self.output = LabelOutput()
+        self.res_layout.addWidget(self.output)
+
+        # Bottom buttons
+        self.button_box = QW.QDialogButtonBox()
+        self.button_box.setOrientation(QC.Qt.Horizontal)
+        self.save_btn = self.button_box.addButton(
+            "Save as metadata", QW.QDialogButtonBox.AcceptRole
+        )
+        self.export_btn = self.button_box.addButton(
+            "Export results", QW.QDialogButtonBox.ActionRole
+        )
+        self.button_box.addButton("Cancel", QW.QDialogButtonBox.RejectRole)
+        _layout.addWidget(self.button_box)
+
+    def set_settings(self, settings: dict):
+        """Replace the settings dropdowns, from a dictionary of {name: choices}."""
+        while self.settings_layout.rowCount():
+            self.settings_layout.removeRow(0)
+        self.settings_dropdowns = {}
+        for name, choices in settings.items():
+            dropdown = QW.QComboBox()
+            dropdown.addItems([str(choice) for choice in choices])
+            dropdown.setEnabled(len(choices) > 1)
+            self.settings_layout.addRow(name.replace("_", " ").capitalize() + ":", dropdown)
+            self.settings_dropdowns[name] = dropdown
+
+    def get_settings(self) -> dict:
+        """Return the current selected settings."""
+        return {name: dropdown.currentText() for name, dropdown in self.settings_dropdowns.items()}
+
+    def sizeHint(self) -> QC.QSize:
+        """Suggest ideal dimensions."""
+        return QC.QSize(900, 700)
+
+    def connect_signals(self):
+        """Connect permanent signals."""
+        pass
+
+    def translate_UI(self):
+        """Set static UI text through QT translation."""
+        # yapf: disable
+        # pylint: disable=line-too-long
+        self.setWindowTitle(QW.QApplication.translate("BatchDialog", "Batch characterization", None, -1))
+        self.options_box.setTitle(QW.QApplication.translate("BatchDialog", "Options", None, -1))
+        self.res_box.setTitle(QW.QApplication.translate("BatchDialog", "Results", None, -1))
+        self.run_button.setText(QW.QApplication.translate("BatchDialog", "Run", None, -1))
+        # yapf: enable
@@ -8,7 +8,13 @@ from pygapsgui.widgets.GraphSelectorToolbar import VSelectorToolbar
 
 
 class GraphView(QW.QWidget):
-    """A widget that extends the matplotlib canvas with some useful functionality."""
+    """
+    A widget that extends the matplotlib canvas with some useful functionality.
+
+    Range selector limit lines are drawn as a blitted overlay: the rest of
+    the figure is cached after every full draw, so that moving the limits
+    only redraws the limit lines themselves.
+    """
 
     canvas = None
     figure = None
@@ -23,6 +29,10 @@ class GraphView(QW.QWidget):
     ylow = None  # can be plt.ax
     yhigh = None  # can be plt.ax
 
+    # for blitting
+    blit = True
+    background = None
+
     def __init__(
         self,
         x_range_select=False,
@@ -42,6 +52,8 @@ class GraphView(QW.QWidget):
         self.figure = Figure(figsize=(5, 5), tight_layout=True)
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot()
+        self.blit = self.blit and self.canvas.supports_blit
+        self.canvas.mpl_connect("draw_event", self.handle_draw)
 
         _layout = QW.QGridLayout(self)
         row = 0
@@ -70,27 +82,50 @@ class GraphView(QW.QWidget):
         """Creates and connects a selector for the x-axis."""
         self.x_range_select = HSelectorToolbar("HRangeSelect", ax=self.ax)
         self.x_range_select.slider.rangeChanged.connect(self.draw_xlimits)
-        self.x_lower = self.ax.axvline(0, c="r", ls="--")
-        self.x_upper = self.ax.axvline(1, c="r", ls="--")
+        self.x_lower = self.ax.axvline(0, c="r", ls="--", animated=self.blit)
+        self.x_upper = self.ax.axvline(1, c="r", ls="--", animated=self.blit)
 
     def setupYRangeSelect(self):
         """Creates and connects a selector for the y-axis."""
         self.y_range_select = VSelectorToolbar("VRangeSelect", ax=self.ax)
         self.y_range_select.slider.rangeChanged.connect(self.draw_ylimits)
-        self.ylow = self.ax.axhline(0, c="r", ls="--")
-        self.yhigh = self.ax.axhline(1, c="r", ls="--")
+        self.ylow = self.ax.axhline(0, c="r", ls="--", animated=self.blit)
+        self.yhigh = self.ax.axhline(1, c="r", ls="--", animated=self.blit)
 
     def draw_xlimits(self, low, high):
         """Sets the selector limits for the x axis."""
         self.x_lower.set_xdata([low, low])
         self.x_upper.set_xdata([high, high])
-        self.canvas.draw_idle()
+        self.draw_limits()
 
     def draw_ylimits(self, low, high):
         """Sets the selector limits for the y axis."""
         self.ylow.set_ydata([low, low])
         self.yhigh.set_ydata([high, high])
-        self.canvas.draw_idle()
+        self.draw_limits()
+
+    def limit_lines(self):
+        """Return all selector limit lines."""
+        lines = (self.x_lower, self.x_upper, self.ylow, self.yhigh)
+        return [line for line in lines if line is not None]
+
+    def handle_draw(self, event):
+        """After a full draw, cache the static background and draw limits on top."""
+        if not self.blit:
+            return
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for line in self.limit_lines():
+            self.ax.draw_artist(line)
+
+    def draw_limits(self):
+        """Redraw only the limit lines over the cached background."""
+        if not self.blit or self.background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        for line in self.limit_lines():
+            self.ax.draw_artist(line)
+        self.canvas.blit(self.figure.bbox)
 
     def clear(self):
         """Custom clear function that only removes what's needed."""
@@ -60,11 +60,18 @@ class IASTSVPDialog(QW.QDialog):
         self.calc_button.setAutoDefault(True)
         self.options_layout.addWidget(self.calc_button, 4, 0, 1, 3)
 
+        ## Calculation progress
+        self.progress = QW.QProgressBar()
+        self.options_layout.addWidget(self.progress, 5, 0, 1, 2)
+        self.calc_cancel_button = QW.QPushButton()
+        self.calc_cancel_button.setEnabled(False)
+        self.options_layout.addWidget(self.calc_cancel_button, 5, 2, 1, 1)
+
         ## Output log
         self.output_label = QW.QLabel("Calculation log:")
         self.output = LabelOutput()
-        self.options_layout.addWidget(self.output_label, 5, 0)
-        self.options_layout.addWidget(self.output, 6, 0, 1, 3)
+        self.options_layout.addWidget(self.output_label, 6, 0)
+        self.options_layout.addWidget(self.output, 7, 0, 1, 3)
 
         # Result display
         self.res_graph = GraphView()
@@ -75,6 +82,7 @@ class IASTSVPDialog(QW.QDialog):
         self.button_box = QW.QDialogButtonBox()
         self.button_box.setOrientation(QC.Qt.Horizontal)
         self.button_box.setStandardButtons(QW.QDialogButtonBox.Save | QW.QDialogButtonBox.Close)
+        self.accept_btn = self.button_box.button(QW.QDialogButtonBox.Save)
         _layout.addWidget(self.button_box, 1, 0, 1, 2)
 
     def sizeHint(self) -> QC.QSize:
@@ -91,4 +99,5 @@ class IASTSVPDialog(QW.QDialog):
         # pylint: disable=line-too-long
         self.setWindowTitle(QW.QApplication.translate("IASTSVPDialog", "IAST: selectivity-pressure calculation", None, -1))
         self.calc_button.setText(QW.QApplication.translate("IASTSVPDialog", "Calculate", None, -1))
+        self.calc_cancel_button.setText(QW.QApplication.translate("IASTSVPDialog", "Cancel", None, -1))
         # yapf: enable
@@ -61,11 +61,18 @@ class IASTVLEDialog(QW.QDialog):
         self.calc_autobox = QW.QCheckBox()
         self.options_layout.addWidget(self.calc_autobox, 4, 2, 1, 1)
 
+        ## Calculation progress
+        self.progress = QW.QProgressBar()
+        self.options_layout.addWidget(self.progress, 5, 0, 1, 2)
+        self.calc_cancel_button = QW.QPushButton()
+        self.calc_cancel_button.setEnabled(False)
+        self.options_layout.addWidget(self.calc_cancel_button, 5, 2, 1, 1)
+
         ## Output log
         self.output_label = QW.QLabel("Calculation log:")
         self.output = LabelOutput()
-        self.options_layout.addWidget(self.output_label, 5, 0)
-        self.options_layout.addWidget(self.output, 6, 0, 1, 3)
+        self.options_layout.addWidget(self.output_label, 6, 0)
+        self.options_layout.addWidget(self.output, 7, 0, 1, 3)
 
         # Result display
         self.res_graph = GraphView()
@@ -75,6 +82,7 @@ class IASTVLEDialog(QW.QDialog):
         self.button_box = QW.QDialogButtonBox()
         self.button_box.setOrientation(QC.Qt.Horizontal)
         self.button_box.setStandardButtons(QW.QDialogButtonBox.Save | QW.QDialogButtonBox.Close)
+        self.accept_btn = self.button_box.button(QW.QDialogButtonBox.Save)
         _layout.addWidget(self.button_box, 1, 0, 1, 2)
 
     def sizeHint(self) -> QC.QSize:
@@ -91,5 +99,6 @@ class IASTVLEDialog(QW.QDialog):
         # pylint: disable=line-too-long
         self.setWindowTitle(QW.QApplication.translate("IASTVLEDialog", "IAST: bulk-adsorbed equilibrium", None, -1))
         self.calc_button.setText(QW.QApplication.translate("IsoModelByDialog", "Calculate", None, -1))
+        self.calc_cancel_button.setText(QW.QApplication.translate("IASTVLEDialog", "Cancel", None, -1))
         self.calc_autobox.setText(QW.QApplication.translate("IsoModelByDialog", "Auto", None, -1))
         # yapf: enable
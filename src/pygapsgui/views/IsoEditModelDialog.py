@@ -9,6 +9,7 @@ from qtpy import QtWidgets as QW
 from pygaps.modelling import _MODELS
 from pygaps.modelling import get_isotherm_model
 from pygaps.modelling import model_from_dict
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.tex2svg import tex2svg
 from pygapsgui.widgets.SpinBoxLimitSlider import QHSpinBoxLimitSlider
 
@@ -271,6 +272,7 @@ class IsoEditModelDialog(QW.QDialog):
 
     def accept(self) -> None:
         """Commit the changes to the model if accepted."""
+        calc_cache.invalidate(self.isotherm)
         self.isotherm.branch = self.view.current_branch
         self.isotherm.model = self.view.current_model
         return super().accept()
@@ -1,7 +1,10 @@
 from qtpy import QtCore as QC
+from qtpy import QtGui as QG
 from qtpy import QtWidgets as QW
 
 from pygapsgui.models.IsoDataTableModel import IsoDataTableModel
+from pygapsgui.models.TableCommands import make_undo_stack
+from pygapsgui.utilities.calc_cache import calc_cache
 from pygapsgui.utilities.table_to_clipboard import clipboard_to_table
 from pygapsgui.utilities.table_to_clipboard import table_to_clipboard
 from pygapsgui.widgets.SciDoubleSpinbox import SciFloatDelegate
@@ -25,7 +28,9 @@ class IsoEditPointWidget(QW.QWidget):
 
     def set_datatable_model(self, datatable_model=None):
         """Create and link the datatable model."""
+        self.undo_stack.clear()
         self.datatable_model = IsoDataTableModel(datatable_model)
+        self.datatable_model.undo_stack = self.undo_stack
         self.table_view.setModel(self.datatable_model)
 
     def setup_UI(self):
@@ -48,7 +53,8 @@ class IsoEditPointWidget(QW.QWidget):
         self.horizontal_header = self.table_view.horizontalHeader()
         self.vertical_header = self.table_view.verticalHeader()
         self.horizontal_header.setSectionResizeMode(QW.QHeaderView.Stretch)
-        self.vertical_header.setSectionResizeMode(QW.QHeaderView.ResizeToContents)
+        # resizing each row to its contents is linear in the number of points
+        self.vertical_header.setSectionResizeMode(QW.QHeaderView.Fixed)
 
         # Edit functions
         edit_widget = QW.QWidget()
@@ -59,11 +65,28 @@ class IsoEditPointWidget(QW.QWidget):
         self.edit_del_row = QW.QPushButton()
         self.edit_add_col = QW.QPushButton()
         self.edit_del_col = QW.QPushButton()
+        self.edit_undo = QW.QPushButton()
+        self.edit_redo = QW.QPushButton()
         edit_layout.addWidget(self.edit_label, 0, 0, 1, 2)
         edit_layout.addWidget(self.edit_add_row, 1, 0)
         edit_layout.addWidget(self.edit_del_row, 1, 1)
         edit_layout.addWidget(self.edit_add_col, 2, 0)
         edit_layout.addWidget(self.edit_del_col, 2, 1)
+        edit_layout.addWidget(self.edit_undo, 3, 0)
+        edit_layout.addWidget(self.edit_redo, 3, 1)
+
+        # Undo history, shared by all models set on this widget
+        self.undo_stack = make_undo_stack(self)
+        self.edit_undo.setEnabled(False)
+        self.edit_redo.setEnabled(False)
+        self.undo_action = QW.QAction(self)
+        self.undo_action.setShortcut(QG.QKeySequence.Undo)
+        self.undo_action.setShortcutContext(QC.Qt.WidgetWithChildrenShortcut)
+        self.redo_action = QW.QAction(self)
+        self.redo_action.setShortcut(QG.QKeySequence.Redo)
+        self.redo_action.setShortcutContext(QC.Qt.WidgetWithChildrenShortcut)
+        self.addAction(self.undo_action)
+        self.addAction(self.redo_action)
 
     def connect_signals(self):
         """Connect permanent signals."""
@@ -71,6 +94,24 @@ class IsoEditPointWidget(QW.QWidget):
         self.edit_del_row.pressed.connect(self.del_row)
         self.edit_add_col.pressed.connect(self.add_col)
         self.edit_del_col.pressed.connect(self.del_col)
+        self.edit_undo.pressed.connect(self.undo)
+        self.edit_redo.pressed.connect(self.redo)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action.triggered.connect(self.redo)
+        self.undo_stack.canUndoChanged.connect(self.edit_undo.setEnabled)
+        self.undo_stack.canRedoChanged.connect(self.edit_redo.setEnabled)
+
+    def undo(self):
+        """Undo the last edit."""
+        if self.undo_stack.canUndo():
+            self.undo_stack.undo()
+            self.changed.emit()
+
+    def redo(self):
+        """Redo the last undone edit."""
+        if self.undo_stack.canRedo():
+            self.undo_stack.redo()
+            self.changed.emit()
 
     def add_row(self):
         """Insert a row at current location."""
@@ -119,10 +160,12 @@ class IsoEditPointWidget(QW.QWidget):
         ncols = self.datatable_model.columnCount()
         dtype = type_input.currentText()
 
+        self.undo_stack.beginMacro("New data type")
         self.datatable_model.insertColumn(ncols)
         if dtype == "text":
             self.datatable_model.setColumnDtype(ncols, "object")
         self.datatable_model.setHeaderData(ncols, QC.Qt.Horizontal, input.text())
+        self.undo_stack.endMacro()
         self.changed.emit()
 
     def del_col(self):
@@ -160,6 +203,8 @@ class IsoEditPointWidget(QW.QWidget):
         self.edit_del_row.setText(QW.QApplication.translate("IsoEditPointDialog", "Delete Row", None, -1))
         self.edit_add_col.setText(QW.QApplication.translate("IsoEditPointDialog", "New data type", None, -1))
         self.edit_del_col.setText(QW.QApplication.translate("IsoEditPointDialog", "Delete data type", None, -1))
+        self.edit_undo.setText(QW.QApplication.translate("IsoEditPointDialog", "Undo", None, -1))
+        self.edit_redo.setText(QW.QApplication.translate("IsoEditPointDialog", "Redo", None, -1))
         # yapf: enable
 
 
@@ -174,7 +219,7 @@ class IsoEditPointDialog(QW.QDialog):
         self.translate_UI()
         self.connect_signals()
 
-        self.view.set_datatable_model(self.isotherm.data_raw.copy())
+        self.view.set_datatable_model(self.isotherm.data_raw)
 
     def setup_UI(self):
         """Create and set-up static UI elements."""
@@ -199,7 +244,8 @@ class IsoEditPointDialog(QW.QDialog):
 
     def accept(self) -> None:
         """If accepted we commit the data."""
-        self.isotherm.data_raw = self.view.datatable_model._data
+        calc_cache.invalidate(self.isotherm)
+        self.isotherm.data_raw = self.view.datatable_model.dataframe()
         return super().accept()
 
     def translate_UI(self):
@@ -1,12 +1,48 @@
 import itertools
 
+import numpy
+from cycler import cycler
+from qtpy import QtCore as QC
+
 import pygaps.graphing as pgg
 import pygaps.utilities.exceptions as pge
+from pygaps.graphing.isotherm_graphs import _BRANCH_TYPES
+from pygaps.graphing.mpl_styles import ISO_MARKERS
+from pygaps.graphing.mpl_styles import Y1_COLORS
+from pygapsgui.utilities.calc_cache import calc_cache
+from pygapsgui.utilities.decimate import minmax_indices
 from pygapsgui.views.GraphView import GraphView
 from pygapsgui.widgets.IsoGraphToolbar import IsoGraphToolbar
 from pygapsgui.widgets.UtilityDialogs import error_dialog
 
 
+class ConvertedIsotherm():
+    """
+    Stand-in for an isotherm when plotting.
+
+    Pressure, loading and other data are read through the calculation cache,
+    so that redrawing in the same units does not convert them again.
+    Everything else is read from the isotherm.
+    """
+    def __init__(self, isotherm):
+        self.isotherm = isotherm
+
+    def __getattr__(self, name):
+        return getattr(self.isotherm, name)
+
+    def pressure(self, **kwargs):
+        """Cached isotherm pressure."""
+        return calc_cache.converted(self.isotherm, "pressure", **kwargs)
+
+    def loading(self, **kwargs):
+        """Cached isotherm loading."""
+        return calc_cache.converted(self.isotherm, "loading", **kwargs)
+
+    def other_data(self, key, **kwargs):
+        """Cached isotherm other data."""
+        return calc_cache.converted(self.isotherm, "other_data", key, **kwargs)
+
+
 class IsoGraphView(GraphView):
     """A canvas specifically designed to display isotherms.
 
@@ -20,6 +56,8 @@ class IsoGraphView(GraphView):
     - has functionality to linearize/log one or more axes
     - integrates with ``IsoGraphToolbar`` to provide custom isotherm actions
     - integrates with ``SelectorToolbar`` to allow data range selection
+    - draws lines with many more points than pixels at a reduced level of
+      detail, resampled whenever the x axis range changes
 
     """
 
@@ -45,6 +83,26 @@ class IsoGraphView(GraphView):
     lgd_keys: list = None
     lgd_pos: str = "best"
 
+    decimate: bool = True
+    decimate_above: int = 5000  # lines with more points are decimated
+    dense_lines: dict = None  # line -> full (x, y) data
+
+    # display settings kept in sessions
+    _SETTINGS = (
+        "x_data",
+        "y1_data",
+        "logx",
+        "logy",
+        "lgd_keys",
+        "lgd_pos",
+        "pressure_mode",
+        "pressure_unit",
+        "loading_basis",
+        "loading_unit",
+        "material_basis",
+        "material_unit",
+    )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -52,6 +110,12 @@ class IsoGraphView(GraphView):
         self.data_types = ["pressure", "loading"]
         self.lgd_keys = ["material", "adsorbate", "temperature", "key"]
 
+        # level of detail
+        self.dense_lines = {}
+        self.decimate = QC.QSettings().value("plotDecimation", True, type=bool)
+        self.ax.callbacks.connect("xlim_changed", self.handle_xlim)
+        self.canvas.mpl_connect("resize_event", self.handle_xlim)
+
         # anything less and it looks too cramped
         self.setMinimumSize(400, 400)
 
@@ -92,6 +156,7 @@ class IsoGraphView(GraphView):
             try:
                 self._pg_plot_isotherms()
                 self.ax.autoscale()
+                self.register_dense_lines()
             except pge.GraphingError:
                 error_dialog(
                     "X-axis and Y1-axis must display data that is shared by all isotherms (i.e. pressure or loading)."
@@ -105,7 +170,7 @@ class IsoGraphView(GraphView):
     def _pg_plot_isotherms(self):
         """Calls the pygaps plot function with all View state."""
         pgg.plot_iso(
-            self.isotherms,
+            [ConvertedIsotherm(iso) for iso in self.isotherms],
             ax=self.ax,
             branch=self._branch,
             logx=self.logx,
@@ -120,6 +185,50 @@ class IsoGraphView(GraphView):
             lgd_keys=self.lgd_keys,
         )
 
+    def register_dense_lines(self):
+        """Keep the full data of newly plotted lines with many points, and decimate them."""
+        for line in self.ax.get_lines():
+            if line in self.dense_lines or line in self.limit_lines():
+                continue
+            try:
+                x = numpy.asarray(line.get_xdata(), dtype=float)
+                y = numpy.asarray(line.get_ydata(), dtype=float)
+            except (TypeError, ValueError):
+                continue  # non-numeric data
+            if len(x) > self.decimate_above:
+                self.dense_lines[line] = (x, y)
+        self.resample_dense_lines()
+
+    def resample_dense_lines(self):
+        """Set the data of dense lines to their significant points in the current view."""
+        # forget lines which have been removed
+        self.dense_lines = {
+            line: data
+            for line, data in self.dense_lines.items()
+            if line.axes is not None
+        }
+        if not self.dense_lines:
+            return
+        limits = self.ax.get_xlim()
+        log = self.ax.get_xscale() == "log"
+        buckets = max(int(self.ax.bbox.width), 100)
+        for line, (x, y) in self.dense_lines.items():
+            keep = minmax_indices(x, y, limits, buckets, log) if self.decimate else None
+            if keep is None:
+                line.set_data(x, y)
+            else:
+                line.set_data(x[keep], y[keep])
+
+    def handle_xlim(self, *args):
+        """Resample dense lines when zooming, panning or resizing."""
+        self.resample_dense_lines()
+
+    def set_decimate(self, decimate: bool):
+        """Turn level of detail reduction of dense lines on or off."""
+        self.decimate = decimate
+        self.resample_dense_lines()
+        self.canvas.draw_idle()
+
     @property
     def branch(self):
         return self._branch
@@ -146,16 +255,20 @@ class IsoGraphView(GraphView):
             self.x_upper.set_xdata([self.x_range[1], self.x_range[1]])
 
     def state_pressure(self, iso):
-        """Shortcut function to get isotherm pressure."""
-        return iso.pressure(
+        """Shortcut function to get isotherm pressure, cached in the current units."""
+        return calc_cache.converted(
+            iso,
+            "pressure",
             branch=self._branch,
             pressure_mode=self.pressure_mode,
             pressure_unit=self.pressure_unit,
         )
 
     def state_loading(self, iso):
-        """Shortcut function to get isotherm loading."""
-        return iso.loading(
+        """Shortcut function to get isotherm loading, cached in the current units."""
+        return calc_cache.converted(
+            iso,
+            "loading",
             branch=self._branch,
             loading_basis=self.loading_basis,
             loading_unit=self.loading_unit,
@@ -210,11 +323,34 @@ class IsoGraphView(GraphView):
             self.lgd_keys = dialog.get_checked()
             self.draw_isotherms()
 
+    def graph_settings(self) -> dict:
+        """Return the display settings, such as to store in a session."""
+        return {key: getattr(self, key) for key in self._SETTINGS}
+
+    def set_graph_settings(self, settings: dict):
+        """Restore display settings, which take effect at the next draw."""
+        for key in self._SETTINGS:
+            if key in settings:
+                setattr(self, key, settings[key])
+        self.navbar._actions['log_x'].setChecked(self.logx)
+        self.navbar._actions['log_y'].setChecked(self.logy)
+
 
 class IsoListGraphView(IsoGraphView):
-    """IsoGraphView sublass which adds the ability to connect to a IsoListModel"""
+    """
+    IsoGraphView sublass which adds the ability to connect to a IsoListModel.
+
+    To keep checking/unchecking isotherms fast, the lines of each plotted
+    isotherm are stored in a registry. When the checked isotherms change,
+    only the lines of the isotherms added or removed are drawn or deleted.
+    A full redraw only happens when the plot settings (branch, data, units,
+    legend) change, or through ``redraw``.
+    """
 
     model = None
+    artists: dict = None  # id(isotherm) -> (isotherm, lines, style slot)
+    plot_state: tuple = None  # plot settings for the registry
+    plot_units: dict = None  # units all isotherms are plotted in
 
     def setModel(self, model):
         """Connects the IsoListModel to the View."""
@@ -224,8 +360,124 @@ class IsoListGraphView(IsoGraphView):
     def update(self):
         """Updates the isotherms to those selected by the model."""
         self.set_isotherms(self.model.get_checked())
+        if self.artists is None or self.plot_state != self.current_plot_state():
+            self.draw_isotherms()
+            return
+
+        current = {id(iso): iso for iso in self.isotherms}
+        removed = [key for key in self.artists if key not in current]
+        added = [iso for key, iso in current.items() if key not in self.artists]
+        if not removed and not added:
+            return
+
+        for key in removed:
+            for line in self.artists.pop(key)[1]:
+                line.remove()
+        try:
+            for iso in added:
+                self._pg_plot_isotherm(iso)
+        except (pge.GraphingError, pge.CalculationError):
+            # let a full redraw report the error
+            self.draw_isotherms()
+            return
+
+        self.register_dense_lines()
+        self.redraw_legend()
+        self.ax.relim()
+        self.ax.autoscale()
+        self.canvas.draw_idle()
+
+    def redraw(self):
+        """Fully redraw the isotherms selected by the model, such as after an isotherm is modified."""
+        self.set_isotherms(self.model.get_checked())
         self.draw_isotherms()
 
+    def draw_isotherms(self, clear=True):
+        """Redraw all isotherms, rebuilding the registry of lines."""
+        self.artists = None
+        super().draw_isotherms(clear)
+
+    def current_plot_state(self) -> tuple:
+        """All settings which require a full redraw if they change."""
+        return (
+            self._branch,
+            self.x_data,
+            self.y1_data,
+            self.y2_data,
+            self.pressure_mode,
+            self.pressure_unit,
+            self.loading_basis,
+            self.loading_unit,
+            self.material_basis,
+            self.material_unit,
+            tuple(self.lgd_keys),
+            self.lgd_pos,
+        )
+
+    def _pg_plot_isotherms(self):
+        """Plot all isotherms at once, then register the lines of each."""
+        n_lines = len(self.ax.get_lines())
+        super()._pg_plot_isotherms()
+
+        # secondary axes or figure legends are not tracked
+        if self.y2_data or (self.lgd_pos and self.lgd_pos.startswith("out")):
+            return
+
+        first = self.isotherms[0]
+        self.plot_units = {
+            "pressure_mode": self.pressure_mode or first.pressure_mode,
+            "pressure_unit": self.pressure_unit or first.pressure_unit,
+            "loading_basis": self.loading_basis or first.loading_basis,
+            "loading_unit": self.loading_unit or first.loading_unit,
+            "material_basis": self.material_basis or first.material_basis,
+            "material_unit": self.material_unit or first.material_unit,
+        }
+
+        # pyGAPS plots one line per displayed branch, in isotherm order
+        lines = self.ax.get_lines()[n_lines:]
+        ads, des = _BRANCH_TYPES[self._branch]
+        self.artists = {}
+        for slot, iso in enumerate(self.isotherms):
+            n_iso = (ads and iso.has_branch('ads')) + (des and iso.has_branch('des'))
+            self.artists[id(iso)] = (iso, lines[:n_iso], slot)
+            lines = lines[n_iso:]
+        self.plot_state = self.current_plot_state()
+
+    def _pg_plot_isotherm(self, iso):
+        """Plot a single extra isotherm in the first free style slot."""
+        used = {slot for _, _, slot in self.artists.values()}
+        slot = next(i for i in itertools.count() if i not in used)
+        styles = list(cycler('marker', ISO_MARKERS) * cycler('color', Y1_COLORS))
+        style = styles[slot % len(styles)]
+
+        n_lines = len(self.ax.get_lines())
+        pgg.plot_iso(
+            ConvertedIsotherm(iso),
+            ax=self.ax,
+            branch=self._branch,
+            logx=self.logx,
+            logy1=self.logy,
+            x_data=self.x_data,
+            y1_data=self.y1_data,
+            color=[style['color']],
+            marker=[style['marker']],
+            lgd_keys=self.lgd_keys,
+            lgd_pos=None,
+            **self.plot_units,
+        )
+        self.artists[id(iso)] = (iso, self.ax.get_lines()[n_lines:], slot)
+
+    def redraw_legend(self):
+        """Recreate the legend from the lines currently plotted."""
+        legend = self.ax.get_legend()
+        if legend:
+            legend.remove()
+        if self.lgd_pos is None:
+            return
+        lines, labels = self.ax.get_legend_handles_labels()
+        if lines:
+            self.ax.legend(lines, labels, loc=self.lgd_pos)
+
 
 class IsoModelGraphView(IsoGraphView):
     """Subclass that plots an extra model isotherm."""
@@ -244,12 +496,16 @@ class IsoModelGraphView(IsoGraphView):
             if self.model_isotherm:
                 points_dict = {}
                 if self.model_isotherm.model.calculates == "loading":
-                    points_dict['x_points'] = self.isotherms[0].pressure(
+                    points_dict['x_points'] = calc_cache.converted(
+                        self.isotherms[0],
+                        "pressure",
                         branch=self._branch,
                         limits=self.model_isotherm.model.pressure_range,
                     )
                 else:
-                    points_dict['y1_points'] = self.isotherms[0].loading(
+                    points_dict['y1_points'] = calc_cache.converted(
+                        self.isotherms[0],
+                        "loading",
                         branch=self._branch,
                         limits=self.model_isotherm.model.loading_range,
                     )
@@ -264,4 +520,5 @@ class IsoModelGraphView(IsoGraphView):
                     **points_dict,
                 )
             self.ax.autoscale()
+            self.register_dense_lines()
         self.canvas.draw_idle()
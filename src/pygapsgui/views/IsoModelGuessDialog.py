@@ -49,10 +49,21 @@ class IsoModelGuessDialog(QW.QDialog):
         self.branch_dropdown = QW.QComboBox()
         model_layout.addRow(self.branch_label, self.branch_dropdown)
 
+        # Fitting time limit
+        self.timeout_label = LabelAlignRight("Timeout per model [s]:")
+        self.timeout_input = QW.QSpinBox()
+        self.timeout_input.setRange(1, 3600)
+        model_layout.addRow(self.timeout_label, self.timeout_input)
+
+        calc_layout = QW.QHBoxLayout()
+        self.options_layout.addLayout(calc_layout)
         self.calc_auto_button = QW.QPushButton()
         self.calc_auto_button.setDefault(True)
         self.calc_auto_button.setAutoDefault(True)
-        self.options_layout.addWidget(self.calc_auto_button)
+        calc_layout.addWidget(self.calc_auto_button)
+        self.calc_cancel_button = QW.QPushButton()
+        self.calc_cancel_button.setEnabled(False)
+        calc_layout.addWidget(self.calc_cancel_button)
 
         # Output log
         self.output_label = QW.QLabel("Output log:")
@@ -86,4 +97,5 @@ class IsoModelGuessDialog(QW.QDialog):
         # pylint: disable=line-too-long
         self.setWindowTitle(QW.QApplication.translate("IsoModelGuessDialog", "Isotherm model fitting", None, -1))
         self.calc_auto_button.setText(QW.QApplication.translate("IsoModelGuessDialog", "Fit selected models", None, -1))
+        self.calc_cancel_button.setText(QW.QApplication.translate("IsoModelGuessDialog", "Cancel fitting", None, -1))
         # yapf: enable
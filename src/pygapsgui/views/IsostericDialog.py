@@ -67,7 +67,7 @@ class IsostericDialog(QW.QDialog):
         # Bottom buttons
         self.button_box = QW.QDialogButtonBox()
         self.button_box.setOrientation(QC.Qt.Horizontal)
-        self.button_box.addButton("Export results", QW.QDialogButtonBox.AcceptRole)
+        self.accept_btn = self.button_box.addButton("Export results", QW.QDialogButtonBox.AcceptRole)
         self.button_box.addButton("Help", QW.QDialogButtonBox.HelpRole)
         self.button_box.addButton("Cancel", QW.QDialogButtonBox.RejectRole)
         _layout.addWidget(self.button_box, 2, 0, 1, 2)
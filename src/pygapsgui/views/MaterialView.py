@@ -3,7 +3,7 @@ from qtpy import QtWidgets as QW
 
 from pygaps import MATERIAL_LIST
 from pygaps import Material
-from pygapsgui.utilities.string_match import fuzzy_match_list_choice
+from pygapsgui.utilities.string_match import SearchIndex
 from pygapsgui.widgets.MetadataEditWidget import MetadataEditWidget
 
 
@@ -163,6 +163,7 @@ class MaterialDialog(QW.QDialog):
 class MaterialListDialog(QW.QDialog):
     """Dialog with a list of Materials and a MaterialView."""
     materials = None
+    search_index = None
     material_changed = QC.Signal(str)
 
     def __init__(self, *args, **kwargs):
@@ -208,6 +209,9 @@ class MaterialListDialog(QW.QDialog):
     def setup_view(self):
         """Set up the display of various properties/metadata."""
         self.materials = [mat.name for mat in MATERIAL_LIST]
+        self.search_index = SearchIndex()
+        for name in self.materials:
+            self.search_index.add(name, [name])
         self.material_list.addItems(self.materials)
         self.material_list.currentItemChanged.connect(self.select_material)
 
@@ -222,7 +226,7 @@ class MaterialListDialog(QW.QDialog):
         if text == "":
             self.material_list.addItems(self.materials)
         else:
-            self.material_list.addItems(fuzzy_match_list_choice(text, self.materials))
+            self.material_list.addItems(self.search_index.search(text))
 
     def accept(self) -> None:
         """Select a material."""
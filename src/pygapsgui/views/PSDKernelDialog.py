@@ -77,7 +77,7 @@ class PSDKernelDialog(QW.QDialog):
         # Bottom buttons
         self.button_box = QW.QDialogButtonBox()
         self.button_box.setOrientation(QC.Qt.Horizontal)
-        self.button_box.addButton("Save as metadata", QW.QDialogButtonBox.AcceptRole)
+        self.accept_btn = self.button_box.addButton("Save as metadata", QW.QDialogButtonBox.AcceptRole)
         self.export_btn = self.button_box.addButton(
             "Export results", QW.QDialogButtonBox.ActionRole
         )
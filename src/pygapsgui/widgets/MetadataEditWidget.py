@@ -1,7 +1,9 @@
 from qtpy import QtCore as QC
+from qtpy import QtGui as QG
 from qtpy import QtWidgets as QW
 
 from pygapsgui.models.MetadataTableModel import MetadataTableModel
+from pygapsgui.models.TableCommands import make_undo_stack
 from pygapsgui.views.MetadataTableView import MetadataTableView
 from pygapsgui.widgets.SciDoubleSpinbox import SciFloatDelegate
 from pygapsgui.widgets.UtilityDialogs import error_dialog
@@ -54,9 +56,28 @@ class MetadataEditWidget(QW.QWidget):
         self.save_button.setObjectName("save_button")
         self.delete_button = QW.QPushButton()
         self.delete_button.setObjectName("delete_button")
-
-        _layout.addWidget(self.save_button, 2, 0, 1, 2)
-        _layout.addWidget(self.delete_button, 2, 2, 1, 2)
+        self.undo_button = QW.QPushButton()
+        self.undo_button.setObjectName("undo_button")
+        self.redo_button = QW.QPushButton()
+        self.redo_button.setObjectName("redo_button")
+
+        _layout.addWidget(self.save_button, 2, 0, 1, 1)
+        _layout.addWidget(self.delete_button, 2, 1, 1, 1)
+        _layout.addWidget(self.undo_button, 2, 2, 1, 1)
+        _layout.addWidget(self.redo_button, 2, 3, 1, 1)
+
+        # undo history of the current model
+        self.undo_stack = make_undo_stack(self)
+        self.undo_button.setEnabled(False)
+        self.redo_button.setEnabled(False)
+        self.undo_action = QW.QAction(self)
+        self.undo_action.setShortcut(QG.QKeySequence.Undo)
+        self.undo_action.setShortcutContext(QC.Qt.WidgetWithChildrenShortcut)
+        self.redo_action = QW.QAction(self)
+        self.redo_action.setShortcut(QG.QKeySequence.Redo)
+        self.redo_action.setShortcutContext(QC.Qt.WidgetWithChildrenShortcut)
+        self.addAction(self.undo_action)
+        self.addAction(self.redo_action)
 
         # table
         self.metadata_table_view = MetadataTableView()
@@ -68,10 +89,18 @@ class MetadataEditWidget(QW.QWidget):
         """Connect permanent signals."""
         self.save_button.clicked.connect(self.metadata_save)
         self.delete_button.clicked.connect(self.metadata_delete)
+        self.undo_button.clicked.connect(self.undo)
+        self.redo_button.clicked.connect(self.redo)
+        self.undo_action.triggered.connect(self.undo)
+        self.redo_action.triggered.connect(self.redo)
+        self.undo_stack.canUndoChanged.connect(self.undo_button.setEnabled)
+        self.undo_stack.canRedoChanged.connect(self.redo_button.setEnabled)
 
     def set_model(self, coreclass):
         """Connect a suitable model."""
+        self.undo_stack.clear()
         self.metadata_table_model = MetadataTableModel(coreclass)
+        self.metadata_table_model.undo_stack = self.undo_stack
         self.metadata_table_view.setModel(self.metadata_table_model)
         self.metadata_table_view.selectionModel().selectionChanged.connect(self.metadata_select)
 
@@ -126,6 +155,7 @@ class MetadataEditWidget(QW.QWidget):
         if not results:
             return
 
+        self.undo_stack.beginMacro("Save results")
         for meta_name, meta_value in results.items():
             if isinstance(meta_value, (int, float)):
                 self.metadata_table_model.setOrInsertRow(data=[meta_name, meta_value, "number"])
@@ -133,6 +163,7 @@ class MetadataEditWidget(QW.QWidget):
                 self.metadata_table_model.setOrInsertRow(data=[meta_name, meta_value, "list"])
             else:
                 self.metadata_table_model.setOrInsertRow(data=[meta_name, meta_value, "text"])
+        self.undo_stack.endMacro()
 
         self.metadata_table_view.resizeColumns()
         self.changed.emit()
@@ -145,6 +176,20 @@ class MetadataEditWidget(QW.QWidget):
         self.metadata_table_model.removeRow(index.row())
         self.changed.emit()
 
+    def undo(self):
+        """Undo the last metadata change."""
+        if self.undo_stack.canUndo():
+            self.undo_stack.undo()
+            self.metadata_table_view.resizeColumns()
+            self.changed.emit()
+
+    def redo(self):
+        """Redo the last undone metadata change."""
+        if self.undo_stack.canRedo():
+            self.undo_stack.redo()
+            self.metadata_table_view.resizeColumns()
+            self.changed.emit()
+
     def translate_UI(self):
         """Set static UI text through QT translation."""
         # yapf: disable
@@ -153,4 +198,6 @@ class MetadataEditWidget(QW.QWidget):
         self.value_label.setText(QW.QApplication.translate("MetaEditWidget", "Value", None, -1))
         self.save_button.setText(QW.QApplication.translate("MetaEditWidget", "save", None, -1))
         self.delete_button.setText(QW.QApplication.translate("MetaEditWidget", "delete", None, -1))
+        self.undo_button.setText(QW.QApplication.translate("MetaEditWidget", "undo", None, -1))
+        self.redo_button.setText(QW.QApplication.translate("MetaEditWidget", "redo", None, -1))
         # yapf: enable
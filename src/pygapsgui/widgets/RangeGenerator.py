@@ -138,7 +138,7 @@ class RangeGenWidget(QW.QWidget):
         self.range_model.setColumnData(index.column(), rng, role=QC.Qt.EditRole)
 
     def save(self):
-        self.data = self.range_model._data
+        self.data = self.range_model.dataframe()
 
     def translate_UI(self):
         """Set static UI text through QT translation."""
@@ -0,0 +1,13 @@
+"""Shared fixtures, run without a display."""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """A single application for all tests, as widgets need a QApplication."""
+    QW = pytest.importorskip("qtpy.QtWidgets")
+    return QW.QApplication.instance() or QW.QApplication([])
@@ -0,0 +1,168 @@
+"""Isotherm controller, driven through the main window."""
+import pathlib
+
+import pandas as pd
+import pytest
+
+QC = pytest.importorskip("qtpy.QtCore")
+pytest.importorskip("qtpy.QtWidgets")
+pytest.importorskip("pygaps")
+
+from pygapsgui.utilities.parsing import parse_isotherm
+
+JSON_PATH = pathlib.Path(__file__).parent.parent / "json"
+JSON_PATHS = sorted(JSON_PATH.glob("*.json"))[:3]
+# point and model isotherms, with different units
+SESSION_PATHS = [
+    JSON_PATH / f"{name}.json"
+    for name in ["MCM-41 N2 77", "Takeda 5A CO_{2} Langmuir", "MOF-5(Zn) CH4 303"]
+]
+
+
+@pytest.fixture
+def make_window(app):
+    from pygapsgui.__init_pygaps__ import init_pygaps
+    from pygapsgui.MainWindow import MainWindow
+    init_pygaps()
+    windows = []
+
+    def make():
+        window = MainWindow(None)
+        window.setup_panels()
+        windows.append(window)
+        return window
+
+    yield make
+    for window in windows:
+        window.deleteLater()
+
+
+@pytest.fixture
+def window(make_window):
+    return make_window()
+
+
+def add_isotherms(window, paths=JSON_PATHS):
+    for path in paths:
+        window.iso_controller.add_isotherm(path.stem, parse_isotherm(path))
+
+
+def test_filter_out_selected(window):
+    add_isotherms(window)
+    controller = window.iso_controller
+    model = window.iso_model
+    controller.select_last_iso()
+    selected = model.item_selected
+    assert selected is model.item(model.rowCount() - 1)
+    assert model.get_checked_items() == [selected]
+
+    # hiding the selected isotherm deselects it, and restores its check state
+    window.ui.iso_filter.setText("qqzzxx")
+    assert model.item_selected is None
+    assert controller.iso_current is None
+    assert selected.checkState() == QC.Qt.Unchecked
+    assert model.get_checked_items() == []
+
+    # and the isotherm can be selected again
+    window.ui.iso_filter.setText("")
+    controller.select_last_iso()
+    assert model.item_selected is selected
+    assert model.get_checked_items() == [selected]
+
+
+def test_remove_last(window):
+    add_isotherms(window, JSON_PATHS[:1])
+    controller = window.iso_controller
+    controller.select_last_iso()
+    controller.delete_current_iso()
+    assert window.iso_model.rowCount() == 0
+    assert window.iso_model.item_selected is None
+    assert controller.iso_current is None
+
+
+@pytest.mark.parametrize("result, pinned", [("Rejected", False), ("Accepted", True)])
+def test_view_points_pins_only_if_edited(window, monkeypatch, result, pinned):
+    from qtpy import QtWidgets as QW
+
+    from pygapsgui.utilities.iso_cache import isotherm_header
+    from pygapsgui.views.IsoEditPointDialog import IsoEditPointDialog
+
+    monkeypatch.setattr(IsoEditPointDialog, "exec", lambda self: getattr(QW.QDialog, result))
+    path = JSON_PATHS[0].parent / "MCM-41 N2 77.json"
+    controller = window.iso_controller
+    controller.add_lazy_isotherm(path, isotherm_header(parse_isotherm(path)), parse_isotherm)
+    controller.select_last_iso()
+    item = window.iso_model.item_selected
+    assert not item.pinned
+
+    controller.iso_display_data()
+    assert item.pinned == pinned
+
+
+def items_by_name(window):
+    model = window.iso_model
+    return {model.item(row).text(): model.item(row) for row in range(model.rowCount())}
+
+
+def assert_same_isotherm(isotherm, expected):
+    assert type(isotherm) is type(expected)
+    # parameters, units and metadata
+    assert isotherm.to_dict() == expected.to_dict()
+    if hasattr(expected, "model"):
+        assert isotherm.model.name == expected.model.name
+        assert isotherm.model.params == expected.model.params
+    else:
+        pd.testing.assert_frame_equal(isotherm.data_raw, expected.data_raw)
+
+
+def test_session_round_trip(make_window, tmp_path):
+    window = make_window()
+    add_isotherms(window, SESSION_PATHS)
+    items = items_by_name(window)
+    window.iso_model.check_all([items[SESSION_PATHS[1].stem]])
+    window.iso_controller.select_last_iso()
+    selected = window.iso_model.item_selected.text()
+    checked = {item.text() for item in window.iso_model.get_checked_items()}
+    session = tmp_path / "test.pgsession"
+    window.iso_controller.save_session(session)
+
+    loaded = make_window()
+    loaded.iso_controller.load_session(session)
+    items = items_by_name(loaded)
+    assert set(items) == {path.stem for path in SESSION_PATHS}
+    assert loaded.iso_model.item_selected.text() == selected
+    assert {item.text() for item in loaded.iso_model.get_checked_items()} == checked
+    # only isotherms on display are read from the session
+    assert all(not item.loaded for name, item in items.items() if name not in checked)
+    for path in SESSION_PATHS:
+        assert_same_isotherm(items[path.stem].data(), parse_isotherm(path))
+
+
+def test_session_save_over(make_window, tmp_path):
+    window = make_window()
+    add_isotherms(window, SESSION_PATHS[:2])
+    session = tmp_path / "test.pgsession"
+    window.iso_controller.save_session(session)
+
+    loaded = make_window()
+    loaded.iso_controller.load_session(session)
+    items = items_by_name(loaded)
+    # one isotherm is in memory, the other is only read after saving
+    items[SESSION_PATHS[0].stem].data()
+
+    # a larger index moves the chunks in the new file
+    add_isotherms(loaded, SESSION_PATHS[2:])
+    loaded.iso_controller.save_session(session)
+
+    for item in items.values():
+        item.release()
+        assert not item.pinned and not item.loaded
+    for path in SESSION_PATHS[:2]:
+        assert_same_isotherm(items[path.stem].data(), parse_isotherm(path))
+
+    reloaded = make_window()
+    reloaded.iso_controller.load_session(session)
+    items = items_by_name(reloaded)
+    assert set(items) == {path.stem for path in SESSION_PATHS}
+    for path in SESSION_PATHS:
+        assert_same_isotherm(items[path.stem].data(), parse_isotherm(path))
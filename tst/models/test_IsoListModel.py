@@ -0,0 +1,121 @@
+"""Isotherm list model, with real isotherm items under the installed Qt binding."""
+import pathlib
+
+import pytest
+
+QC = pytest.importorskip("qtpy.QtCore")
+QG = pytest.importorskip("qtpy.QtGui")
+pytest.importorskip("pygaps")
+
+from pygapsgui.models.IsoListModel import IsoListModel
+from pygapsgui.models.IsoListProxyModel import IsoListProxyModel
+from pygapsgui.models.IsoModel import LazyIsoModel
+from pygapsgui.utilities.iso_cache import isotherm_header
+from pygapsgui.utilities.parsing import parse_isotherm
+
+JSON_PATHS = sorted((pathlib.Path(__file__).parent.parent / "json").glob("*.json"))[:5]
+
+
+def lazy_item(path, loader=parse_isotherm):
+    return LazyIsoModel(path.stem, path, isotherm_header(parse_isotherm(path)), loader)
+
+
+def lazy_model(paths=JSON_PATHS):
+    model = IsoListModel()
+    for path in paths:
+        model.appendRow(lazy_item(path))
+    return model
+
+
+def test_lazy_items_load(app):
+    model = lazy_model()
+    assert model.rowCount() == len(JSON_PATHS)
+    for row in range(model.rowCount()):
+        item = model.item(row)
+        assert not item.loaded
+        assert item.data().material == item.header["material"]
+        assert item.loaded
+
+
+def test_lazy_items_released(app):
+    model = lazy_model()
+    model.lazy_limit = 2
+    items = [model.item(row) for row in range(model.rowCount())]
+    for item in items:
+        item.data()
+    assert [item.loaded for item in items] == [False] * (len(items) - 2) + [True] * 2
+
+    # removed items are forgotten
+    model.removeRow(model.rowCount() - 1)
+    items[0].data()
+    assert items[0].loaded
+
+
+def test_lazy_item_broken(app):
+    def fail(path):
+        raise OSError("gone")
+
+    model = IsoListModel()
+    item = lazy_item(JSON_PATHS[0], loader=fail)
+    model.appendRow(item)
+    assert item.data() is None
+    assert item.broken
+
+
+def test_search(app):
+    model = lazy_model()
+    item = model.item(0)
+    assert any(found is item for found in model.search(item.header["material"]))
+    assert model.is_indexed(item)
+
+    model.mark_changed(item)
+    assert not model.is_indexed(item)
+    assert model.matches(item, item.text())
+
+    model.removeRow(0)
+    assert not any(found is item for found in model.search(item.header["material"]))
+
+
+def test_check_all(app):
+    model = lazy_model()
+    items = [model.item(row) for row in range(model.rowCount())]
+    assert model.get_checked_items() == []
+
+    model.check_all(items[1:3])
+    assert [item.row() for item in model.get_checked_items()] == [1, 2]
+    assert len(model.get_checked()) == 2
+
+    model.check_all()
+    assert len(model.get_checked_items()) == len(items)
+
+    # the selected item stays checked
+    model.handle_item_select(items[0].index(), QC.QModelIndex())
+    model.uncheck_all()
+    assert [item.row() for item in model.get_checked_items()] == [0]
+
+    # user check changes are recorded
+    items[3].setCheckState(QC.Qt.Checked)
+    assert [item.row() for item in model.get_checked_items()] == [0, 3]
+
+    model.removeRow(3)
+    assert [item.row() for item in model.get_checked_items()] == [0]
+
+
+def test_proxy_sort_filter(app):
+    model = lazy_model()
+    proxy = IsoListProxyModel(model)
+    names = sorted(model.item(row).text().casefold() for row in range(model.rowCount()))
+
+    proxy.set_sort_key("name")
+    assert [item.text().casefold() for item in proxy.visible_items()] == names
+    proxy.set_sort_key("name", QC.Qt.DescendingOrder)
+    assert [item.text().casefold() for item in proxy.visible_items()] == names[::-1]
+
+    proxy.set_sort_key(None)
+    assert [item.row() for item in proxy.visible_items()] == list(range(model.rowCount()))
+
+    item = model.item(0)
+    proxy.set_filter_text(item.text())
+    assert any(visible is item for visible in proxy.visible_items())
+    proxy.set_filter_text("qqzzxx")
+    assert proxy.visible_items() == []
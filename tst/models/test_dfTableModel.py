@@ -0,0 +1,216 @@
+"""Table model backed by growable column arrays."""
+import numpy as np
+import pandas as pd
+import pytest
+
+QC = pytest.importorskip("qtpy.QtCore")
+
+from pygapsgui.models.dfTableModel import ColumnStore
+from pygapsgui.models.dfTableModel import dfTableModel
+from pygapsgui.models.TableCommands import make_undo_stack
+
+
+def make_frame(nrows=5):
+    return pd.DataFrame({
+        "pressure": np.arange(nrows, dtype=float),
+        "loading": np.arange(nrows, dtype=float) * 10,
+        "branch": np.zeros(nrows, dtype=int),
+    })
+
+
+class RowCounter():
+    """Follow the number of rows the way a view does, from the model signals."""
+    def __init__(self, model):
+        self.model = model
+        self.rows = model.rowCount()
+        model.rowsInserted.connect(self.inserted)
+        model.rowsRemoved.connect(self.removed)
+        model.layoutChanged.connect(self.reset)
+        model.modelReset.connect(self.reset)
+
+    def inserted(self, parent, first, last):
+        self.rows += last - first + 1
+
+    def removed(self, parent, first, last):
+        self.rows -= last - first + 1
+
+    def reset(self, *args):
+        self.rows = self.model.rowCount()
+
+    def check(self):
+        assert self.rows == self.model.rowCount()
+        assert self.model.rowCount() <= self.model._store.size
+
+
+@pytest.fixture
+def fetch_size(monkeypatch):
+    monkeypatch.setattr(dfTableModel, "fetch_size", 4)
+    return 4
+
+
+def test_store_round_trip():
+    frame = make_frame(40)
+    store = ColumnStore(frame)
+    pd.testing.assert_frame_equal(store.frame(), frame)
+    assert store.frame().dtypes.tolist() == frame.dtypes.tolist()
+
+
+def test_store_growth():
+    store = ColumnStore(make_frame(3))
+    for _ in range(100):
+        store.insert_rows(store.size, 1, [np.array([1.0]), np.array([2.0]), np.array([1])])
+    assert store.size == 103
+    assert store.capacity >= 103 and store.capacity & (store.capacity - 1) == 0
+    store.insert_rows(1, 2, None)
+    assert store.column(0)[:4].tolist() == [0, 0, 0, 1]
+    store.remove_rows(0, 3)
+    assert store.size == 102 and store.column(0)[:3].tolist() == [1, 2, 1]
+    store.resize(2)
+    store.resize(4)
+    assert store.column(1).tolist() == [10, 20, 0, 0]
+
+
+def test_insert_remove_rows(app):
+    model = dfTableModel(make_frame())
+    model.insertRows(-1, 2)
+    model.insertRows(0, 1)
+    frame = model.dataframe()
+    assert frame["pressure"].tolist() == [0, 0, 1, 2, 3, 4, 4, 4]
+    model.removeRows(1, 3)
+    assert model.dataframe()["pressure"].tolist() == [0, 3, 4, 4, 4]
+    assert model.rowCount() == 5
+
+
+def test_insert_remove_columns(app):
+    model = dfTableModel(make_frame())
+    model.insertColumns(1, 2)
+    frame = model.dataframe()
+    assert frame.columns.tolist() == ["pressure", "newcol", "newcol", "loading", "branch"]
+    assert frame.iloc[:, 1].isna().all()
+    model.removeColumns(1, 2)
+    pd.testing.assert_frame_equal(model.dataframe(), make_frame())
+
+
+def test_set_data(app):
+    model = dfTableModel(make_frame())
+    assert model.setData(model.index(1, 1), "7.5")
+    assert model.data(model.index(1, 1)) == 7.5
+    assert model.setHeaderData(2, QC.Qt.Horizontal, "phase")
+    assert model.dataframe().columns[2] == "phase"
+
+
+def test_paste(app):
+    model = dfTableModel(make_frame())
+    block = pd.DataFrame([["1.5", "2.5"], ["3.5", "4.5"]])
+    assert model.setDataRange(model.index(3, 0), block)
+    frame = model.dataframe()
+    assert len(frame) == 5
+    assert frame["pressure"].tolist()[3:] == [1.5, 3.5]
+    assert frame["loading"].tolist()[3:] == [2.5, 4.5]
+
+
+def test_paste_append(app):
+    model = dfTableModel(make_frame())
+    block = pd.DataFrame({"a": [1.0, 2.0, 3.0], "b": [5.0, 6.0, 7.0]})
+    assert model.setDataRange(model.index(4, 1), block, append=True)
+    frame = model.dataframe()
+    assert len(frame) == 7 and model.rowCount() == 7
+    assert frame["loading"].tolist()[4:] == [1, 2, 3]
+    assert frame["branch"].tolist()[4:] == [5, 6, 7]
+    # columns outside the block copy the last row
+    assert frame["pressure"].tolist()[4:] == [4, 4, 4]
+
+
+def test_paste_bad_value(app):
+    model = dfTableModel(make_frame())
+    with pytest.raises(ValueError):
+        model.setDataRange(model.index(0, 0), [["x"]])
+    pd.testing.assert_frame_equal(model.dataframe(), make_frame())
+
+
+def test_fetch_more(app, fetch_size):
+    model = dfTableModel(make_frame(10))
+    counter = RowCounter(model)
+    assert model.rowCount() == fetch_size
+    assert model.canFetchMore()
+    model.fetchMore()
+    counter.check()
+    assert model.rowCount() == 2 * fetch_size
+    model.fetchMore()
+    counter.check()
+    assert model.rowCount() == 10 and not model.canFetchMore()
+
+
+def test_fetch_more_after_edits(app, fetch_size):
+    model = dfTableModel(make_frame(10))
+    counter = RowCounter(model)
+
+    # rows inserted past those fetched are only shown once fetched
+    model.insertRows(-1, 3)
+    counter.check()
+    assert model.rowCount() == fetch_size
+    model.insertRows(fetch_size, 2)
+    counter.check()
+    model.removeRows(8, 4)
+    counter.check()
+    model.setDataRange(model.index(2, 0), [[1.0]] * 20, append=True)
+    counter.check()
+    while model.canFetchMore():
+        model.fetchMore()
+        counter.check()
+    assert model.rowCount() == len(model.dataframe())
+
+    model.setRowCount(3)
+    counter.check()
+    assert model.rowCount() == 3
+
+
+EDITS = {
+    "insert rows": lambda model: model.insertRows(2, 3),
+    "append rows": lambda model: model.insertRows(-1, 2),
+    "remove rows": lambda model: model.removeRows(1, 2),
+    "insert columns": lambda model: model.insertColumns(0, 2),
+    "remove columns": lambda model: model.removeColumns(1, 2),
+    "rename": lambda model: model.setHeaderData(0, QC.Qt.Horizontal, "p"),
+    "set cell": lambda model: model.setData(model.index(3, 1), 1.5),
+    "paste": lambda model: model.setDataRange(model.index(1, 0), [[7, 8], [9, 10]]),
+    "paste append": lambda model: model.setDataRange(
+        model.index(3, 0), [[7, 8], [9, 10], [11, 12]], append=True
+    ),
+}
+
+
+@pytest.mark.parametrize("edit", EDITS)
+def test_undo_redo(app, edit):
+    model = dfTableModel(make_frame())
+    model.undo_stack = make_undo_stack()
+    counter = RowCounter(model)
+
+    assert EDITS[edit](model)
+    edited = model.dataframe()
+    assert not edited.equals(make_frame())
+    # every edit, including a paste adding rows, is a single command
+    assert model.undo_stack.count() == 1
+
+    model.undo_stack.undo()
+    counter.check()
+    pd.testing.assert_frame_equal(model.dataframe(), make_frame())
+    model.undo_stack.redo()
+    counter.check()
+    pd.testing.assert_frame_equal(model.dataframe(), edited)
+
+
+def test_undo_sequence(app):
+    model = dfTableModel(make_frame())
+    model.undo_stack = make_undo_stack()
+    states = [model.dataframe()]
+    for edit in EDITS.values():
+        edit(model)
+        states.append(model.dataframe())
+
+    for state in reversed(states[:-1]):
+        model.undo_stack.undo()
+        pd.testing.assert_frame_equal(model.dataframe(), state)
+    for state in states[1:]:
+        model.undo_stack.redo()
+        pd.testing.assert_frame_equal(model.dataframe(), state)
@@ -0,0 +1,77 @@
+"""Vectorised IAST, against the pyGAPS point by point solver."""
+import pathlib
+
+import numpy
+import pytest
+
+pytest.importorskip("pygaps")
+
+import pygaps.iast as pgi
+from pygaps.utilities.exceptions import CalculationError
+
+from pygapsgui.utilities import iast_solver
+from pygapsgui.utilities.parsing import parse_isotherm
+
+JSON_PATH = pathlib.Path(__file__).parent.parent / "json"
+NAMES = ["MOF-5(Zn) CH4 303", "MOF-5(Zn) C2H6 303"]
+
+# Model isotherms are tabulated on a grid, so only agree approximately
+TOLERANCES = {"point": 1e-8, "model": 1e-4}
+
+
+@pytest.fixture(params=["point", "model"])
+def isotherms(request):
+    suffix = " model" if request.param == "model" else ""
+    isotherms = [parse_isotherm(JSON_PATH / f"{name}{suffix}.json") for name in NAMES]
+    return request.param, isotherms
+
+
+def test_iast_points(isotherms):
+    kind, isotherms = isotherms
+    partial_pressures = [[1, 1], [0.5, 4], [9, 0.2]]
+    loadings = iast_solver.iast_points(isotherms, partial_pressures, warningoff=True)
+    for mixture, loading in zip(partial_pressures, loadings):
+        expected = pgi.iast_point(isotherms, mixture, warningoff=True)
+        numpy.testing.assert_allclose(loading, expected, rtol=TOLERANCES[kind])
+
+
+def test_iast_binary_vle(isotherms):
+    kind, isotherms = isotherms
+    result = iast_solver.iast_binary_vle(isotherms, 5, npoints=10, warningoff=True)
+    expected = pgi.iast_binary_vle(isotherms, 5, npoints=10, warningoff=True)
+    numpy.testing.assert_allclose(result["y"], expected["y"])
+    numpy.testing.assert_allclose(result["x"], expected["x"], rtol=TOLERANCES[kind])
+
+
+def test_iast_binary_svp(isotherms):
+    kind, isotherms = isotherms
+    pressures = numpy.linspace(1, 10, 5)
+    result = iast_solver.iast_binary_svp(isotherms, [0.3, 0.7], pressures, warningoff=True)
+    expected = pgi.iast_binary_svp(isotherms, [0.3, 0.7], pressures, warningoff=True)
+    numpy.testing.assert_allclose(result["pressure"], expected["pressure"])
+    numpy.testing.assert_allclose(
+        result["selectivity"], expected["selectivity"], rtol=TOLERANCES[kind]
+    )
+
+
+def test_iast_points_absent_components(isotherms):
+    kind, isotherms = isotherms
+    loadings = iast_solver.iast_points(isotherms, [[0, 0], [2, 0], [0, 2]], warningoff=True)
+    numpy.testing.assert_array_equal(loadings[0], [0, 0])
+    # a single component adsorbs as its pure isotherm
+    assert loadings[1, 1] == 0 and loadings[2, 0] == 0
+    numpy.testing.assert_allclose(
+        [loadings[1, 0], loadings[2, 1]],
+        [float(isotherms[0].loading_at(2)), float(isotherms[1].loading_at(2))],
+        rtol=TOLERANCES[kind] * 10,
+    )
+
+
+def test_iast_points_extrapolation(isotherms):
+    kind, isotherms = isotherms
+    if kind == "point":
+        with pytest.raises(CalculationError):
+            iast_solver.iast_points(isotherms, [[1, 1], [100, 100]])
+    else:
+        loadings = iast_solver.iast_points(isotherms, [[100, 100]], warningoff=True)
+        assert numpy.all(numpy.isfinite(loadings)) and numpy.all(loadings > 0)
@@ -0,0 +1,62 @@
+"""Search index of isotherm, material and adsorbate strings."""
+import pytest
+
+pytest.importorskip("rapidfuzz")
+
+from pygapsgui.utilities.string_match import SearchIndex
+
+ENTRIES = {
+    "mcm": ["MCM-41", "nitrogen", "MADIREL"],
+    "takeda": ["Takeda 5A", "carbon dioxide"],
+    "uio": ["UiO-66(Zr)", "nitrogen"],
+    "bax": ["BAX 1500", "n-butane"],
+}
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    for key, strings in ENTRIES.items():
+        index.add(key, strings)
+    return index
+
+
+def test_prefix_and_substring(index):
+    assert index.search("takeda") == ["takeda"]
+    assert set(index.search("nitro")) == {"mcm", "uio"}
+    assert index.search("66(z") == ["uio"]
+    assert index.search("") == []
+
+
+def test_short_query(index):
+    assert set(index.search("n")) == set(ENTRIES)
+    assert index.search("5a") == ["takeda"]
+
+
+@pytest.mark.parametrize("query, key", [
+    ("da 5", "takeda"),
+    ("a 5a", "takeda"),
+    ("on dio", "takeda"),
+    ("x 15", "bax"),
+    ("  X  1500 ", "bax"),
+])
+def test_query_with_space(index, query, key):
+    # queries with spaces only have trigrams spanning the space, and must be
+    # found as substrings, not only as fuzzy matches
+    index.min_score = 100
+    assert index.search(query) == [key]
+
+
+def test_fuzzy(index):
+    assert index.search("carbon dioxyde") == ["takeda"]
+    assert index.search("qqzzxx") == []
+
+
+def test_update_remove(index):
+    index.add("takeda", ["Takeda 4A"])
+    assert index.search("5a") == []
+    assert index.search("da 4") == ["takeda"]
+    index.remove("takeda")
+    assert "takeda" not in index
+    assert index.search("takeda") == []
+    assert len(index) == 3